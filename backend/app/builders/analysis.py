@@ -15,14 +15,204 @@ single-shot tools cannot provide:
 These metrics create a new category of data: "Generative Risk Analytics".
 """
 
+import hashlib
+import json
 import re
-from dataclasses import dataclass
-from typing import Any
-
-from rapidfuzz import fuzz
-
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from statistics import NormalDist
+from typing import Any, NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+from rapidfuzz import fuzz, process
+
+from backend.app.builders.citations import (
+    CitationAnalytics,
+    analyze_citations,
+    citations_to_dict,
+)
+from backend.app.builders.dedup import ResponseClusters, cluster_responses
+from backend.app.builders.domains import compile_whitelist, extract_host, registrable_domain
+from backend.app.builders.normalization import NormalizedResponse, normalize_responses
+from backend.app.builders.semantic import cosine_matrix, paired_cosine, tfidf_vectors
+from backend.app.builders.statistics import (
+    BOOTSTRAP_SEED,
+    bootstrap_brand_metrics,
+    bootstrap_mean,
+    bootstrap_pairwise_mean,
+    clopper_pearson_interval,
+    percentile_interval,
+    wilson_interval,
+)
+from backend.app.core.config import ConsistencyMetric, Settings, get_settings
 from backend.app.schemas.llm import LLMProvider, PerplexityResponse
-from backend.app.schemas.runner import BatchResult, IterationStatus
+from backend.app.schemas.runner import BatchResult
+
+# Version of the analysis algorithms; bump whenever a change alters the
+# metrics computed from the same inputs, so cached results are not reused
+ANALYSIS_VERSION = 3
+
+# Settings that change analysis results (part of the cache fingerprint)
+ANALYSIS_SETTINGS = (
+    "consistency_metric",
+    "consistency_exact_max_responses",
+    "consistency_exact_max_chars",
+    "consistency_sample_pairs",
+    "confidence_level",
+    "bootstrap_resamples",
+    "brand_fuzzy_matching",
+    "brand_fuzzy_threshold",
+    "competitor_discovery_top_n",
+    "competitor_discovery_min_responses",
+    "citation_top_hosts",
+    "response_clustering",
+    "near_duplicate_max_distance",
+)
+
+# Fixed seed so sampled consistency scores are reproducible across re-runs
+CONSISTENCY_SAMPLE_SEED = 0
+
+# Pair similarity (0-100) of two responses in the same near-duplicate cluster
+SAME_CLUSTER_SIMILARITY = 100.0
+
+# Trailing words stripped to derive a brand's short form ("Zoho CRM" -> "Zoho")
+BRAND_SUFFIXES = frozenset(
+    {
+        "co",
+        "corp",
+        "corporation",
+        "crm",
+        "gmbh",
+        "group",
+        "hq",
+        "inc",
+        "llc",
+        "ltd",
+        "plc",
+        "software",
+        "technologies",
+    }
+)
+
+# Shorter forms are too ambiguous for fuzzy matching ("Keap", "Close")
+FUZZY_MIN_LENGTH = 6
+
+_CAMEL_CASE_PATTERN = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+")
+_TOKEN_PATTERN = re.compile(r"\w+(?:[.&'+-]\w+)*")
+
+# Runs of up to four capitalized (or camel-case, e.g. "iPhone") words, with
+# numbers allowed after the first: "Microsoft Dynamics 365", "HubSpot"
+_ENTITY_WORD = r"(?:[A-Z]|[a-z]+[A-Z])\w*(?:[.&'+-]\w+)*"
+_ENTITY_PATTERN = re.compile(
+    rf"(?<![\w.&'+-]){_ENTITY_WORD}(?:[ \t]+(?:{_ENTITY_WORD}|\d+\b)){{0,3}}"
+)
+# A word that can be part of a name: capitalized, camel-case or a number
+_NAME_WORD_PATTERN = re.compile(rf"{_ENTITY_WORD}|\d+")
+# Head of a list item: the text before the first ":", "-", "(", "," or line end
+_ITEM_HEAD_PATTERN = re.compile(
+    r"(\w[^\n:(,\u2013\u2014]{0,59}?)[ \t]*(?:[:(,\u2013\u2014]| - |\n|$)"
+)
+# Capitalized words that are not brands (sentence starters, headings, time)
+_ENTITY_STOPWORDS = frozenset(
+    {
+        "a",
+        "additionally",
+        "also",
+        "although",
+        "an",
+        "and",
+        "another",
+        "any",
+        "april",
+        "as",
+        "at",
+        "august",
+        "best",
+        "both",
+        "but",
+        "by",
+        "choose",
+        "choosing",
+        "conclusion",
+        "cons",
+        "consider",
+        "december",
+        "each",
+        "either",
+        "every",
+        "example",
+        "features",
+        "february",
+        "finally",
+        "first",
+        "for",
+        "free",
+        "friday",
+        "from",
+        "here",
+        "however",
+        "if",
+        "in",
+        "it",
+        "its",
+        "january",
+        "july",
+        "june",
+        "key",
+        "many",
+        "march",
+        "may",
+        "monday",
+        "more",
+        "most",
+        "my",
+        "no",
+        "not",
+        "note",
+        "november",
+        "october",
+        "of",
+        "on",
+        "one",
+        "or",
+        "other",
+        "others",
+        "our",
+        "overall",
+        "plus",
+        "popular",
+        "pricing",
+        "pros",
+        "saturday",
+        "september",
+        "some",
+        "summary",
+        "sunday",
+        "that",
+        "the",
+        "their",
+        "then",
+        "there",
+        "these",
+        "they",
+        "this",
+        "those",
+        "thursday",
+        "to",
+        "top",
+        "tuesday",
+        "ultimately",
+        "wednesday",
+        "when",
+        "while",
+        "with",
+        "you",
+        "your",
+    }
+)
 
 
 @dataclass
@@ -43,6 +233,44 @@ class BrandMention:
     context: str
 
 
+@dataclass
+class BrandMatches:
+    """
+    Brand occurrences across a set of responses, shaped responses x brands.
+
+    Attributes:
+        brands: Brand names, in column order.
+        counts: Number of mentions of each brand in each response.
+        first_positions: Character offset of each brand's first mention in
+            each response's normalized text (-1 when the brand is absent).
+        first_list_items: Index of the first numbered/bulleted list item
+            mentioning each brand in each response (-1 when the brand is
+            not mentioned inside a list item).
+    """
+
+    brands: list[str]
+    counts: npt.NDArray[np.int64]
+    first_positions: npt.NDArray[np.int64]
+    first_list_items: npt.NDArray[np.int64]
+
+    def expand(self, labels: npt.NDArray[np.int64]) -> "BrandMatches":
+        """
+        Map matches of cluster representatives back to every response.
+
+        Args:
+            labels: Row of each response in these matches (its cluster).
+
+        Returns:
+            BrandMatches with one row per response.
+        """
+        return BrandMatches(
+            brands=self.brands,
+            counts=self.counts[labels],
+            first_positions=self.first_positions[labels],
+            first_list_items=self.first_list_items[labels],
+        )
+
+
 @dataclass
 class VisibilityMetrics:
     """
@@ -56,8 +284,9 @@ class VisibilityMetrics:
         mention_count: Total mentions across all iterations.
         visibility_rate: Proportion of iterations mentioning the brand (0-1).
         avg_mentions_per_response: Average mentions when present.
-        first_mention_rate: Rate at which brand appears first.
-        avg_position: Average character position of first mention.
+        first_mention_rate: Rate at which brand is ranked first among all
+            tracked brands (top-1 rate).
+        avg_position: Average position of first mention in the normalized text.
     """
 
     brand: str
@@ -87,6 +316,33 @@ class ShareOfVoice:
     rank: int
 
 
+@dataclass
+class RankMetrics:
+    """
+    Cross-brand rank distribution for a single brand.
+
+    Innovation: Ranks come from each response's brand ordering (list order
+    when the answer is a numbered/bulleted list, otherwise first-mention
+    order), so "Rank Variance" measures how stable a brand's placement is
+    across N samples of the same prompt.
+
+    Attributes:
+        brand: The brand being analyzed.
+        mean_rank: Mean rank over responses mentioning the brand (1 = first).
+        rank_variance: Variance of the rank over those responses.
+        top1_rate: Proportion of all responses ranking the brand first.
+        top3_rate: Proportion of all responses ranking the brand in the top 3.
+        rank_distribution: Response counts per rank (index 0 = rank 1).
+    """
+
+    brand: str
+    mean_rank: float | None
+    rank_variance: float | None
+    top1_rate: float
+    top3_rate: float
+    rank_distribution: list[int]
+
+
 @dataclass
 class ConsistencyMetrics:
     """
@@ -102,6 +358,13 @@ class ConsistencyMetrics:
         max_similarity: Maximum pairwise similarity.
         std_deviation: Standard deviation of similarities.
         consistency_score: Normalized score (0-1, higher = more consistent).
+        method: "exact" (all pairs) or "sampled" (random subset of pairs).
+        sampled_pairs: Number of pairs scored in sampled mode.
+        margin_of_error: Half-width of the confidence interval on
+            avg_similarity in sampled mode (0 when exact). Min/max are
+            taken over the sampled pairs only.
+        metric: Pair similarity measure, "fuzzy" (character-level
+            fuzz.ratio) or "tfidf" (cosine of hashed word n-gram TF-IDF).
     """
 
     avg_similarity: float
@@ -109,6 +372,10 @@ class ConsistencyMetrics:
     max_similarity: float
     std_deviation: float
     consistency_score: float
+    method: str = "exact"
+    sampled_pairs: int | None = None
+    margin_of_error: float = 0.0
+    metric: str = "fuzzy"
 
 
 @dataclass
@@ -126,6 +393,7 @@ class HallucinationMetrics:
         invalid_citations: Citations from non-whitelisted domains.
         hallucination_rate: Proportion of invalid citations (0-1).
         flagged_urls: List of URLs not in whitelist.
+        flagged_domains: Untrusted citation counts per registrable domain.
     """
 
     total_citations: int
@@ -133,6 +401,30 @@ class HallucinationMetrics:
     invalid_citations: int
     hallucination_rate: float
     flagged_urls: list[str]
+    flagged_domains: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class DiscoveredBrand:
+    """
+    A frequently mentioned entity that is not a tracked brand.
+
+    Innovation: Surfaces the brands the LLM actually recommends, so users
+    no longer have to guess the competitor list up front.
+
+    Attributes:
+        brand: Most frequent surface form of the entity.
+        response_count: Responses mentioning the entity.
+        mention_count: Total mentions across all responses.
+        response_rate: Proportion of responses mentioning it (0-1).
+        variants: Other surface forms merged into this entity.
+    """
+
+    brand: str
+    response_count: int
+    mention_count: int
+    response_rate: float
+    variants: list[str] = field(default_factory=list)
 
 
 @dataclass
@@ -155,6 +447,14 @@ class AnalysisResult:
         consistency: Response consistency metrics.
         hallucination: Hallucination detection results (if applicable).
         raw_metrics: Dictionary of all metrics for storage.
+        rankings: Cross-brand rank metrics, in brand order.
+        response_brands: Per analyzed response, the brands it mentions
+            mapped to their mention count, first normalized-text position and
+            rank (for per-iteration storage).
+        discovered_competitors: Most frequent untracked entities.
+        citations: Citation source analytics (None without citations).
+        clusters: Near-duplicate clusters of the responses (None when
+            clustering is disabled).
     """
 
     batch_id: str
@@ -167,6 +467,763 @@ class AnalysisResult:
     consistency: ConsistencyMetrics
     hallucination: HallucinationMetrics | None
     raw_metrics: dict[str, Any]
+    rankings: list[RankMetrics] = field(default_factory=list)
+    response_brands: list[dict[str, dict[str, int]]] = field(default_factory=list)
+    discovered_competitors: list[DiscoveredBrand] = field(default_factory=list)
+    citations: CitationAnalytics | None = None
+    clusters: ResponseClusters | None = None
+
+
+@dataclass
+class AnalysisPayload:
+    """
+    Compact input to the analysis pipeline.
+
+    Holds only the plain strings the metrics need, so a batch can be sent
+    to another process without pickling the pydantic BatchResult.
+
+    Attributes:
+        batch_id: The analyzed batch identifier.
+        provider: LLM provider value.
+        model: Model used.
+        responses: Text of successful responses, in iteration order.
+        citations: Citation URLs of each successful response, aligned with
+            responses (empty lists for responses without citations).
+    """
+
+    batch_id: str
+    provider: str
+    model: str
+    responses: list[str]
+    citations: list[list[str]] = field(default_factory=list)
+
+    @classmethod
+    def from_batch(cls, batch_result: BatchResult) -> "AnalysisPayload":
+        """
+        Extract the analysis payload from a batch result.
+
+        Args:
+            batch_result: The batch execution results.
+
+        Returns:
+            AnalysisPayload: Responses and citations of successful iterations.
+        """
+        columns = batch_result.columns()
+        citations = [
+            [url for url in extract_citations(iteration.response) if url]
+            for iteration, success in zip(batch_result.iterations, columns.success, strict=True)
+            if success
+        ]
+
+        return cls(
+            batch_id=str(batch_result.batch_id),
+            provider=batch_result.provider.value,
+            model=batch_result.model,
+            responses=list(columns.responses),
+            citations=citations,
+        )
+
+    def digest(self) -> str:
+        """
+        Content digest of the responses and citations.
+
+        Identifies the analyzed content independently of the batch, so
+        cached results can be shared by identical payloads.
+
+        Returns:
+            Hex SHA-256 digest.
+        """
+        return hashlib.sha256(
+            json.dumps([self.provider, self.responses, self.citations]).encode()
+        ).hexdigest()
+
+
+def analysis_fingerprint(settings: Settings | None = None) -> str:
+    """
+    Digest of the analysis version and the settings that affect results.
+
+    Args:
+        settings: Application settings. Uses get_settings() if not provided.
+
+    Returns:
+        Hex digest; changes whenever cached analysis results go stale.
+    """
+    settings = settings or get_settings()
+    config = {name: getattr(settings, name) for name in ANALYSIS_SETTINGS}
+    data = json.dumps([ANALYSIS_VERSION, config], sort_keys=True, default=str)
+    return hashlib.sha256(data.encode()).hexdigest()[:16]
+
+
+def extract_citations(response: Any) -> list[str]:
+    """Citation URLs of a response (Perplexity search results)."""
+    if isinstance(response, PerplexityResponse) and response.search_results:
+        return [sr.url for sr in response.search_results]
+    raw = getattr(response, "raw_response", None)
+    if isinstance(raw, dict) and "search_results" in raw:
+        # Try to extract from raw response
+        return [sr.get("url", "") for sr in raw.get("search_results", [])]
+    return []
+
+
+class SurfaceForm(NamedTuple):
+    """
+    A piece of text that counts as a mention of a brand.
+
+    Attributes:
+        brand_index: Column of the brand this form names.
+        text: The surface text (matched with word boundaries).
+        case_sensitive: Match the text's exact casing only (used for
+            generated short forms that collide with common words).
+    """
+
+    brand_index: int
+    text: str
+    case_sensitive: bool = False
+
+
+def _form_key(text: str) -> str:
+    """Normalize a surface text or matched span for lookup."""
+    return " ".join(text.lower().split())
+
+
+def _trie_pattern(keys: list[str]) -> str:
+    """
+    Build a prefix-factored regex alternation matching any of the keys.
+
+    Python's regex engine tries alternatives one by one, so a flat
+    alternation of many brand forms costs O(forms) at every position.
+    Factoring shared prefixes into a trie ("zoho(?:\\s+crm)?") keeps the
+    per-position cost proportional to the key length instead. Longer
+    continuations are tried before a key ends, preserving longest match.
+
+    Args:
+        keys: Normalized (lowercased, single-spaced) keys.
+
+    Returns:
+        Regex source (without word boundaries).
+    """
+    trie: dict[str, Any] = {}
+    for key in keys:
+        node = trie
+        for char in key:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def render(node: dict[str, Any]) -> str:
+        branches = [
+            (r"\s+" if char == " " else re.escape(char)) + render(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            return f"(?:{body})?"
+        return body
+
+    return render(trie)
+
+
+def _strip_brand_suffixes(key: str) -> str:
+    """Drop trailing legal or product suffixes from a normalized key."""
+    words = key.split()
+    while len(words) > 1 and words[-1].strip(".,") in BRAND_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+class EntityCounter:
+    """
+    Counts candidate brand names while BrandMatcher scans the responses.
+
+    Candidates are capitalized word runs and list item heads that do not
+    overlap a tracked brand mention. A candidate only seen as the first
+    word of a sentence needs a mid-sentence or list-head occurrence
+    somewhere in the corpus to count, which filters capitalized prose.
+
+    Innovation: Discovery piggybacks on the matcher's single pass over
+    each response (reusing its list item spans and match offsets), and
+    rapidfuzz only deduplicates the few hundred most frequent candidates,
+    so it adds no extra corpus scan.
+    """
+
+    def __init__(self, weights: Sequence[int] | None = None) -> None:
+        """
+        Initialize empty counts.
+
+        Args:
+            weights: Optional number of responses each added response
+                stands for (group sizes when only one of each group of
+                duplicate responses is scanned).
+        """
+        self.responses = 0
+        self._weights = list(weights) if weights is not None else None
+        self._weight = 1
+        self._index = 0
+        self._responses: dict[str, set[int]] = {}
+        self._mentions: Counter[str] = Counter()
+        self._surfaces: dict[str, Counter[str]] = {}
+        self._confirmed: set[str] = set()
+
+    def _add(self, surface: str, confirmed: bool) -> None:
+        """Count one candidate occurrence in the current response."""
+        words = surface.split()
+        while words and words[0].lower() in _ENTITY_STOPWORDS:
+            words.pop(0)
+            confirmed = True
+        if not words or all(
+            word.lower() in _ENTITY_STOPWORDS or word.lower().strip(".,") in BRAND_SUFFIXES
+            for word in words
+        ):
+            return
+        surface = " ".join(words).removesuffix("'s")
+        key = _form_key(surface)
+        if len(key) < 2 or key.isdigit():
+            return
+        self._responses.setdefault(key, set()).add(self._index)
+        self._mentions[key] += self._weight
+        self._surfaces.setdefault(key, Counter())[surface] += self._weight
+        if confirmed:
+            self._confirmed.add(key)
+
+    def add_response(
+        self,
+        response: NormalizedResponse,
+        match_starts: list[int],
+        match_ends: list[int],
+    ) -> None:
+        """
+        Count the candidates of one response.
+
+        Args:
+            response: The normalized response.
+            match_starts: Clean-text start offsets of tracked brand
+                matches, in order.
+            match_ends: End offsets of those matches.
+        """
+        text = response.text
+        self._weight = self._weights[self._index] if self._weights is not None else 1
+
+        def overlaps_tracked(start: int, end: int) -> bool:
+            i = bisect_right(match_starts, end - 1) - 1
+            return i >= 0 and match_ends[i] > start
+
+        # A list item's head is its leading bold text, or its text up to
+        # the first separator
+        bold = dict(response.emphasis)
+        for item_start, item_end in zip(response.item_starts, response.item_ends, strict=True):
+            if item_start in bold:
+                head_start, head_end = item_start, bold[item_start]
+            else:
+                head = _ITEM_HEAD_PATTERN.match(text, item_start, item_end)
+                if head is None:
+                    continue
+                head_start, head_end = head.span(1)
+            surface = text[head_start:head_end].strip(" \t:.-")
+            if (
+                surface.count(" ") < 4
+                and (not surface.islower() or "." in surface)
+                and not overlaps_tracked(head_start, head_end)
+            ):
+                self._add(surface, confirmed=True)
+
+        sentence_starts = {start for start, _ in response.sentences}
+        for match in _ENTITY_PATTERN.finditer(text):
+            if overlaps_tracked(match.start(), match.end()):
+                continue
+            sentence_start = match.start() in sentence_starts or text.endswith(
+                ": ", 0, match.start()
+            )
+            self._add(match.group(), confirmed=not sentence_start)
+        self.responses += self._weight
+        self._index += 1
+
+    def _response_count(self, key: str) -> int:
+        """Weighted number of responses mentioning a candidate."""
+        if self._weights is None:
+            return len(self._responses[key])
+        return sum(self._weights[index] for index in self._responses[key])
+
+    def discover(
+        self,
+        tracked_forms: list[str],
+        top_n: int,
+        min_responses: int,
+        threshold: float,
+    ) -> list[DiscoveredBrand]:
+        """
+        Rank the counted candidates into discovered brands.
+
+        Candidates close to a tracked form are dropped; the rest are
+        merged when their suffix-stripped names are within the fuzzy
+        threshold of a more frequent candidate.
+
+        Args:
+            tracked_forms: Surface forms of the tracked brands.
+            top_n: Maximum number of brands to report.
+            min_responses: Minimum responses mentioning a brand.
+            threshold: Minimum fuzz.ratio (0-100) to merge or exclude.
+
+        Returns:
+            Discovered brands, most frequently mentioned first.
+        """
+        response_counts = {key: self._response_count(key) for key in self._confirmed}
+        keys = [key for key, count in response_counts.items() if count >= min_responses]
+        if not keys or top_n <= 0:
+            return []
+        keys.sort(key=lambda key: (-response_counts[key], -self._mentions[key], key))
+        keys = keys[: max(top_n * 20, 200)]
+        stripped = [_strip_brand_suffixes(key) for key in keys]
+
+        tracked = {_strip_brand_suffixes(_form_key(form)) for form in tracked_forms}
+        if tracked:
+            tracked_scores = process.cdist(
+                stripped, sorted(tracked), scorer=fuzz.ratio, dtype=np.float32
+            )
+            untracked = tracked_scores.max(axis=1) < threshold
+        else:
+            untracked = np.ones(len(keys), dtype=np.bool_)
+
+        # Greedy merge into the most frequent similar candidate
+        scores = process.cdist(stripped, stripped, scorer=fuzz.ratio, dtype=np.float32)
+        heads: list[int] = []
+        members: dict[int, list[int]] = {}
+        for row in np.flatnonzero(untracked):
+            head = next((h for h in heads if scores[row, h] >= threshold), None)
+            if head is None:
+                heads.append(int(row))
+                members[int(row)] = [int(row)]
+            else:
+                members[head].append(int(row))
+
+        discovered: list[DiscoveredBrand] = []
+        for head in heads:
+            names = [self._surfaces[keys[row]].most_common(1)[0][0] for row in members[head]]
+            responses = set().union(*(self._responses[keys[row]] for row in members[head]))
+            response_count = (
+                sum(self._weights[index] for index in responses)
+                if self._weights is not None
+                else len(responses)
+            )
+            discovered.append(
+                DiscoveredBrand(
+                    brand=names[0],
+                    response_count=response_count,
+                    mention_count=sum(self._mentions[keys[row]] for row in members[head]),
+                    response_rate=response_count / self.responses,
+                    variants=names[1:],
+                )
+            )
+        discovered.sort(key=lambda d: (-d.response_count, -d.mention_count, d.brand))
+        return discovered[:top_n]
+
+
+class BrandMatcher:
+    """
+    Precompiled single-pass matcher for a set of brands.
+
+    All surface forms are combined into one case-insensitive, word-bounded,
+    prefix-factored regex (longest form first), so each response is scanned
+    once no matter how many brands are tracked. A match of a longer form also
+    credits any tracked form it contains (e.g. "Zoho CRM" also counts as
+    "Zoho"), preserving per-brand matching semantics. Each brand is
+    credited at most once per matched span.
+
+    Innovation: Replaces brands x responses regex scans with one scan per
+    response, producing the count and position arrays that visibility,
+    share of voice and ranking all consume.
+    """
+
+    def __init__(self, brands: list[str], forms: list[SurfaceForm] | None = None) -> None:
+        """
+        Compile the matcher.
+
+        Args:
+            brands: Brand names to track (column order of the results).
+            forms: Surface forms to match. Defaults to the brand names.
+        """
+        self.brands = list(brands)
+        if forms is None:
+            forms = [SurfaceForm(index, brand) for index, brand in enumerate(self.brands)]
+
+        # Normalized key -> brands it names, and the alternative matching it
+        by_key: dict[str, set[int]] = {}
+        texts: dict[str, str] = {}
+        case_sensitive: dict[str, bool] = {}
+        for form in forms:
+            key = _form_key(form.text)
+            if not key:
+                continue
+            by_key.setdefault(key, set()).add(form.brand_index)
+            texts.setdefault(key, form.text)
+            # A case-insensitive form of the same key wins
+            case_sensitive[key] = case_sensitive.get(key, True) and form.case_sensitive
+        keys = sorted(by_key, key=len, reverse=True)
+
+        # Case-insensitive forms share one prefix trie, tried first so longer
+        # forms win; case-sensitive forms follow with casing enforced
+        alternatives: list[str] = []
+        insensitive = [key for key in keys if not case_sensitive[key]]
+        if insensitive:
+            alternatives.append(_trie_pattern(insensitive))
+        for key in keys:
+            if case_sensitive[key]:
+                escaped = r"\s+".join(map(re.escape, texts[key].split()))
+                alternatives.append(f"(?-i:{escaped})")
+        self._pattern = (
+            re.compile(r"\b(?:" + "|".join(alternatives) + r")\b", re.IGNORECASE)
+            if alternatives
+            else None
+        )
+
+        # Matched key -> (brand index, offset within the match) to credit
+        self._credits: dict[str, list[tuple[int, int]]] = {}
+        for key in keys:
+            offsets: dict[int, int] = {}
+            for other in keys:
+                if other not in key:
+                    continue
+                inner = re.search(r"\b" + re.escape(other) + r"\b", key)
+                if inner is None:
+                    continue
+                for index in by_key[other]:
+                    if index not in offsets or inner.start() < offsets[index]:
+                        offsets[index] = inner.start()
+            self._credits[key] = sorted(offsets.items())
+
+    def search(self, text: str) -> bool:
+        """Return True if any surface form occurs in the text."""
+        return self._pattern is not None and self._pattern.search(text) is not None
+
+    def scan(
+        self,
+        responses: Sequence[str | NormalizedResponse],
+        discovery: EntityCounter | None = None,
+    ) -> BrandMatches:
+        """
+        Find all brand occurrences in a set of responses.
+
+        Matching runs on the normalized text; raw strings are normalized
+        first.
+
+        Args:
+            responses: LLM responses, raw or normalized.
+            discovery: Optional counter fed each response's untracked
+                candidate names during the same pass.
+
+        Returns:
+            BrandMatches: Per-response, per-brand counts and first positions.
+        """
+        width = len(self.brands)
+        counts: list[list[int]] = []
+        first_positions: list[list[int]] = []
+        first_list_items: list[list[int]] = []
+
+        for response in normalize_responses(responses):
+            text = response.text
+            item_starts, item_ends = response.item_starts, response.item_ends
+            row_counts = [0] * width
+            row_first = [-1] * width
+            row_items = [-1] * width
+            match_starts: list[int] = []
+            match_ends: list[int] = []
+            if self._pattern is not None:
+                for match in self._pattern.finditer(text):
+                    credits = self._credits.get(_form_key(match.group()), ())
+                    if not credits:
+                        continue
+                    match_starts.append(match.start())
+                    match_ends.append(match.end())
+                    item = bisect_right(item_starts, match.start()) - 1
+                    if item >= 0 and match.start() >= item_ends[item]:
+                        item = -1
+                    for index, offset in credits:
+                        row_counts[index] += 1
+                        if row_first[index] < 0:
+                            row_first[index] = match.start() + offset
+                        if row_items[index] < 0:
+                            row_items[index] = item
+            if discovery is not None:
+                discovery.add_response(response, match_starts, match_ends)
+            counts.append(row_counts)
+            first_positions.append(row_first)
+            first_list_items.append(row_items)
+
+        shape = (len(responses), width)
+        return BrandMatches(
+            brands=self.brands,
+            counts=np.array(counts, dtype=np.int64).reshape(shape),
+            first_positions=np.array(first_positions, dtype=np.int64).reshape(shape),
+            first_list_items=np.array(first_list_items, dtype=np.int64).reshape(shape),
+        )
+
+
+def brand_variants(brand: str) -> tuple[list[str], list[str]]:
+    """
+    Generate normalized surface forms for a brand name.
+
+    Args:
+        brand: The brand name as tracked.
+
+    Returns:
+        Tuple of (case-insensitive forms, case-sensitive forms). The first
+        holds spacing variants ("Zoho CRM" -> "ZohoCRM", "Zoho-CRM"; "HubSpot"
+        -> "Hub Spot"); the second holds the name with legal or product
+        suffixes stripped ("Zoho CRM" -> "Zoho"), which only match in the
+        brand's own casing to avoid common-word false positives.
+    """
+    words = brand.split()
+    spacing: list[str] = []
+    if len(words) > 1:
+        spacing.extend(["".join(words), "-".join(words)])
+    camel_parts = _CAMEL_CASE_PATTERN.findall(brand)
+    if len(words) == 1 and brand.isalnum() and len(camel_parts) > 1:
+        spacing.append(" ".join(camel_parts))
+
+    stripped: list[str] = []
+    while len(words) > 1 and words[-1].lower().strip(".,") in BRAND_SUFFIXES:
+        words = words[:-1]
+        candidate = " ".join(words).rstrip(",")
+        if len(candidate) >= 3:
+            stripped.append(candidate)
+
+    return spacing, stripped
+
+
+@dataclass
+class BrandDictionary:
+    """
+    Compiled index of tracked brands, their aliases and variant forms.
+
+    Each brand is matched through its name, explicit aliases (e.g.
+    "Salesforce" -> "SFDC"), generated spacing variants, suffix-stripped
+    short forms and, optionally, fuzzy variants discovered in the corpus.
+
+    Fuzzy matching runs in two stages so it never compares every token
+    against every brand: candidate extraction collects the corpus's unique
+    word n-grams of plausible length that the exact forms do not already
+    cover, then verification scores only those candidates against the
+    brand forms with rapidfuzz and keeps the ones above the threshold.
+
+    Innovation: Mentions like "Hubspot CRM", "Zoho" (for "Zoho CRM") or
+    "Salesforse" are credited to the right brand, and the compiled
+    dictionary serializes to JSON so it can be cached per experiment.
+
+    Attributes:
+        brands: Tracked brand names (column order of match results).
+        aliases: Brand -> case-insensitive surface forms besides its name.
+        short_forms: Brand -> case-sensitive suffix-stripped forms.
+        fuzzy_threshold: Minimum fuzz.ratio (0-100) for fuzzy variants, or
+            None to disable fuzzy matching.
+    """
+
+    brands: list[str]
+    aliases: dict[str, list[str]] = field(default_factory=dict)
+    short_forms: dict[str, list[str]] = field(default_factory=dict)
+    fuzzy_threshold: float | None = None
+    _matcher: BrandMatcher | None = field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def build(
+        cls,
+        brands: list[str],
+        aliases: dict[str, list[str]] | None = None,
+        fuzzy_threshold: float | None = None,
+    ) -> "BrandDictionary":
+        """
+        Build a dictionary, generating variant forms for each brand.
+
+        Generated forms that collide with another tracked brand (or its
+        explicit aliases) are dropped, so "Zoho" and "Zoho CRM" can be
+        tracked as separate brands.
+
+        Args:
+            brands: Brand names to track.
+            aliases: Optional explicit aliases per brand.
+            fuzzy_threshold: Minimum fuzz.ratio for fuzzy variants (None disables).
+
+        Returns:
+            BrandDictionary: The compiled dictionary.
+        """
+        aliases = aliases or {}
+        reserved: dict[str, set[str]] = {}
+        for brand in brands:
+            for text in [brand, *aliases.get(brand, [])]:
+                reserved.setdefault(_form_key(text), set()).add(brand)
+
+        def available(brand: str, text: str) -> bool:
+            return reserved.get(_form_key(text), {brand}) == {brand}
+
+        all_aliases: dict[str, list[str]] = {}
+        short_forms: dict[str, list[str]] = {}
+        for brand in brands:
+            spacing, stripped = brand_variants(brand)
+            explicit = aliases.get(brand, [])
+            all_aliases[brand] = list(
+                dict.fromkeys(explicit + [v for v in spacing if available(brand, v)])
+            )
+            short_forms[brand] = [v for v in stripped if available(brand, v)]
+
+        return cls(
+            brands=list(brands),
+            aliases=all_aliases,
+            short_forms=short_forms,
+            fuzzy_threshold=fuzzy_threshold,
+        )
+
+    def forms(self) -> list[SurfaceForm]:
+        """Return all exact surface forms of the tracked brands."""
+        forms: list[SurfaceForm] = []
+        for index, brand in enumerate(self.brands):
+            forms.append(SurfaceForm(index, brand))
+            forms.extend(SurfaceForm(index, alias) for alias in self.aliases.get(brand, []))
+            forms.extend(
+                SurfaceForm(index, short, case_sensitive=True)
+                for short in self.short_forms.get(brand, [])
+            )
+        return forms
+
+    @property
+    def matcher(self) -> BrandMatcher:
+        """The exact-form matcher, compiled on first use."""
+        if self._matcher is None:
+            self._matcher = BrandMatcher(self.brands, self.forms())
+        return self._matcher
+
+    def find_fuzzy_forms(
+        self,
+        responses: Sequence[str | NormalizedResponse],
+        workers: int = 1,
+    ) -> list[SurfaceForm]:
+        """
+        Discover misspelled or variant brand mentions in a corpus.
+
+        Only name-like spans are candidates: every word capitalized (or
+        camel-case), the span not a stopword, and, for single words,
+        never written in lowercase in the corpus and seen at least once
+        outside a sentence start, so ordinary words ("creation",
+        "streak") are not mistaken for brands ("Creatio", "Streak").
+
+        Args:
+            responses: LLM responses, raw or normalized.
+            workers: CPU workers for rapidfuzz scoring (-1 = all cores).
+
+        Returns:
+            Surface forms for verified fuzzy variants, matched with the
+            casing they were seen with.
+        """
+        if self.fuzzy_threshold is None:
+            return []
+
+        targets = [
+            (form.brand_index, key)
+            for form in self.forms()
+            if not form.case_sensitive and len(key := _form_key(form.text)) >= FUZZY_MIN_LENGTH
+        ]
+        if not targets:
+            return []
+        target_keys = [key for _, key in targets]
+        max_words = max(key.count(" ") + 1 for key in target_keys)
+        min_length = int(min(map(len, target_keys)) * 0.8)
+        max_length = int(max(map(len, target_keys)) * 1.25) + 1
+
+        # Stage 1: name-like word n-grams of plausible length, with whether
+        # any occurrence is away from a plain sentence start
+        candidates: dict[str, bool] = {}
+        lowercase_words: set[str] = set()
+        for response in normalize_responses(responses):
+            tokens = list(_TOKEN_PATTERN.finditer(response.text))
+            words = [token.group() for token in tokens]
+            lowercase_words.update(word for word in words if word.islower())
+            name_like = [bool(_NAME_WORD_PATTERN.fullmatch(word)) for word in words]
+            sentence_starts = {start for start, _ in response.sentences}.difference(
+                response.item_starts
+            )
+            for i, token in enumerate(tokens):
+                if words[i].isdigit():
+                    continue
+                inside = token.start() not in sentence_starts
+                for size in range(1, min(max_words, len(tokens) - i) + 1):
+                    if not name_like[i + size - 1]:
+                        break
+                    candidate = " ".join(words[i : i + size])
+                    if min_length <= len(candidate) <= max_length:
+                        candidates[candidate] = candidates.get(candidate, False) or inside
+        matcher = self.matcher
+        pool = [
+            candidate
+            for candidate, inside in candidates.items()
+            if (key := candidate.casefold()).split(" ", 1)[0] not in _ENTITY_STOPWORDS
+            and (" " in key or (inside and key not in lowercase_words))
+            and not matcher.search(candidate)
+        ]
+        if not pool:
+            return []
+
+        # Stage 2: verify candidates against the brand forms
+        scores = process.cdist(
+            [_form_key(candidate) for candidate in pool],
+            target_keys,
+            scorer=fuzz.ratio,
+            score_cutoff=self.fuzzy_threshold,
+            dtype=np.float32,
+            workers=workers,
+        )
+        best = scores.argmax(axis=1)
+        best_scores = scores[np.arange(len(pool)), best]
+        return [
+            SurfaceForm(targets[int(best[row])][0], pool[row], case_sensitive=True)
+            for row in np.flatnonzero(best_scores >= self.fuzzy_threshold)
+        ]
+
+    def scan(
+        self,
+        responses: Sequence[str | NormalizedResponse],
+        workers: int = 1,
+        discovery: EntityCounter | None = None,
+    ) -> BrandMatches:
+        """
+        Find all brand occurrences, including fuzzy variants when enabled.
+
+        Args:
+            responses: LLM responses, raw or normalized.
+            workers: CPU workers for fuzzy verification (-1 = all cores).
+            discovery: Optional counter of untracked candidate names,
+                fed during the matching pass.
+
+        Returns:
+            BrandMatches: Per-response, per-brand counts and first positions.
+        """
+        responses = normalize_responses(responses)
+        fuzzy_forms = self.find_fuzzy_forms(responses, workers=workers)
+        if not fuzzy_forms:
+            return self.matcher.scan(responses, discovery=discovery)
+        return BrandMatcher(self.brands, self.forms() + fuzzy_forms).scan(
+            responses, discovery=discovery
+        )
+
+    def to_json(self) -> str:
+        """Serialize the dictionary (for per-experiment caching)."""
+        return json.dumps(
+            {
+                "brands": self.brands,
+                "aliases": self.aliases,
+                "short_forms": self.short_forms,
+                "fuzzy_threshold": self.fuzzy_threshold,
+            }
+        )
+
+    @classmethod
+    def from_json(cls, data: str) -> "BrandDictionary":
+        """Deserialize a dictionary produced by to_json."""
+        payload = json.loads(data)
+        return cls(
+            brands=payload["brands"],
+            aliases=payload.get("aliases", {}),
+            short_forms=payload.get("short_forms", {}),
+            fuzzy_threshold=payload.get("fuzzy_threshold"),
+        )
 
 
 class AnalysisBuilder:
@@ -182,16 +1239,28 @@ class AnalysisBuilder:
     This is the core value proposition for the Innovator Founder Visa.
     """
 
-    def __init__(self) -> None:
-        """Initialize the AnalysisBuilder."""
-        # Compile regex patterns for efficiency
-        self._word_boundary_pattern = r"\b{}\b"
+    def __init__(
+        self,
+        settings: Settings | None = None,
+        consistency_metric: ConsistencyMetric | None = None,
+    ) -> None:
+        """
+        Initialize the AnalysisBuilder.
+
+        Args:
+            settings: Application settings. Uses get_settings() if not provided.
+            consistency_metric: Pair similarity for consistency ("fuzzy" or
+                "tfidf"). Uses settings.consistency_metric if not provided.
+        """
+        self.settings = settings or get_settings()
+        self.consistency_metric = consistency_metric or self.settings.consistency_metric
 
     def analyze_batch(
         self,
         batch_result: BatchResult,
         target_brands: list[str],
         domain_whitelist: list[str] | None = None,
+        brand_dictionary: BrandDictionary | None = None,
     ) -> AnalysisResult:
         """
         Perform complete analysis on a batch result.
@@ -206,41 +1275,132 @@ class AnalysisBuilder:
             batch_result: The batch execution results.
             target_brands: List of brands to analyze (first is primary target).
             domain_whitelist: Optional list of trusted domains for hallucination check.
+            brand_dictionary: Optional precompiled (e.g. cached) dictionary for
+                target_brands. Built from settings if not provided.
 
         Returns:
             AnalysisResult: Complete analysis with all metrics.
         """
-        responses = batch_result.raw_responses
-        total_responses = len(responses)
+        return self.analyze_payload(
+            AnalysisPayload.from_batch(batch_result),
+            target_brands,
+            domain_whitelist=domain_whitelist,
+            brand_dictionary=brand_dictionary,
+        )
+
+    def analyze_payload(
+        self,
+        payload: AnalysisPayload,
+        target_brands: list[str],
+        domain_whitelist: list[str] | None = None,
+        brand_dictionary: BrandDictionary | None = None,
+    ) -> AnalysisResult:
+        """
+        Perform complete analysis on a compact analysis payload.
+
+        Same pipeline as analyze_batch, on plain strings only, so it can
+        run in a worker process (see analysis_pool).
+
+        Args:
+            payload: Responses and citations of the batch.
+            target_brands: List of brands to analyze (first is primary target).
+            domain_whitelist: Optional list of trusted domains for hallucination check.
+            brand_dictionary: Optional precompiled (e.g. cached) dictionary for
+                target_brands. Built from settings if not provided.
+
+        Returns:
+            AnalysisResult: Complete analysis with all metrics.
+        """
+        total_responses = len(payload.responses)
 
         if total_responses == 0:
             # Return empty results if no successful responses
-            return self._empty_result(batch_result)
+            return self._empty_result(payload)
+
+        # Strip markdown and citation markers once; every metric below
+        # reads the normalized form
+        responses = normalize_responses(payload.responses)
+
+        # Group repeated responses; consistency is scored once per cluster,
+        # while brand matching only collapses exact duplicates (near
+        # duplicates may name different brands)
+        clusters = (
+            cluster_responses(responses, max_distance=self.settings.near_duplicate_max_distance)
+            if self.settings.response_clustering
+            else None
+        )
+        duplicates = clusters.exact if clusters is not None else None
+        representatives = (
+            [responses[i] for i in duplicates.representatives] if duplicates else responses
+        )
+
+        # Find all brand mentions (aliases, variants, fuzzy) in one pass per response
+        if brand_dictionary is None:
+            brand_dictionary = self.build_brand_dictionary(target_brands)
+        discovery = (
+            EntityCounter(weights=duplicates.sizes.tolist() if duplicates else None)
+            if self.settings.competitor_discovery_top_n
+            else None
+        )
+        matches = brand_dictionary.scan(
+            representatives,
+            workers=self.settings.analysis_workers,
+            discovery=discovery,
+        )
+        if duplicates is not None:
+            matches = matches.expand(duplicates.labels)
+        discovered_competitors = (
+            discovery.discover(
+                [form.text for form in brand_dictionary.forms()],
+                top_n=self.settings.competitor_discovery_top_n,
+                min_responses=self.settings.competitor_discovery_min_responses,
+                threshold=self.settings.brand_fuzzy_threshold,
+            )
+            if discovery is not None
+            else []
+        )
+
+        # Rank brands against each other within every response
+        ranks = self.rank_brands(matches)
+        rankings = self._compute_rankings(matches.brands, ranks)
 
         # Compute visibility for all brands
-        all_visibility: list[VisibilityMetrics] = []
-        for brand in target_brands:
-            visibility = self._compute_visibility(responses, brand)
-            all_visibility.append(visibility)
+        all_visibility = self._compute_visibility(matches, ranks)
 
         # Separate target and competitor visibility
         target_visibility = all_visibility[0] if all_visibility else None
         competitor_visibility = all_visibility[1:] if len(all_visibility) > 1 else []
 
         # Compute Share of Voice
-        share_of_voice = self._compute_share_of_voice(all_visibility)
+        share_of_voice = self.compute_share_of_voice(all_visibility)
 
         # Compute Consistency Score
-        consistency = self._compute_consistency(responses)
+        folded = [response.folded for response in responses]
+        pair_scores = self.score_pairs(folded, clusters) if total_responses > 1 else None
+        consistency = self.compute_consistency(folded, pair_scores)
+
+        # Interval estimates for rates, shares, ranks and consistency
+        confidence_intervals = self._compute_intervals(matches, ranks, pair_scores)
 
         # Compute Hallucination metrics (Perplexity only)
         hallucination = None
-        if batch_result.provider == LLMProvider.PERPLEXITY and domain_whitelist:
+        if payload.provider == LLMProvider.PERPLEXITY.value and domain_whitelist:
             hallucination = self._compute_hallucination(
-                batch_result.iterations,
+                [url for urls in payload.citations for url in urls],
                 domain_whitelist,
             )
 
+        # Cited hosts, their stability and co-citation with each brand
+        citations = analyze_citations(
+            payload.citations,
+            presence=matches.counts > 0,
+            brands=matches.brands,
+            whitelist=compile_whitelist(domain_whitelist) if domain_whitelist else None,
+            top_hosts=self.settings.citation_top_hosts,
+            exact_max_responses=self.settings.consistency_exact_max_responses,
+            sample_pairs=self.settings.consistency_sample_pairs,
+        )
+
         # Build raw metrics dictionary for storage
         raw_metrics = self._build_raw_metrics(
             target_visibility=target_visibility,
@@ -249,12 +1409,17 @@ class AnalysisBuilder:
             consistency=consistency,
             hallucination=hallucination,
             total_responses=total_responses,
+            rankings=rankings,
+            confidence_intervals=confidence_intervals,
+            discovered_competitors=discovered_competitors,
+            citations=citations,
+            clusters=clusters,
         )
 
         return AnalysisResult(
-            batch_id=str(batch_result.batch_id),
-            provider=batch_result.provider.value,
-            model=batch_result.model,
+            batch_id=payload.batch_id,
+            provider=payload.provider,
+            model=payload.model,
             total_responses=total_responses,
             target_visibility=target_visibility,
             competitor_visibility=competitor_visibility,
@@ -262,71 +1427,217 @@ class AnalysisBuilder:
             consistency=consistency,
             hallucination=hallucination,
             raw_metrics=raw_metrics,
+            rankings=rankings,
+            response_brands=self._response_brands(matches, ranks),
+            discovered_competitors=discovered_competitors,
+            citations=citations,
+            clusters=clusters,
         )
 
-    def _compute_visibility(
+    def build_brand_dictionary(
         self,
-        responses: list[str],
-        brand: str,
-    ) -> VisibilityMetrics:
+        brands: list[str],
+        aliases: dict[str, list[str]] | None = None,
+    ) -> BrandDictionary:
         """
-        Compute visibility metrics for a single brand.
+        Build a brand dictionary using the configured fuzzy matching settings.
 
-        Innovation: Uses regex with word boundaries for accurate brand detection,
-        avoiding false positives from partial matches.
+        Args:
+            brands: Brand names to track (first is primary target).
+            aliases: Optional explicit aliases per brand.
+
+        Returns:
+            BrandDictionary: The compiled dictionary.
+        """
+        return BrandDictionary.build(
+            brands,
+            aliases=aliases,
+            fuzzy_threshold=(
+                self.settings.brand_fuzzy_threshold if self.settings.brand_fuzzy_matching else None
+            ),
+        )
+
+    def rank_brands(self, matches: BrandMatches) -> npt.NDArray[np.int64]:
+        """
+        Rank the tracked brands against each other within each response.
+
+        Brands mentioned inside a numbered or bulleted list are ordered by
+        the first list item mentioning them and placed ahead of brands only
+        mentioned in prose, which are ordered by first mention.
+
+        Innovation: One argsort over the responses x brands key matrix ranks
+        every response at once, so ranking stays linear in corpus size.
 
         Args:
-            responses: List of LLM response texts.
-            brand: Brand name to search for.
+            matches: Brand occurrences from BrandMatcher.scan.
 
         Returns:
-            VisibilityMetrics: Computed visibility metrics.
+            (responses, brands) array of ranks (1 = first, 0 = not mentioned).
         """
-        # Create case-insensitive pattern with word boundaries
-        pattern = re.compile(
-            self._word_boundary_pattern.format(re.escape(brand)),
-            re.IGNORECASE,
+        present = matches.counts > 0
+        n_rows, n_brands = present.shape
+        if n_rows == 0 or n_brands == 0:
+            return np.zeros(present.shape, dtype=np.int64)
+
+        # Sort key: (list item or "after all items", first position)
+        position_span = int(matches.first_positions.max()) + 1
+        item_order = np.where(
+            matches.first_list_items >= 0,
+            matches.first_list_items,
+            int(matches.first_list_items.max()) + 1,
+        )
+        keys = np.where(
+            present,
+            item_order * position_span + matches.first_positions,
+            np.iinfo(np.int64).max,
         )
 
-        total_mentions = 0
-        responses_with_mention = 0
-        first_mentions = 0
-        positions: list[int] = []
+        order = np.argsort(keys, axis=1, kind="stable")
+        ranks = np.empty_like(order)
+        rows = np.arange(n_rows)[:, None]
+        ranks[rows, order] = np.arange(1, n_brands + 1)
+        return np.where(present, ranks, 0).astype(np.int64)
 
-        for response in responses:
-            matches = list(pattern.finditer(response))
+    def _response_brands(
+        self,
+        matches: BrandMatches,
+        ranks: npt.NDArray[np.int64],
+    ) -> list[dict[str, dict[str, int]]]:
+        """
+        Per-response brand hits for storage on each iteration.
+
+        Args:
+            matches: Brand occurrences from BrandMatcher.scan.
+            ranks: Rank matrix from rank_brands.
+
+        Returns:
+            Per response, {brand: {"count", "position", "rank"}} for the
+            brands it mentions, in rank order.
+        """
+        hits: list[dict[str, dict[str, int]]] = []
+        for counts, positions, response_ranks in zip(
+            matches.counts.tolist(),
+            matches.first_positions.tolist(),
+            ranks.tolist(),
+            strict=True,
+        ):
+            mentioned = sorted(
+                (rank, index) for index, rank in enumerate(response_ranks) if counts[index]
+            )
+            hits.append(
+                {
+                    matches.brands[index]: {
+                        "count": counts[index],
+                        "position": positions[index],
+                        "rank": rank,
+                    }
+                    for rank, index in mentioned
+                }
+            )
+        return hits
 
-            if matches:
-                responses_with_mention += 1
-                total_mentions += len(matches)
+    def _compute_rankings(
+        self,
+        brands: list[str],
+        ranks: npt.NDArray[np.int64],
+    ) -> list[RankMetrics]:
+        """
+        Compute per-brand rank distributions from the rank matrix.
 
-                # Track position of first mention
-                first_pos = matches[0].start()
-                positions.append(first_pos)
+        Args:
+            brands: Brand names, in column order.
+            ranks: Rank matrix from rank_brands.
 
-                # Check if this brand appears first among all brands
-                # (simplified: just check if it's in first 100 chars)
-                if first_pos < 100:
-                    first_mentions += 1
+        Returns:
+            List of RankMetrics, in brand order.
+        """
+        total_responses, n_brands = ranks.shape
+        present = ranks > 0
+        mentioned = present.sum(axis=0)
 
-        total_responses = len(responses)
-        visibility_rate = responses_with_mention / total_responses if total_responses > 0 else 0.0
-        avg_mentions = (
-            total_mentions / responses_with_mention if responses_with_mention > 0 else 0.0
+        rank_sums = ranks.sum(axis=0)
+        mean_ranks = np.divide(
+            rank_sums, mentioned, out=np.zeros(n_brands, dtype=np.float64), where=mentioned > 0
         )
-        first_mention_rate = first_mentions / total_responses if total_responses > 0 else 0.0
-        avg_position = sum(positions) / len(positions) if positions else None
-
-        return VisibilityMetrics(
-            brand=brand,
-            mention_count=total_mentions,
-            visibility_rate=visibility_rate,
-            avg_mentions_per_response=avg_mentions,
-            first_mention_rate=first_mention_rate,
-            avg_position=avg_position,
+        squared_deviations = np.where(present, (ranks - mean_ranks) ** 2, 0.0).sum(axis=0)
+        variances = np.divide(
+            squared_deviations,
+            mentioned,
+            out=np.zeros(n_brands, dtype=np.float64),
+            where=mentioned > 0,
         )
+        top1 = (ranks == 1).sum(axis=0)
+        top3 = (present & (ranks <= 3)).sum(axis=0)
+
+        metrics: list[RankMetrics] = []
+        for index, brand in enumerate(brands):
+            has_rank = bool(mentioned[index])
+            column = ranks[:, index]
+            metrics.append(
+                RankMetrics(
+                    brand=brand,
+                    mean_rank=float(mean_ranks[index]) if has_rank else None,
+                    rank_variance=float(variances[index]) if has_rank else None,
+                    top1_rate=int(top1[index]) / total_responses if total_responses else 0.0,
+                    top3_rate=int(top3[index]) / total_responses if total_responses else 0.0,
+                    rank_distribution=np.bincount(
+                        column[column > 0] - 1, minlength=n_brands
+                    ).tolist(),
+                )
+            )
+        return metrics
 
-    def _compute_share_of_voice(
+    def _compute_visibility(
+        self,
+        matches: BrandMatches,
+        ranks: npt.NDArray[np.int64],
+    ) -> list[VisibilityMetrics]:
+        """
+        Compute visibility metrics for every brand from the match arrays.
+
+        Innovation: Uses word-bounded, case-insensitive brand detection,
+        avoiding false positives from partial matches, and reduces all
+        brands at once with column-wise NumPy operations.
+
+        Args:
+            matches: Brand occurrences from BrandMatcher.scan.
+            ranks: Rank matrix from rank_brands.
+
+        Returns:
+            List of VisibilityMetrics, in brand order.
+        """
+        total_responses = matches.counts.shape[0]
+        present = matches.counts > 0
+        mention_counts = matches.counts.sum(axis=0)
+        responses_with_mention = present.sum(axis=0)
+
+        # Responses where this brand is ranked first among all brands
+        first_mentions = (ranks == 1).sum(axis=0)
+        position_sums = np.where(present, matches.first_positions, 0).sum(axis=0)
+
+        metrics: list[VisibilityMetrics] = []
+        for index, brand in enumerate(matches.brands):
+            with_mention = int(responses_with_mention[index])
+            mention_count = int(mention_counts[index])
+            metrics.append(
+                VisibilityMetrics(
+                    brand=brand,
+                    mention_count=mention_count,
+                    visibility_rate=with_mention / total_responses if total_responses else 0.0,
+                    avg_mentions_per_response=(
+                        mention_count / with_mention if with_mention else 0.0
+                    ),
+                    first_mention_rate=(
+                        int(first_mentions[index]) / total_responses if total_responses else 0.0
+                    ),
+                    avg_position=(
+                        int(position_sums[index]) / with_mention if with_mention else None
+                    ),
+                )
+            )
+        return metrics
+
+    def compute_share_of_voice(
         self,
         visibility_metrics: list[VisibilityMetrics],
     ) -> list[ShareOfVoice]:
@@ -364,19 +1675,28 @@ class AnalysisBuilder:
             for i, (brand, share, _) in enumerate(shares)
         ]
 
-    def _compute_consistency(
+    def compute_consistency(
         self,
         responses: list[str],
+        pair_scores: tuple[npt.NDArray[np.float64], npt.NDArray[np.float64] | None] | None = None,
     ) -> ConsistencyMetrics:
         """
-        Compute response consistency using fuzzy string matching.
+        Compute response consistency from pairwise response similarity.
 
         Innovation: Uses Levenshtein distance (via rapidfuzz) to measure
         how similar responses are to each other. High variance indicates
-        the LLM gives inconsistent answers, which is a risk factor.
+        the LLM gives inconsistent answers, which is a risk factor. With
+        the "tfidf" metric, similarity is the cosine of hashed word n-gram
+        TF-IDF vectors, which tracks content rather than formatting.
+
+        All pairs are scored exactly for typical batches. Above the
+        configured response-count or total-character thresholds, a fixed
+        number of randomly sampled pairs is scored instead and the result
+        carries a margin of error at the configured confidence level.
 
         Args:
             responses: List of LLM response texts.
+            pair_scores: Optional precomputed result of score_pairs.
 
         Returns:
             ConsistencyMetrics: Computed consistency metrics.
@@ -390,23 +1710,21 @@ class AnalysisBuilder:
                 consistency_score=1.0,
             )
 
-        # Compute pairwise similarities
-        similarities: list[float] = []
+        if pair_scores is None:
+            pair_scores = self.score_pairs(responses)
+        similarities, matrix = pair_scores
+        use_sampling = matrix is None
 
-        for i in range(len(responses)):
-            for j in range(i + 1, len(responses)):
-                # Use rapidfuzz for fast fuzzy matching
-                similarity = fuzz.ratio(responses[i], responses[j])
-                similarities.append(similarity)
+        avg_similarity = float(similarities.mean())
+        min_similarity = float(similarities.min())
+        max_similarity = float(similarities.max())
+        std_deviation = float(similarities.std())
 
-        # Compute statistics
-        avg_similarity = sum(similarities) / len(similarities)
-        min_similarity = min(similarities)
-        max_similarity = max(similarities)
-
-        # Compute standard deviation
-        variance = sum((s - avg_similarity) ** 2 for s in similarities) / len(similarities)
-        std_deviation = variance**0.5
+        margin_of_error = 0.0
+        if use_sampling:
+            # Normal-approximation interval on the mean of k i.i.d. pair scores
+            z = NormalDist().inv_cdf((1 + self.settings.confidence_level) / 2)
+            margin_of_error = z * std_deviation / len(similarities) ** 0.5
 
         # Normalize to 0-1 score (higher = more consistent)
         # A score of 100 similarity = 1.0, score of 0 = 0.0
@@ -418,11 +1736,296 @@ class AnalysisBuilder:
             max_similarity=max_similarity,
             std_deviation=std_deviation,
             consistency_score=consistency_score,
+            method="sampled" if use_sampling else "exact",
+            sampled_pairs=len(similarities) if use_sampling else None,
+            margin_of_error=margin_of_error,
+            metric=self.consistency_metric,
+        )
+
+    def score_pairs(
+        self,
+        responses: list[str],
+        clusters: ResponseClusters | None = None,
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64] | None]:
+        """
+        Score response pairs exactly or by sampling, depending on batch size.
+
+        Args:
+            responses: List of LLM response texts (at least two).
+            clusters: Optional near-duplicate clusters of the responses;
+                only cluster representatives are then compared.
+
+        Returns:
+            Tuple of (pair scores, full similarity matrix). The matrix is
+            None when pairs were sampled.
+        """
+        if clusters is not None and clusters.count < len(responses):
+            return self._score_clustered_pairs(responses, clusters)
+
+        n = len(responses)
+        sample_size = self.settings.consistency_sample_pairs
+        tfidf = self.consistency_metric == "tfidf"
+        use_sampling = self._use_sampling(responses)
+
+        if tfidf:
+            vectors = tfidf_vectors(responses)
+            if use_sampling:
+                first, second = self._sample_pairs(n, sample_size)
+                return paired_cosine(vectors, first, second), None
+            matrix = cosine_matrix(vectors)
+            rows, cols = np.triu_indices(n, k=1)
+            return matrix[rows, cols], matrix
+
+        if use_sampling:
+            return self._sampled_similarities(responses, sample_size), None
+
+        # Pairwise similarities from the upper triangle (i < j) of the matrix
+        matrix = self._similarity_matrix(responses)
+        rows, cols = np.triu_indices(n, k=1)
+        return matrix[rows, cols], matrix
+
+    def _use_sampling(self, responses: list[str]) -> bool:
+        """Whether consistency over these responses scores sampled pairs."""
+        n = len(responses)
+        # Sparse cosine cost does not grow with response length, so only
+        # fuzzy scoring switches to sampling on total characters
+        return self.settings.consistency_sample_pairs < n * (n - 1) // 2 and (
+            n > self.settings.consistency_exact_max_responses
+            or (
+                self.consistency_metric != "tfidf"
+                and sum(map(len, responses)) > self.settings.consistency_exact_max_chars
+            )
+        )
+
+    def _score_clustered_pairs(
+        self,
+        responses: list[str],
+        clusters: ResponseClusters,
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64] | None]:
+        """
+        Score response pairs by comparing cluster representatives only.
+
+        Responses of the same cluster count as identical (similarity 100);
+        every other pair takes its representatives' similarity, so the
+        scores keep the weight of each cluster's size.
+
+        Innovation: Scoring cost follows the number of distinct responses,
+        so low-temperature batches full of repeats are compared in a
+        fraction of the time.
+
+        Args:
+            responses: List of LLM response texts (at least two).
+            clusters: Near-duplicate clusters of the responses.
+
+        Returns:
+            Tuple of (pair scores, full similarity matrix), as score_pairs.
+        """
+        n = len(responses)
+        labels = clusters.labels
+        sample_size = self.settings.consistency_sample_pairs
+        representatives = [responses[i] for i in clusters.representatives]
+
+        if clusters.count > 1 and self._use_sampling(representatives):
+            # Too many distinct responses to compare all of them
+            first, second = self._sample_pairs(n, sample_size)
+            first, second = labels[first], labels[second]
+            distinct = first != second
+            similarities = np.full(sample_size, SAME_CLUSTER_SIMILARITY)
+            if self.consistency_metric == "tfidf":
+                similarities[distinct] = paired_cosine(
+                    tfidf_vectors(representatives, weights=clusters.sizes),
+                    first[distinct],
+                    second[distinct],
+                )
+            else:
+                similarities[distinct] = process.cpdist(
+                    [representatives[i] for i in first[distinct]],
+                    [representatives[j] for j in second[distinct]],
+                    scorer=fuzz.ratio,
+                    dtype=np.float64,
+                    workers=self.settings.analysis_workers,
+                )
+            return similarities, None
+
+        if clusters.count == 1:
+            cluster_matrix = np.empty((1, 1))
+        elif self.consistency_metric == "tfidf":
+            cluster_matrix = cosine_matrix(tfidf_vectors(representatives, weights=clusters.sizes))
+        else:
+            cluster_matrix = self._similarity_matrix(representatives)
+        np.fill_diagonal(cluster_matrix, SAME_CLUSTER_SIMILARITY)
+
+        if n <= self.settings.consistency_exact_max_responses or (n * (n - 1) // 2 <= sample_size):
+            matrix = cluster_matrix[np.ix_(labels, labels)]
+            rows, cols = np.triu_indices(n, k=1)
+            return matrix[rows, cols], matrix
+
+        # Look up sampled pairs instead of materializing an n x n matrix
+        first, second = self._sample_pairs(n, sample_size)
+        return cluster_matrix[labels[first], labels[second]], None
+
+    def _similarity_matrix(self, responses: list[str]) -> npt.NDArray[np.float64]:
+        """
+        Compute the full pairwise similarity matrix for a set of responses.
+
+        Innovation: rapidfuzz's cdist scores all pairs in native code spread
+        across CPU cores, replacing n(n-1)/2 Python-level fuzz.ratio calls.
+
+        Args:
+            responses: List of LLM response texts.
+
+        Returns:
+            Symmetric (n, n) matrix of fuzz.ratio scores (0-100).
+        """
+        return process.cdist(
+            responses,
+            responses,
+            scorer=fuzz.ratio,
+            dtype=np.float64,
+            workers=self.settings.analysis_workers,
         )
 
+    def _sampled_similarities(
+        self,
+        responses: list[str],
+        sample_size: int,
+    ) -> npt.NDArray[np.float64]:
+        """
+        Score a uniform random sample of response pairs.
+
+        Innovation: The mean over k uniformly drawn pairs is an unbiased
+        estimate of the all-pairs mean with standard error std/sqrt(k),
+        so cost stays O(k) instead of O(n^2) for very large batches.
+
+        Args:
+            responses: List of LLM response texts.
+            sample_size: Number of pairs to score.
+
+        Returns:
+            Array of fuzz.ratio scores for the sampled pairs.
+        """
+        first, second = self._sample_pairs(len(responses), sample_size)
+        return process.cpdist(
+            [responses[i] for i in first],
+            [responses[j] for j in second],
+            scorer=fuzz.ratio,
+            dtype=np.float64,
+            workers=self.settings.analysis_workers,
+        )
+
+    def _sample_pairs(
+        self,
+        n: int,
+        sample_size: int,
+    ) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+        """
+        Draw uniform random pairs of distinct responses.
+
+        Args:
+            n: Number of responses.
+            sample_size: Number of pairs.
+
+        Returns:
+            Tuple of (first, second) index arrays with first != second.
+        """
+        rng = np.random.default_rng(CONSISTENCY_SAMPLE_SEED)
+        # Uniform over unordered pairs: draw i, then j from the other n - 1
+        first = rng.integers(n, size=sample_size)
+        second = rng.integers(n - 1, size=sample_size)
+        second += second >= first
+        return first, second
+
+    def _compute_intervals(
+        self,
+        matches: BrandMatches,
+        ranks: npt.NDArray[np.int64],
+        pair_scores: tuple[npt.NDArray[np.float64], npt.NDArray[np.float64] | None] | None,
+    ) -> dict[str, Any]:
+        """
+        Compute confidence intervals for the batch metrics.
+
+        Rates (visibility, top-1, top-3) get Wilson and Clopper-Pearson
+        intervals. Share of voice, mean rank and mean pairwise similarity get
+        percentile bootstrap intervals from a vectorized bootstrap over the
+        responses x brands matrices.
+
+        Innovation: Turns every headline metric into an interval at the
+        configured confidence level, so visibility differences between
+        brands or runs can be judged for significance.
+
+        Args:
+            matches: Brand occurrences from BrandMatcher.scan.
+            ranks: Rank matrix from rank_brands.
+            pair_scores: Result of score_pairs (None with fewer than two responses).
+
+        Returns:
+            Dictionary of intervals suitable for JSON storage.
+        """
+        confidence = self.settings.confidence_level
+        resamples = self.settings.bootstrap_resamples
+        total_responses = matches.counts.shape[0]
+        rng = np.random.default_rng(BOOTSTRAP_SEED)
+
+        def bounds(lower: Any, upper: Any) -> list[float | None]:
+            return [None if np.isnan(v) else float(v) for v in (lower, upper)]
+
+        present = ranks > 0
+        rate_counts = {
+            "visibility_rate": present.sum(axis=0),
+            "top1_rate": (ranks == 1).sum(axis=0),
+            "top3_rate": (present & (ranks <= 3)).sum(axis=0),
+        }
+        rate_intervals = {
+            name: (
+                wilson_interval(counts, total_responses, confidence),
+                clopper_pearson_interval(counts, total_responses, confidence),
+            )
+            for name, counts in rate_counts.items()
+        }
+
+        brand_bootstrap = None
+        if resamples > 0 and total_responses > 0:
+            shares, mean_ranks = bootstrap_brand_metrics(matches.counts, ranks, resamples, rng)
+            brand_bootstrap = (
+                percentile_interval(shares, confidence),
+                percentile_interval(mean_ranks, confidence),
+            )
+
+        brands: list[dict[str, Any]] = []
+        for index, brand in enumerate(matches.brands):
+            entry: dict[str, Any] = {"brand": brand}
+            for name, (wilson, exact) in rate_intervals.items():
+                entry[name] = {
+                    "wilson": bounds(wilson[0][index], wilson[1][index]),
+                    "clopper_pearson": bounds(exact[0][index], exact[1][index]),
+                }
+            if brand_bootstrap is not None:
+                (share_low, share_high), (rank_low, rank_high) = brand_bootstrap
+                entry["share_of_voice"] = bounds(share_low[index], share_high[index])
+                entry["mean_rank"] = bounds(rank_low[index], rank_high[index])
+            brands.append(entry)
+
+        intervals: dict[str, Any] = {
+            "confidence_level": confidence,
+            "bootstrap_resamples": resamples,
+            "brands": brands,
+        }
+
+        if pair_scores is not None and resamples > 0:
+            similarities, matrix = pair_scores
+            estimates = (
+                bootstrap_pairwise_mean(matrix, resamples, rng)
+                if matrix is not None
+                else bootstrap_mean(similarities, resamples, rng)
+            )
+            low, high = percentile_interval(estimates, confidence)
+            intervals["consistency"] = {"avg_similarity": bounds(low, high)}
+
+        return intervals
+
     def _compute_hallucination(
         self,
-        iterations: list[Any],
+        citations: list[str],
         domain_whitelist: list[str],
     ) -> HallucinationMetrics:
         """
@@ -433,7 +2036,7 @@ class AnalysisBuilder:
         "citation reliability" - a novel metric for AI-generated content.
 
         Args:
-            iterations: List of iteration results.
+            citations: Citation URLs across successful iterations.
             domain_whitelist: List of trusted domains.
 
         Returns:
@@ -442,43 +2045,24 @@ class AnalysisBuilder:
         total_citations = 0
         valid_citations = 0
         flagged_urls: list[str] = []
+        flagged_domains: Counter[str] = Counter()
 
-        # Normalize whitelist domains
-        whitelist_normalized = [d.lower().strip() for d in domain_whitelist]
-
-        for iteration in iterations:
-            if iteration.status != IterationStatus.SUCCESS:
-                continue
+        # Compiled once per whitelist; verdicts are memoized per host
+        whitelist = compile_whitelist(domain_whitelist)
 
-            # Check if response has citations (Perplexity-specific)
-            response = iteration.response
-            if response is None:
+        for url in citations:
+            if not url:
                 continue
 
-            # Handle PerplexityResponse with search_results
-            citations: list[str] = []
-            if isinstance(response, PerplexityResponse) and response.search_results:
-                citations = [sr.url for sr in response.search_results]
-            elif hasattr(response, "raw_response") and response.raw_response:
-                # Try to extract from raw response
-                raw = response.raw_response
-                if isinstance(raw, dict) and "search_results" in raw:
-                    citations = [sr.get("url", "") for sr in raw.get("search_results", [])]
-
-            for url in citations:
-                if not url:
-                    continue
-
-                total_citations += 1
+            total_citations += 1
 
-                # Extract domain from URL
-                domain = self._extract_domain(url)
-
-                # Check if domain is in whitelist
-                if any(w in domain.lower() for w in whitelist_normalized):
-                    valid_citations += 1
-                else:
-                    flagged_urls.append(url)
+            # Match the host against the whitelist on label boundaries
+            host = extract_host(url)
+            if whitelist.contains_host(host):
+                valid_citations += 1
+            else:
+                flagged_urls.append(url)
+                flagged_domains[registrable_domain(host) if host else url] += 1
 
         invalid_citations = total_citations - valid_citations
         hallucination_rate = invalid_citations / total_citations if total_citations > 0 else 0.0
@@ -489,26 +2073,9 @@ class AnalysisBuilder:
             invalid_citations=invalid_citations,
             hallucination_rate=hallucination_rate,
             flagged_urls=flagged_urls[:20],  # Limit to 20 examples
+            flagged_domains=dict(flagged_domains.most_common(20)),
         )
 
-    def _extract_domain(self, url: str) -> str:
-        """
-        Extract domain from a URL.
-
-        Args:
-            url: Full URL string.
-
-        Returns:
-            Domain portion of the URL.
-        """
-        # Simple domain extraction
-        url = url.lower()
-        if "://" in url:
-            url = url.split("://", 1)[1]
-        if "/" in url:
-            url = url.split("/", 1)[0]
-        return url
-
     def _build_raw_metrics(
         self,
         target_visibility: VisibilityMetrics | None,
@@ -517,6 +2084,11 @@ class AnalysisBuilder:
         consistency: ConsistencyMetrics,
         hallucination: HallucinationMetrics | None,
         total_responses: int,
+        rankings: list[RankMetrics] | None = None,
+        confidence_intervals: dict[str, Any] | None = None,
+        discovered_competitors: list[DiscoveredBrand] | None = None,
+        citations: CitationAnalytics | None = None,
+        clusters: ResponseClusters | None = None,
     ) -> dict[str, Any]:
         """
         Build a dictionary of all metrics for database storage.
@@ -535,6 +2107,10 @@ class AnalysisBuilder:
                 "max_similarity": consistency.max_similarity,
                 "std_deviation": consistency.std_deviation,
                 "consistency_score": consistency.consistency_score,
+                "method": consistency.method,
+                "sampled_pairs": consistency.sampled_pairs,
+                "margin_of_error": consistency.margin_of_error,
+                "metric": consistency.metric,
             },
         }
 
@@ -564,6 +2140,45 @@ class AnalysisBuilder:
                 {"brand": s.brand, "share": s.share, "rank": s.rank} for s in share_of_voice
             ]
 
+        if rankings:
+            metrics["rankings"] = [
+                {
+                    "brand": r.brand,
+                    "mean_rank": r.mean_rank,
+                    "rank_variance": r.rank_variance,
+                    "top1_rate": r.top1_rate,
+                    "top3_rate": r.top3_rate,
+                    "rank_distribution": r.rank_distribution,
+                }
+                for r in rankings
+            ]
+
+        if confidence_intervals:
+            metrics["confidence_intervals"] = confidence_intervals
+
+        if discovered_competitors:
+            metrics["discovered_competitors"] = [
+                {
+                    "brand": d.brand,
+                    "response_count": d.response_count,
+                    "mention_count": d.mention_count,
+                    "response_rate": d.response_rate,
+                    "variants": d.variants,
+                }
+                for d in discovered_competitors
+            ]
+
+        if citations:
+            metrics["citations"] = citations_to_dict(citations)
+
+        if clusters is not None:
+            metrics["diversity"] = {
+                "clusters": clusters.count,
+                "exact_clusters": clusters.exact_clusters,
+                "largest_cluster": int(clusters.sizes.max()),
+                "cluster_rate": clusters.diversity,
+            }
+
         if hallucination:
             metrics["hallucination"] = {
                 "total_citations": hallucination.total_citations,
@@ -571,24 +2186,25 @@ class AnalysisBuilder:
                 "invalid_citations": hallucination.invalid_citations,
                 "hallucination_rate": hallucination.hallucination_rate,
                 "flagged_urls": hallucination.flagged_urls,
+                "flagged_domains": hallucination.flagged_domains,
             }
 
         return metrics
 
-    def _empty_result(self, batch_result: BatchResult) -> AnalysisResult:
+    def _empty_result(self, payload: AnalysisPayload) -> AnalysisResult:
         """
         Create an empty result when no responses are available.
 
         Args:
-            batch_result: The batch result with no successful responses.
+            payload: The analysis payload with no successful responses.
 
         Returns:
             AnalysisResult with zero/empty metrics.
         """
         return AnalysisResult(
-            batch_id=str(batch_result.batch_id),
-            provider=batch_result.provider.value,
-            model=batch_result.model,
+            batch_id=payload.batch_id,
+            provider=payload.provider,
+            model=payload.model,
             total_responses=0,
             target_visibility=None,
             competitor_visibility=[],
@@ -0,0 +1,211 @@
+"""
+Process pool for CPU-bound analysis.
+
+This module runs AnalysisBuilder off the worker's asyncio event loop.
+Large batches are analyzed in a ProcessPoolExecutor that is started and
+warmed by the first large batch; small batches (and environments that
+cannot spawn processes) are analyzed in a thread.
+
+Every process that analyzes (each Celery prefork child, each API worker)
+owns its own pool, so a worker with concurrency C runs up to
+C x analysis_pool_size analysis processes. The pool is started lazily so
+idle children never spawn interpreters and boot stays within Celery's
+process start-up timeout.
+
+Innovation: Brand matching and pairwise similarity over large batches no
+longer stall database heartbeats and other coroutines, and concurrent
+analyses use separate cores instead of contending for one interpreter.
+"""
+
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+from backend.app.builders.analysis import (
+    ANALYSIS_SETTINGS,
+    AnalysisBuilder,
+    AnalysisPayload,
+    AnalysisResult,
+    BrandDictionary,
+)
+from backend.app.core.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+# Pool shared by all analyses in this process; None until started
+_pool: ProcessPoolExecutor | None = None
+# Set when process creation failed, so later analyses go straight to a thread
+_pool_unavailable = False
+
+# Builders reused by analyses inside a pool process, per analysis config
+_process_builders: dict[str, AnalysisBuilder] = {}
+
+
+def _analysis_config(settings: Settings) -> dict[str, Any]:
+    """Settings a pool process needs to analyze exactly like the caller."""
+    return settings.model_dump(include={*ANALYSIS_SETTINGS, "analysis_workers"})
+
+
+def _analyze(
+    payload: AnalysisPayload,
+    target_brands: list[str],
+    domain_whitelist: list[str] | None,
+    brand_dictionary_json: str | None,
+    config: dict[str, Any] | None = None,
+) -> AnalysisResult:
+    """Pool-process entry point: analyze one payload with the caller's config."""
+    key = json.dumps(config, sort_keys=True, default=str)
+    builder = _process_builders.get(key)
+    if builder is None:
+        settings = get_settings()
+        if config:
+            settings = settings.model_copy(update=config)
+        builder = _process_builders[key] = AnalysisBuilder(settings=settings)
+    brand_dictionary = (
+        BrandDictionary.from_json(brand_dictionary_json) if brand_dictionary_json else None
+    )
+    return builder.analyze_payload(
+        payload,
+        target_brands,
+        domain_whitelist=domain_whitelist,
+        brand_dictionary=brand_dictionary,
+    )
+
+
+def _warm_up() -> int:
+    """Pool-process warm-up: import and exercise the analysis stack once."""
+    _analyze(
+        AnalysisPayload(
+            batch_id="warm-up",
+            provider="warm-up",
+            model="warm-up",
+            responses=["1. Acme Cloud leads.", "Acme is popular, then Globex."],
+        ),
+        ["Acme", "Globex"],
+        None,
+        None,
+    )
+    return os.getpid()
+
+
+def _pool_size(settings: Settings) -> int:
+    """Resolve the configured pool size (-1 = all cores)."""
+    if settings.analysis_pool_size == -1:
+        return os.cpu_count() or 1
+    return settings.analysis_pool_size
+
+
+def start_analysis_pool(settings: Settings | None = None) -> ProcessPoolExecutor | None:
+    """
+    Start and warm the analysis process pool.
+
+    Every pool process imports the analysis stack and runs a tiny analysis
+    before the pool takes batches. Called by analyze_offloaded on the first
+    large batch; safe to call repeatedly.
+
+    Args:
+        settings: Application settings. Uses get_settings() if not provided.
+
+    Returns:
+        The running pool, or None if analysis runs in threads.
+    """
+    global _pool, _pool_unavailable
+    settings = settings or get_settings()
+    if _pool is not None or _pool_unavailable:
+        return _pool
+
+    size = _pool_size(settings)
+    if size == 0:
+        _pool_unavailable = True
+        return None
+
+    # Spawn so pool processes never inherit the worker's sockets or threads
+    pool = ProcessPoolExecutor(max_workers=size, mp_context=multiprocessing.get_context("spawn"))
+    try:
+        pids = {future.result() for future in [pool.submit(_warm_up) for _ in range(size)]}
+    except (AssertionError, OSError, BrokenProcessPool) as e:
+        # Daemonic (e.g. Celery prefork) processes cannot have children
+        logger.warning(f"Analysis process pool unavailable, analyzing in threads: {e}")
+        pool.shutdown(wait=False, cancel_futures=True)
+        _pool_unavailable = True
+        return None
+
+    logger.info(f"Analysis process pool started with {len(pids)} of {size} processes warm")
+    _pool = pool
+    return _pool
+
+
+def shutdown_analysis_pool() -> None:
+    """Stop the analysis process pool, if running."""
+    global _pool, _pool_unavailable
+    if _pool is not None:
+        _pool.shutdown(wait=True, cancel_futures=True)
+    _pool = None
+    _pool_unavailable = False
+
+
+async def analyze_offloaded(
+    payload: AnalysisPayload,
+    target_brands: list[str],
+    domain_whitelist: list[str] | None = None,
+    brand_dictionary: BrandDictionary | None = None,
+    settings: Settings | None = None,
+) -> AnalysisResult:
+    """
+    Analyze a payload without blocking the running event loop.
+
+    Batches with at least analysis_pool_min_responses responses go to the
+    process pool (started on first use); smaller
+    batches, or all batches when no pool is available, run in a thread.
+
+    Args:
+        payload: Responses and citations of the batch.
+        target_brands: List of brands to analyze (first is primary target).
+        domain_whitelist: Optional list of trusted domains for hallucination check.
+        brand_dictionary: Optional precompiled dictionary for target_brands.
+        settings: Application settings. Uses get_settings() if not provided.
+
+    Returns:
+        AnalysisResult: Complete analysis with all metrics.
+    """
+    global _pool
+    settings = settings or get_settings()
+    loop = asyncio.get_running_loop()
+
+    pool: Executor | None = None
+    if len(payload.responses) >= settings.analysis_pool_min_responses:
+        pool = _pool or await loop.run_in_executor(None, start_analysis_pool, settings)
+
+    if pool is not None:
+        dictionary_json = brand_dictionary.to_json() if brand_dictionary else None
+        try:
+            return await loop.run_in_executor(
+                pool,
+                _analyze,
+                payload,
+                target_brands,
+                domain_whitelist,
+                dictionary_json,
+                _analysis_config(settings),
+            )
+        except BrokenProcessPool as e:
+            # A pool process died (e.g. OOM-killed); release the broken
+            # pool's manager thread and survivors, and restart on next use
+            logger.warning(f"Analysis process pool broke, retrying in a thread: {e}")
+            pool.shutdown(wait=False, cancel_futures=True)
+            if _pool is pool:
+                _pool = None
+
+    builder = AnalysisBuilder(settings=settings)
+    return await asyncio.to_thread(
+        builder.analyze_payload,
+        payload,
+        target_brands,
+        domain_whitelist=domain_whitelist,
+        brand_dictionary=brand_dictionary,
+    )
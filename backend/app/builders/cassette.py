@@ -0,0 +1,451 @@
+"""
+Record/replay cassette provider for deterministic offline runs.
+
+This module provides a provider wrapper that records real `_make_request`
+exchanges into a compact gzip'd JSONL cassette and serves them back later
+with the original (or scaled) timing.
+
+A cassette is its main file plus a "<name>.d" directory of segments: each
+recording provider (one per batch) writes its own segment and flushes every
+exchange, so concurrent batches and worker processes never interleave
+writes and a crash loses at most the exchange in flight. Loading merges
+the main file and all segments.
+
+Innovation: Cassettes let us benchmark the AnalysisBuilder and the full
+worker pipeline against production-shaped response corpora with no network
+access and no API spend, while keeping runs fully reproducible.
+"""
+
+import asyncio
+import copy
+import gzip
+import hashlib
+import json
+import logging
+import os
+import time
+import uuid
+import zlib
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from time import perf_counter
+from typing import IO, Any
+
+from backend.app.builders.providers import (
+    BaseLLMProvider,
+    ProviderAuthError,
+    ProviderError,
+    RateLimitError,
+)
+from backend.app.schemas.llm import LLMProvider as LLMProviderEnum
+from backend.app.schemas.llm import LLMRequest, LLMResponse
+
+logger = logging.getLogger(__name__)
+
+
+class CassetteMode(str, Enum):
+    """Operating mode of a cassette provider."""
+
+    RECORD = "record"
+    REPLAY = "replay"
+
+
+@dataclass
+class CassetteEntry:
+    """
+    A single recorded provider exchange.
+
+    Attributes:
+        request_key: Stable digest of the request used for replay matching.
+        provider: Provider that served the request.
+        request: The unified request payload.
+        status_code: HTTP status (200 for success).
+        latency_ms: Observed latency of the original request.
+        response: Raw JSON response, or None if the request failed.
+        error_type: Name of the raised provider exception, if any.
+        error_message: Message of the raised provider exception, if any.
+        retry_after: Retry-After hint for recorded rate limits.
+    """
+
+    request_key: str
+    provider: str
+    request: dict[str, Any]
+    status_code: int
+    latency_ms: float
+    response: dict[str, Any] | None = None
+    error_type: str | None = None
+    error_message: str | None = None
+    retry_after: float | None = None
+
+    def to_json(self) -> str:
+        """Serialize the entry as a compact JSON line."""
+        return json.dumps(
+            {
+                "key": self.request_key,
+                "provider": self.provider,
+                "request": self.request,
+                "status": self.status_code,
+                "latency_ms": round(self.latency_ms, 3),
+                "response": self.response,
+                "error_type": self.error_type,
+                "error": self.error_message,
+                "retry_after": self.retry_after,
+            },
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_json(cls, line: str) -> "CassetteEntry":
+        """Deserialize an entry from a JSON line."""
+        data = json.loads(line)
+        return cls(
+            request_key=data["key"],
+            provider=data["provider"],
+            request=data.get("request") or {},
+            status_code=data.get("status", 200),
+            latency_ms=data.get("latency_ms", 0.0),
+            response=data.get("response"),
+            error_type=data.get("error_type"),
+            error_message=data.get("error"),
+            retry_after=data.get("retry_after"),
+        )
+
+
+@dataclass
+class CassetteStats:
+    """
+    Size and throughput report for a cassette.
+
+    Attributes:
+        entries: Number of exchanges stored in the cassette.
+        size_bytes: Compressed size on disk.
+        raw_bytes: Uncompressed JSONL size.
+        replayed: Number of exchanges served in replay mode.
+        replay_elapsed_s: Wall-clock time spanned by replayed requests.
+        replay_throughput: Replayed requests per second.
+    """
+
+    entries: int
+    size_bytes: int
+    raw_bytes: int
+    replayed: int
+    replay_elapsed_s: float
+    replay_throughput: float
+
+    @property
+    def compression_ratio(self) -> float:
+        """Ratio of uncompressed to compressed size."""
+        return self.raw_bytes / self.size_bytes if self.size_bytes > 0 else 0.0
+
+
+def _segment_dir(path: Path) -> Path:
+    """Directory holding the recorded segments of a cassette."""
+    return path.with_name(f"{path.name}.d")
+
+
+def cassette_files(path: str | Path) -> list[Path]:
+    """
+    List the files of a cassette.
+
+    Args:
+        path: Path to the gzip'd JSONL cassette.
+
+    Returns:
+        The main file (if present), then segments in recording order.
+    """
+    path = Path(path)
+    files = [path] if path.is_file() else []
+    segment_dir = _segment_dir(path)
+    if segment_dir.is_dir():
+        files.extend(sorted(segment_dir.glob("*.jsonl.gz")))
+    return files
+
+
+def _read_lines(path: Path) -> list[str]:
+    """Read the complete lines of a gzip'd file, tolerating a torn tail."""
+    lines: list[str] = []
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as fh:
+            lines.extend(fh)
+    except (EOFError, OSError, zlib.error) as e:
+        # Still recording, or the recorder died: keep every flushed exchange
+        logger.info(f"Cassette segment {path} ends mid-stream: {e}")
+    return [line for line in lines if line.endswith("\n") and line.strip()]
+
+
+def load_cassette(path: str | Path) -> list[CassetteEntry]:
+    """
+    Load all entries from a cassette and its recorded segments.
+
+    Args:
+        path: Path to the gzip'd JSONL cassette.
+
+    Returns:
+        List of recorded entries in recording order (per segment).
+    """
+    return [
+        CassetteEntry.from_json(line) for file in cassette_files(path) for line in _read_lines(file)
+    ]
+
+
+def request_key(provider: LLMProviderEnum, model: str, request: LLMRequest) -> str:
+    """
+    Compute the replay-matching key for a request.
+
+    Args:
+        provider: Provider the request targets.
+        model: Resolved model identifier.
+        request: The unified request.
+
+    Returns:
+        Hex digest identifying the request content.
+    """
+    payload = request.model_dump(mode="json")
+    payload["model"] = model
+    payload["provider"] = provider.value
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:32]
+
+
+class CassetteProvider(BaseLLMProvider):
+    """
+    Provider wrapper that records or replays `_make_request` exchanges.
+
+    In record mode every exchange of the wrapped provider (payload, raw JSON,
+    latency and status) is appended to this provider's own cassette segment
+    and flushed. In replay mode no network
+    calls are made; responses are served from the cassette, matched by request
+    content and cycled when a batch asks for more iterations than recorded.
+    A request with no recording fails unless unmatched requests are
+    explicitly allowed, in which case the cassette is replayed in recording
+    order regardless of the request.
+
+    Innovation: Because the wrapper sits below `generate`, everything above it
+    (retries, runner concurrency, analysis) behaves exactly as in production.
+    """
+
+    def __init__(
+        self,
+        inner: BaseLLMProvider,
+        path: str | Path,
+        mode: CassetteMode,
+        time_scale: float = 1.0,
+        allow_unmatched: bool = False,
+    ) -> None:
+        """
+        Initialize the cassette provider.
+
+        Args:
+            inner: Provider used for live requests and response parsing.
+            path: Path to the gzip'd JSONL cassette.
+            mode: Record or replay.
+            time_scale: Multiplier for recorded latencies on replay (0 = no delay).
+            allow_unmatched: Serve requests missing from the cassette with other
+                recorded responses instead of failing.
+        """
+        super().__init__(api_key=inner.api_key, base_url=inner.base_url, timeout=inner.timeout)
+        self.inner = inner
+        self.path = Path(path)
+        self.mode = mode
+        self.time_scale = time_scale
+        self.allow_unmatched = allow_unmatched
+
+        self._writer: IO[str] | None = None
+        self._raw_bytes = 0
+        self._recorded = 0
+
+        self._entries: list[CassetteEntry] = []
+        self._by_key: dict[str, list[CassetteEntry]] = {}
+        self._cursors: dict[str, int] = {}
+        self._fallback_cursor = 0
+        self._replayed = 0
+        self._replay_started: float | None = None
+        self._replay_finished: float | None = None
+
+        if mode == CassetteMode.REPLAY:
+            self._entries = load_cassette(self.path)
+            if not self._entries:
+                raise ProviderError(f"Cassette {self.path} is empty")
+            for entry in self._entries:
+                self._by_key.setdefault(entry.request_key, []).append(entry)
+                self._raw_bytes += len(entry.to_json()) + 1
+
+    @property
+    def provider_name(self) -> LLMProviderEnum:
+        """Return the wrapped provider's enum value."""
+        return self.inner.provider_name
+
+    @property
+    def default_model(self) -> str:
+        """Return the wrapped provider's default model."""
+        return self.inner.default_model
+
+    def _get_headers(self) -> dict[str, str]:
+        """Get the wrapped provider's headers."""
+        return self.inner._get_headers()
+
+    async def _make_request(self, request: LLMRequest) -> dict[str, Any]:
+        """
+        Record a live exchange or replay a stored one.
+
+        Args:
+            request: The unified LLM request.
+
+        Returns:
+            dict: Raw response (live or recorded).
+
+        Raises:
+            RateLimitError: If the (recorded) request was rate limited.
+            ProviderAuthError: If the (recorded) request failed authentication.
+            ProviderError: For other (recorded) API errors, or a request
+                missing from the cassette unless unmatched requests are allowed.
+        """
+        key = request_key(self.provider_name, request.model or self.default_model, request)
+        if self.mode == CassetteMode.REPLAY:
+            return await self._replay(key)
+        return await self._record(key, request)
+
+    async def _record(self, key: str, request: LLMRequest) -> dict[str, Any]:
+        """Forward a request to the wrapped provider and append the exchange."""
+        entry = CassetteEntry(
+            request_key=key,
+            provider=self.provider_name.value,
+            request=request.model_dump(mode="json"),
+            status_code=200,
+            latency_ms=0.0,
+        )
+        start_time = perf_counter()
+        try:
+            raw_response = await self.inner._make_request(request)
+        except RateLimitError as e:
+            entry.retry_after = e.retry_after
+            self._write_error(entry, e, 429, start_time)
+            raise
+        except ProviderAuthError as e:
+            self._write_error(entry, e, 401, start_time)
+            raise
+        except ProviderError as e:
+            self._write_error(entry, e, e.status_code or 0, start_time)
+            raise
+
+        entry.response = raw_response
+        entry.latency_ms = (perf_counter() - start_time) * 1000
+        self._write(entry)
+        return raw_response
+
+    async def _replay(self, key: str) -> dict[str, Any]:
+        """Serve the next recorded exchange for a request key."""
+        if self._replay_started is None:
+            self._replay_started = perf_counter()
+
+        candidates = self._by_key.get(key)
+        if candidates:
+            cursor = self._cursors.get(key, 0)
+            entry = candidates[cursor % len(candidates)]
+            self._cursors[key] = cursor + 1
+        elif self.allow_unmatched:
+            # Answers recorded for other requests, in recording order
+            if self._fallback_cursor == 0:
+                logger.warning(
+                    f"Cassette {self.path} has no recording for request {key}; "
+                    "replaying other recorded responses in recording order"
+                )
+            entry = self._entries[self._fallback_cursor % len(self._entries)]
+            self._fallback_cursor += 1
+        else:
+            raise ProviderError(
+                f"Cassette {self.path} has no recording for request {key} "
+                "(the prompt, model or sampling parameters differ from the recording)"
+            )
+
+        if self.time_scale > 0:
+            await asyncio.sleep(entry.latency_ms / 1000 * self.time_scale)
+
+        self._replayed += 1
+        self._replay_finished = perf_counter()
+
+        if entry.error_type == RateLimitError.__name__:
+            raise RateLimitError(entry.error_message or "", retry_after=entry.retry_after)
+        if entry.error_type == ProviderAuthError.__name__:
+            raise ProviderAuthError(entry.error_message or "")
+        if entry.error_type is not None or entry.response is None:
+            raise ProviderError(entry.error_message or "", status_code=entry.status_code)
+
+        # Hand out a copy so parsing never mutates the recorded entry
+        response: dict[str, Any] = copy.deepcopy(entry.response)
+        return response
+
+    def _parse_response(
+        self,
+        raw_response: dict[str, Any],
+        latency_ms: float,
+    ) -> LLMResponse:
+        """Delegate parsing to the wrapped provider."""
+        return self.inner._parse_response(raw_response, latency_ms)
+
+    def _write_error(
+        self,
+        entry: CassetteEntry,
+        error: Exception,
+        status_code: int,
+        start_time: float,
+    ) -> None:
+        """Record a failed exchange so replay reproduces the error."""
+        entry.status_code = status_code
+        entry.error_type = type(error).__name__
+        entry.error_message = str(error)
+        entry.latency_ms = (perf_counter() - start_time) * 1000
+        self._write(entry)
+
+    def _write(self, entry: CassetteEntry) -> None:
+        """Append an entry to this provider's segment and flush it to disk."""
+        if self._writer is None:
+            segment_dir = _segment_dir(self.path)
+            segment_dir.mkdir(parents=True, exist_ok=True)
+            # Sortable by start time, unique across processes and batches
+            name = f"{time.time_ns():020d}-{os.getpid()}-{uuid.uuid4().hex[:8]}.jsonl.gz"
+            self._writer = gzip.open(segment_dir / name, "wt", encoding="utf-8")  # noqa: SIM115
+        line = entry.to_json() + "\n"
+        self._writer.write(line)
+        self._writer.flush()
+        self._raw_bytes += len(line)
+        self._recorded += 1
+
+    def stats(self) -> CassetteStats:
+        """
+        Report cassette size and replay throughput.
+
+        Returns:
+            CassetteStats: Size on disk and replay throughput figures.
+        """
+        size_bytes = sum(file.stat().st_size for file in cassette_files(self.path))
+
+        elapsed = 0.0
+        if self._replay_started is not None and self._replay_finished is not None:
+            elapsed = self._replay_finished - self._replay_started
+
+        return CassetteStats(
+            entries=len(self._entries) if self.mode == CassetteMode.REPLAY else self._recorded,
+            size_bytes=size_bytes,
+            raw_bytes=self._raw_bytes,
+            replayed=self._replayed,
+            replay_elapsed_s=elapsed,
+            replay_throughput=self._replayed / elapsed if elapsed > 0 else 0.0,
+        )
+
+    async def close(self) -> None:
+        """Flush the cassette and close the wrapped provider."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+        stats = self.stats()
+        logger.info(
+            f"Cassette {self.path} ({self.mode.value}): {stats.entries} entries, "
+            f"{stats.size_bytes} bytes on disk, {stats.replayed} replayed "
+            f"at {stats.replay_throughput:.1f} req/s"
+        )
+
+        await self.inner.close()
+        await super().close()
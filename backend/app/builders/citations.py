@@ -0,0 +1,246 @@
+"""
+Citation source analytics over interned URL and host ids.
+
+This module analyzes the citations of grounded responses (Perplexity
+search results): which hosts are cited and how often, which hosts are
+cited alongside each brand, and how stable the cited sources are across
+the iterations of a batch.
+
+Innovation: URLs and hosts are interned into integer ids once per batch;
+every statistic is then a NumPy or sparse-matrix operation over the id
+arrays, so batches with thousands of citations are analyzed without
+per-citation string work beyond a single dictionary lookup.
+"""
+
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+from scipy import sparse
+
+from backend.app.builders.domains import DomainWhitelist, extract_host
+
+# Fixed seed so sampled source stability is reproducible across re-runs
+STABILITY_SAMPLE_SEED = 0
+
+
+@dataclass
+class HostCitations:
+    """
+    Citation statistics of one host.
+
+    Attributes:
+        host: Normalized host.
+        citations: Times the host was cited.
+        responses: Responses citing the host at least once.
+        response_rate: Proportion of responses with citations that cite it.
+        first_response: Index of the first analyzed response citing it.
+        trusted: Whether the host is whitelisted (None without a whitelist).
+    """
+
+    host: str
+    citations: int
+    responses: int
+    response_rate: float
+    first_response: int
+    trusted: bool | None = None
+
+
+@dataclass
+class CitationAnalytics:
+    """
+    Citation source analytics for a batch.
+
+    Attributes:
+        total_citations: Citations across all responses.
+        unique_urls: Distinct cited URLs.
+        unique_hosts: Distinct cited hosts.
+        responses_with_citations: Responses citing at least one source.
+        hosts: Most cited hosts, most cited first.
+        url_stability: Mean pairwise Jaccard similarity of the responses'
+            cited URL sets (None with fewer than two citing responses).
+        host_stability: Same over cited host sets.
+        stability_method: "exact" (all pairs) or "sampled".
+        co_citations: Per brand, the hosts most often cited in responses
+            mentioning it, with response counts.
+    """
+
+    total_citations: int
+    unique_urls: int
+    unique_hosts: int
+    responses_with_citations: int
+    hosts: list[HostCitations]
+    url_stability: float | None
+    host_stability: float | None
+    stability_method: str = "exact"
+    co_citations: dict[str, dict[str, int]] = field(default_factory=dict)
+
+
+def _incidence(
+    rows: npt.NDArray[np.int64],
+    ids: npt.NDArray[np.int64],
+    shape: tuple[int, int],
+) -> sparse.csr_matrix:
+    """Binary rows x ids incidence matrix (duplicates collapsed)."""
+    matrix = sparse.csr_matrix(
+        (np.ones(len(ids), dtype=np.float64), (rows, ids)),
+        shape=shape,
+    )
+    matrix.data[:] = 1.0
+    return matrix
+
+
+def _mean_jaccard(
+    incidence: sparse.csr_matrix,
+    exact_max_rows: int,
+    sample_pairs: int,
+) -> tuple[float | None, bool]:
+    """
+    Mean pairwise Jaccard similarity of the rows of a binary matrix.
+
+    Args:
+        incidence: Binary (sets x elements) matrix, no empty rows.
+        exact_max_rows: Above this many rows, pairs are sampled.
+        sample_pairs: Number of sampled pairs.
+
+    Returns:
+        Tuple of (mean similarity or None with fewer than two rows,
+        whether pairs were sampled).
+    """
+    n = incidence.shape[0]
+    if n < 2:
+        return None, False
+    sizes = np.asarray(incidence.sum(axis=1)).ravel()
+
+    if n <= exact_max_rows or n * (n - 1) // 2 <= sample_pairs:
+        first, second = np.triu_indices(n, k=1)
+        overlap = (incidence @ incidence.T).toarray()[first, second]
+        sampled = False
+    else:
+        rng = np.random.default_rng(STABILITY_SAMPLE_SEED)
+        first = rng.integers(0, n, size=sample_pairs)
+        second = (first + rng.integers(1, n, size=sample_pairs)) % n
+        overlap = np.asarray(incidence[first].multiply(incidence[second]).sum(axis=1)).ravel()
+        sampled = True
+
+    union = sizes[first] + sizes[second] - overlap
+    return float((overlap / union).mean()), sampled
+
+
+def analyze_citations(
+    citations: list[list[str]],
+    presence: npt.NDArray[np.bool_] | None = None,
+    brands: list[str] | None = None,
+    whitelist: DomainWhitelist | None = None,
+    top_hosts: int = 50,
+    co_cited_hosts: int = 10,
+    exact_max_responses: int = 300,
+    sample_pairs: int = 2000,
+) -> CitationAnalytics | None:
+    """
+    Compute citation source analytics for a batch.
+
+    Args:
+        citations: Cited URLs of each response, in response order.
+        presence: Optional (responses, brands) mask of brand mentions,
+            aligned with citations, for co-citation.
+        brands: Brand names of the presence columns.
+        whitelist: Optional compiled whitelist to flag trusted hosts.
+        top_hosts: Number of hosts reported.
+        co_cited_hosts: Number of co-cited hosts reported per brand.
+        exact_max_responses: Above this many citing responses, source
+            stability is estimated from sampled pairs.
+        sample_pairs: Number of sampled pairs.
+
+    Returns:
+        CitationAnalytics, or None if no response cites a source.
+    """
+    # Intern URLs once; everything below works on integer ids
+    url_ids: dict[str, int] = {}
+    rows: list[int] = []
+    ids: list[int] = []
+    for row, urls in enumerate(citations):
+        for url in urls:
+            if url:
+                rows.append(row)
+                ids.append(url_ids.setdefault(url, len(url_ids)))
+    if not ids:
+        return None
+
+    host_ids: dict[str, int] = {}
+    host_of_url = np.fromiter(
+        (host_ids.setdefault(extract_host(url), len(host_ids)) for url in url_ids),
+        dtype=np.int64,
+        count=len(url_ids),
+    )
+    hosts = list(host_ids)
+    response_index = np.asarray(rows, dtype=np.int64)
+    url_id = np.asarray(ids, dtype=np.int64)
+    host_id = host_of_url[url_id]
+
+    n_responses = len(citations)
+    citing = np.unique(response_index)
+    url_matrix = _incidence(response_index, url_id, (n_responses, len(url_ids)))
+    host_matrix = _incidence(response_index, host_id, (n_responses, len(hosts)))
+
+    # Per-host frequency, coverage and first appearance
+    host_citations = np.bincount(host_id, minlength=len(hosts))
+    host_responses = np.asarray(host_matrix.sum(axis=0)).ravel().astype(np.int64)
+    first_response = np.full(len(hosts), n_responses, dtype=np.int64)
+    np.minimum.at(first_response, host_id, response_index)
+
+    # Unparseable URLs have no host to report
+    reportable = np.array([host != "" for host in hosts], dtype=np.bool_)
+    order = np.lexsort((-host_responses, -host_citations))
+    order = order[reportable[order]][:top_hosts]
+    host_metrics = [
+        HostCitations(
+            host=hosts[index],
+            citations=int(host_citations[index]),
+            responses=int(host_responses[index]),
+            response_rate=int(host_responses[index]) / len(citing),
+            first_response=int(first_response[index]),
+            trusted=whitelist.contains_host(hosts[index]) if whitelist is not None else None,
+        )
+        for index in order
+    ]
+
+    url_stability, sampled = _mean_jaccard(url_matrix[citing], exact_max_responses, sample_pairs)
+    host_stability, _ = _mean_jaccard(host_matrix[citing], exact_max_responses, sample_pairs)
+
+    # Brands x hosts counts of responses mentioning the brand and citing the host
+    co_citations: dict[str, dict[str, int]] = {}
+    if presence is not None and brands:
+        counts = (sparse.csr_matrix(presence.astype(np.float64)).T @ host_matrix).toarray()
+        counts[:, ~reportable] = 0
+        for column, brand in enumerate(brands):
+            top = np.argsort(-counts[column], kind="stable")[:co_cited_hosts]
+            co_citations[brand] = {
+                hosts[index]: int(counts[column, index]) for index in top if counts[column, index]
+            }
+
+    return CitationAnalytics(
+        total_citations=len(ids),
+        unique_urls=len(url_ids),
+        unique_hosts=int(reportable.sum()),
+        responses_with_citations=len(citing),
+        hosts=host_metrics,
+        url_stability=url_stability,
+        host_stability=host_stability,
+        stability_method="sampled" if sampled else "exact",
+        co_citations=co_citations,
+    )
+
+
+def citations_to_dict(analytics: CitationAnalytics) -> dict[str, Any]:
+    """
+    Serialize citation analytics for JSON storage.
+
+    Args:
+        analytics: The computed analytics.
+
+    Returns:
+        Dictionary suitable for the stored metrics.
+    """
+    return asdict(analytics)
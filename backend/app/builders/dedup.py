@@ -0,0 +1,220 @@
+"""
+Near-duplicate clustering of responses.
+
+At low temperatures many iterations of a batch return identical or
+near-identical text. This module groups them so the expensive metrics
+(brand matching, competitor discovery, pairwise consistency) run once
+per cluster representative and are weighted by cluster size.
+
+Responses are first grouped by exact normalized content, then distinct
+contents are fingerprinted with a 64-bit SimHash over word shingles and
+merged when their fingerprints differ in at most a few bits. Candidate
+pairs come from banded LSH (pigeonhole: two fingerprints within distance
+d agree exactly on at least one of d + 1 bands), so only bucket mates
+are compared.
+
+Brand matching only ever collapses exact duplicates: near duplicates can
+differ in exactly the brand they name, so they are used for consistency
+scoring and the diversity metric only.
+
+Innovation: Analysis cost follows the number of distinct responses
+instead of the number of iterations, and the cluster count doubles as a
+diversity metric for the batch.
+"""
+
+import re
+from dataclasses import dataclass, field
+from zlib import crc32
+
+import numpy as np
+import numpy.typing as npt
+
+from backend.app.builders.normalization import NormalizedResponse
+
+# Words per shingle fingerprinted by SimHash
+SHINGLE_SIZE = 3
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+@dataclass
+class ResponseClusters:
+    """
+    Responses grouped into exact and near-duplicate clusters.
+
+    Attributes:
+        labels: Cluster index of each response, in response order.
+        representatives: Index of the first response of each cluster.
+        sizes: Number of responses in each cluster.
+        exact_clusters: Clusters of exactly identical normalized text
+            (before near-duplicate merging).
+        duplicates: Grouping of exactly identical responses only, when
+            near-duplicate merging changed it (see exact).
+    """
+
+    labels: npt.NDArray[np.int64]
+    representatives: npt.NDArray[np.int64]
+    sizes: npt.NDArray[np.int64]
+    exact_clusters: int
+    duplicates: "ResponseClusters | None" = field(default=None, repr=False)
+
+    @property
+    def exact(self) -> "ResponseClusters":
+        """Grouping of exactly identical responses only."""
+        return self.duplicates or self
+
+    @property
+    def count(self) -> int:
+        """Number of clusters."""
+        return len(self.representatives)
+
+    @property
+    def diversity(self) -> float:
+        """Clusters per response (1.0 = every response distinct)."""
+        return self.count / len(self.labels) if len(self.labels) else 0.0
+
+
+def _mix64(values: npt.NDArray[np.uint64]) -> npt.NDArray[np.uint64]:
+    """SplitMix64 finalizer: spreads integer ids over all 64 bits."""
+    values = values + np.uint64(0x9E3779B97F4A7C15)
+    values = (values ^ (values >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    values = (values ^ (values >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+
+def simhash(text: str, token_hashes: dict[str, int] | None = None) -> int:
+    """
+    64-bit SimHash of a text over its word shingles.
+
+    Words are hashed with CRC32 (stable across processes, unlike hash())
+    and mixed to 64 bits; texts shorter than a shingle use their words.
+
+    Args:
+        text: Text to fingerprint (already casefolded).
+        token_hashes: Optional memo of mixed word hashes shared across calls.
+
+    Returns:
+        The fingerprint as an unsigned 64-bit integer (0 for no words).
+    """
+    if token_hashes is None:
+        token_hashes = {}
+    words = _WORD_PATTERN.findall(text)
+    if not words:
+        return 0
+
+    missing = set(words).difference(token_hashes)
+    if missing:
+        crcs = np.fromiter((crc32(word.encode()) for word in missing), dtype=np.uint64)
+        token_hashes.update(zip(missing, _mix64(crcs).tolist(), strict=True))
+    features = np.array(list(map(token_hashes.__getitem__, words)), dtype=np.uint64)
+    if len(words) >= SHINGLE_SIZE:
+        shingles = features[: len(words) - SHINGLE_SIZE + 1].copy()
+        for offset in range(1, SHINGLE_SIZE):
+            rotated = features[offset : len(words) - SHINGLE_SIZE + 1 + offset]
+            rotated = (rotated << np.uint64(offset)) | (rotated >> np.uint64(64 - offset))
+            shingles ^= rotated
+        features = _mix64(shingles)
+
+    bits = np.unpackbits(features.view(np.uint8).reshape(-1, 8), axis=1, bitorder="little")
+    majority = 2 * bits.sum(axis=0, dtype=np.int64) > len(features)
+    return int(np.packbits(majority, bitorder="little").view(np.uint64)[0])
+
+
+def _find(parents: list[int], node: int) -> int:
+    """Union-find root of a node, with path halving."""
+    while parents[node] != node:
+        parents[node] = parents[parents[node]]
+        node = parents[node]
+    return node
+
+
+def cluster_responses(
+    responses: list[NormalizedResponse],
+    max_distance: int = 3,
+) -> ResponseClusters:
+    """
+    Group responses into exact and near-duplicate clusters.
+
+    Args:
+        responses: Normalized responses of a batch.
+        max_distance: Maximum SimHash Hamming distance between near
+            duplicates (0 = exact duplicates only).
+
+    Returns:
+        ResponseClusters: Labels, representatives and sizes, with clusters
+        numbered in order of their first response.
+    """
+    # Exact duplicates share their normalized, casefolded text
+    content_ids: dict[str, int] = {}
+    content_labels = np.fromiter(
+        (content_ids.setdefault(response.folded, len(content_ids)) for response in responses),
+        dtype=np.int64,
+        count=len(responses),
+    )
+    contents = list(content_ids)
+    parents = list(range(len(contents)))
+
+    if max_distance > 0 and len(contents) > 1:
+        token_hashes: dict[str, int] = {}
+        fingerprints = np.fromiter(
+            (simhash(content, token_hashes) for content in contents),
+            dtype=np.uint64,
+            count=len(contents),
+        )
+
+        bands = max_distance + 1
+        width = 64 // bands
+        mask = np.uint64((1 << width) - 1)
+        for band in range(bands):
+            keys = (fingerprints >> np.uint64(band * width)) & mask
+            order = np.argsort(keys, kind="stable")
+            sorted_keys = keys[order]
+            run_starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+            run_ends = np.r_[run_starts[1:], len(order)]
+            for start, end in zip(run_starts, run_ends, strict=True):
+                if end - start < 2:
+                    continue
+                members = order[start:end]
+                # Bucket mates are candidates; confirm them by Hamming distance
+                for i, first in enumerate(members[:-1]):
+                    others = members[i + 1 :]
+                    distances = np.bitwise_count(fingerprints[others] ^ fingerprints[first])
+                    for other in others[distances <= max_distance]:
+                        root, other_root = _find(parents, int(first)), _find(parents, int(other))
+                        if root != other_root:
+                            parents[max(root, other_root)] = min(root, other_root)
+
+    # Roots are the smallest content id of each cluster, so clusters are
+    # numbered by first appearance
+    roots = np.fromiter(
+        (_find(parents, index) for index in range(len(contents))),
+        dtype=np.int64,
+        count=len(contents),
+    )
+    root_ids, cluster_of_content = np.unique(roots, return_inverse=True)
+    duplicates = _grouping(content_labels, len(contents))
+    if len(root_ids) == len(contents):
+        return duplicates
+    return _grouping(
+        cluster_of_content[content_labels],
+        len(root_ids),
+        duplicates=duplicates,
+    )
+
+
+def _grouping(
+    labels: npt.NDArray[np.int64],
+    count: int,
+    duplicates: ResponseClusters | None = None,
+) -> ResponseClusters:
+    """Clusters from per-response labels numbered by first appearance."""
+    sizes = np.bincount(labels, minlength=count)
+    representatives = np.full(count, len(labels), dtype=np.int64)
+    np.minimum.at(representatives, labels, np.arange(len(labels), dtype=np.int64))
+    return ResponseClusters(
+        labels=labels,
+        representatives=representatives,
+        sizes=sizes,
+        exact_clusters=duplicates.count if duplicates is not None else count,
+        duplicates=duplicates,
+    )
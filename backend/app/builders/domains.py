@@ -0,0 +1,215 @@
+"""
+Trusted-domain whitelist for citation validation.
+
+This module parses citation URLs into hosts and checks them against a
+whitelist of trusted domains on label boundaries: a whitelisted domain
+trusts itself and all of its subdomains, and nothing else. Substring
+look-alikes such as "notsalesforce.com.evil.io" are rejected.
+
+Innovation: The whitelist is compiled once into a hashed set of
+label suffixes, so each host costs one set lookup per label instead of
+a scan over thousands of trusted domains, and verdicts are memoized per
+host because citations repeat heavily across Monte Carlo iterations.
+"""
+
+import ipaddress
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+# Multi-label public suffixes under which registrations happen one level
+# deeper (bbc.co.uk, not co.uk); covers the common ccTLD second levels
+_SECOND_LEVEL_LABELS = frozenset(
+    {"ac", "co", "com", "edu", "gov", "gv", "ltd", "me", "mil", "ne", "net", "or", "org", "plc"}
+)
+
+# Bound on memoized host verdicts per whitelist
+VERDICT_CACHE_SIZE = 100_000
+
+
+def _normalize_host(host: str) -> str:
+    """Lowercase a host, drop a trailing root dot and IDNA-encode it."""
+    host = host.strip().lower().rstrip(".")
+    if host.isascii():
+        return host
+    try:
+        return host.encode("idna").decode("ascii")
+    except UnicodeError:
+        return host
+
+
+def _is_ip_address(host: str) -> bool:
+    """Whether a host is an IPv4 or IPv6 literal."""
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=65_536)
+def extract_host(url: str) -> str:
+    """
+    Extract the normalized host of a URL.
+
+    Handles schemes, userinfo, ports, IPv6 literals and scheme-less URLs
+    such as "example.com/page". Results are memoized per URL string.
+
+    Args:
+        url: URL (or bare host) string.
+
+    Returns:
+        Lowercase host, or "" if none can be parsed.
+    """
+    url = url.strip()
+    if "://" not in url and not url.startswith("//"):
+        url = "//" + url
+    try:
+        host = urlsplit(url).hostname
+    except ValueError:
+        return ""
+    return _normalize_host(host) if host else ""
+
+
+def registrable_domain(host: str) -> str:
+    """
+    Approximate the registrable domain of a host.
+
+    Keeps the last two labels, or three when the second-to-last label is
+    a common second-level suffix under a country code (bbc.co.uk).
+
+    Args:
+        host: Normalized host.
+
+    Returns:
+        Registrable domain (the host itself for IPs and single labels).
+    """
+    if _is_ip_address(host):
+        return host
+    labels = host.split(".")
+    if len(labels) <= 2:
+        return host
+    keep = 3 if len(labels[-1]) == 2 and labels[-2] in _SECOND_LEVEL_LABELS else 2
+    return ".".join(labels[-keep:])
+
+
+@dataclass
+class DomainWhitelist:
+    """
+    Compiled set of trusted domains.
+
+    Entries may be bare domains ("salesforce.com"), URLs, wildcard
+    patterns ("*.gov.uk") or suffixes (".edu"); a leading "www." is
+    dropped so "www.example.com" trusts all of example.com. A bare label
+    without a dot ("salesforce") trusts every registrable domain with
+    that name (salesforce.com, salesforce.co.uk and their subdomains),
+    which keeps whitelists written for the former substring matching
+    working without trusting look-alikes such as notsalesforce.com.
+
+    Attributes:
+        domains: Normalized trusted domains.
+        labels: Trusted registrable-domain names from bare-label entries.
+    """
+
+    domains: frozenset[str]
+    labels: frozenset[str] = frozenset()
+    _verdicts: dict[str, bool] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def build(cls, entries: Iterable[str]) -> "DomainWhitelist":
+        """
+        Compile a whitelist from raw entries.
+
+        Args:
+            entries: Trusted domains, URLs or wildcard patterns.
+
+        Returns:
+            DomainWhitelist: The compiled whitelist.
+        """
+        domains: set[str] = set()
+        labels: set[str] = set()
+        for entry in entries:
+            entry = entry.strip().lower()
+            suffix = entry.startswith(("*", "."))
+            entry = entry.lstrip("*").lstrip(".")
+            host = extract_host(entry) if entry else ""
+            if host.startswith("www.") and host.count(".") > 1:
+                host = host[4:]
+            if not host:
+                continue
+            if "." in host or suffix or _is_ip_address(host):
+                domains.add(host)
+            else:
+                labels.add(host)
+        return cls(domains=frozenset(domains), labels=frozenset(labels))
+
+    def contains_host(self, host: str) -> bool:
+        """
+        Check whether a normalized host is trusted.
+
+        Args:
+            host: Normalized host (see extract_host).
+
+        Returns:
+            True if the host or one of its parent domains is whitelisted.
+        """
+        verdict = self._verdicts.get(host)
+        if verdict is not None:
+            return verdict
+
+        verdict = self._lookup(host)
+        if len(self._verdicts) >= VERDICT_CACHE_SIZE:
+            self._verdicts.clear()
+        self._verdicts[host] = verdict
+        return verdict
+
+    def _lookup(self, host: str) -> bool:
+        """Walk the host's label suffixes from longest to shortest."""
+        if not host:
+            return False
+        if host in self.domains:
+            return True
+        if _is_ip_address(host):
+            # IPs are trusted only by exact match
+            return False
+        dot = host.find(".")
+        while dot != -1:
+            if host[dot + 1 :] in self.domains:
+                return True
+            dot = host.find(".", dot + 1)
+        return bool(self.labels) and registrable_domain(host).split(".", 1)[0] in self.labels
+
+    def contains_url(self, url: str) -> bool:
+        """
+        Check whether a URL's host is trusted.
+
+        Args:
+            url: Citation URL.
+
+        Returns:
+            True if the URL points to a whitelisted domain.
+        """
+        return self.contains_host(extract_host(url))
+
+
+@lru_cache(maxsize=32)
+def _compile(entries: tuple[str, ...]) -> DomainWhitelist:
+    """Compile a whitelist once per distinct entry tuple."""
+    return DomainWhitelist.build(entries)
+
+
+def compile_whitelist(entries: Iterable[str]) -> DomainWhitelist:
+    """
+    Get the compiled whitelist for a list of entries.
+
+    Compiled whitelists (and their memoized verdicts) are shared across
+    analyses of the same whitelist within a process.
+
+    Args:
+        entries: Trusted domains, URLs or wildcard patterns.
+
+    Returns:
+        DomainWhitelist: The compiled whitelist.
+    """
+    return _compile(tuple(sorted(set(entries))))
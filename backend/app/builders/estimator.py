@@ -0,0 +1,312 @@
+"""
+Pre-flight token and cost estimation for probabilistic batches.
+
+This module estimates prompt and completion tokens and the dollar cost of
+a batch before any provider call is made, and picks a per-batch concurrency
+that fits the provider's request and token budgets.
+
+Innovation: Sizing batches up front turns an N-iteration Monte Carlo run
+from an open-ended spend into a priced, rate-limit-aware plan, and gives
+the runner a cost ceiling it can enforce mid-batch.
+"""
+
+import math
+import re
+from dataclasses import dataclass
+
+from backend.app.core.config import Settings, get_settings
+from backend.app.schemas.llm import LLMProvider, UsageInfo
+
+# Rough per-message framing overhead (role markers, separators)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+_WORD_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+
+@dataclass(frozen=True)
+class ModelPricing:
+    """
+    List prices for a model in USD.
+
+    Attributes:
+        input_per_million: Price per million prompt tokens.
+        output_per_million: Price per million completion tokens.
+        per_request: Flat fee per request (e.g. Perplexity search fees).
+    """
+
+    input_per_million: float
+    output_per_million: float
+    per_request: float = 0.0
+
+
+# Innovation: A local price table keeps estimation free of network calls.
+# Unknown models fall back to the provider default below.
+MODEL_PRICING: dict[tuple[LLMProvider, str], ModelPricing] = {
+    (LLMProvider.PERPLEXITY, "sonar"): ModelPricing(1.0, 1.0, 0.005),
+    (LLMProvider.PERPLEXITY, "sonar-pro"): ModelPricing(3.0, 15.0, 0.006),
+    (LLMProvider.PERPLEXITY, "sonar-reasoning-pro"): ModelPricing(2.0, 8.0, 0.006),
+    (LLMProvider.PERPLEXITY, "sonar-deep-research"): ModelPricing(2.0, 8.0, 0.005),
+    (LLMProvider.OPENAI, "gpt-4o"): ModelPricing(2.5, 10.0),
+    (LLMProvider.OPENAI, "gpt-4o-mini"): ModelPricing(0.15, 0.6),
+    (LLMProvider.OPENAI, "gpt-4-turbo"): ModelPricing(10.0, 30.0),
+    (LLMProvider.ANTHROPIC, "claude-sonnet-4-20250514"): ModelPricing(3.0, 15.0),
+    (LLMProvider.ANTHROPIC, "claude-3-5-sonnet-20241022"): ModelPricing(3.0, 15.0),
+    (LLMProvider.ANTHROPIC, "claude-3-5-haiku-20241022"): ModelPricing(0.8, 4.0),
+}
+
+PROVIDER_DEFAULT_PRICING: dict[LLMProvider, ModelPricing] = {
+    LLMProvider.PERPLEXITY: ModelPricing(1.0, 1.0, 0.005),
+    LLMProvider.OPENAI: ModelPricing(2.5, 10.0),
+    LLMProvider.ANTHROPIC: ModelPricing(3.0, 15.0),
+    # Self-hosted endpoints have no per-token list price
+    LLMProvider.OPENAI_COMPATIBLE: ModelPricing(0.0, 0.0),
+}
+
+# Prompt-cache price multipliers relative to the input price: (read, write)
+CACHE_PRICE_MULTIPLIERS: dict[LLMProvider, tuple[float, float]] = {
+    LLMProvider.PERPLEXITY: (1.0, 1.0),
+    LLMProvider.OPENAI: (0.5, 1.0),
+    LLMProvider.ANTHROPIC: (0.1, 1.25),
+    LLMProvider.OPENAI_COMPATIBLE: (1.0, 1.0),
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Approximate the token count of a text without a provider tokenizer.
+
+    Uses the larger of two common BPE approximations: ~4 characters per
+    token, and ~1.3 tokens per word/punctuation unit.
+
+    Args:
+        text: Text to estimate.
+
+    Returns:
+        Estimated token count.
+    """
+    if not text:
+        return 0
+    by_chars = len(text) / 4
+    by_words = len(_WORD_PATTERN.findall(text)) * 1.3
+    return math.ceil(max(by_chars, by_words))
+
+
+def get_pricing(provider: LLMProvider, model: str) -> ModelPricing:
+    """
+    Look up pricing for a (provider, model) pair.
+
+    Args:
+        provider: The LLM provider.
+        model: Model identifier.
+
+    Returns:
+        ModelPricing for the model, or the provider default.
+    """
+    return MODEL_PRICING.get((provider, model), PROVIDER_DEFAULT_PRICING[provider])
+
+
+@dataclass
+class PreflightEstimate:
+    """
+    Pre-flight sizing of a batch.
+
+    Attributes:
+        provider: LLM provider the batch targets.
+        model: Resolved model identifier.
+        iterations: Planned iteration count.
+        prompt_tokens: Estimated prompt tokens per iteration.
+        completion_tokens: Estimated completion tokens per iteration.
+        completion_source: Where the completion estimate came from
+            ("history", "max_tokens" or "default").
+        cost_per_iteration_usd: Estimated cost of one iteration.
+        estimated_cost_usd: Estimated cost of the whole batch.
+        tokens_per_minute: Token budget the batch must fit into.
+        recommended_concurrency: Concurrency that fits the request and token budgets.
+    """
+
+    provider: LLMProvider
+    model: str
+    iterations: int
+    prompt_tokens: int
+    completion_tokens: int
+    completion_source: str
+    cost_per_iteration_usd: float
+    estimated_cost_usd: float
+    tokens_per_minute: int
+    recommended_concurrency: int
+
+    @property
+    def tokens_per_iteration(self) -> int:
+        """Estimated total tokens per iteration."""
+        return self.prompt_tokens + self.completion_tokens
+
+    @property
+    def estimated_total_tokens(self) -> int:
+        """Estimated total tokens for the batch."""
+        return self.tokens_per_iteration * self.iterations
+
+    def to_dict(self) -> dict[str, float | int | str]:
+        """Serialize the estimate for metrics storage."""
+        return {
+            "provider": self.provider.value,
+            "model": self.model,
+            "iterations": self.iterations,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "completion_source": self.completion_source,
+            "estimated_total_tokens": self.estimated_total_tokens,
+            "cost_per_iteration_usd": self.cost_per_iteration_usd,
+            "estimated_cost_usd": self.estimated_cost_usd,
+            "tokens_per_minute": self.tokens_per_minute,
+            "recommended_concurrency": self.recommended_concurrency,
+        }
+
+
+class CostEstimator:
+    """
+    Estimates tokens, cost and concurrency before a batch runs.
+
+    Innovation: Combines a local tokenizer approximation for the prompt with
+    historical completion-token averages per (provider, model), so estimates
+    improve as more experiments are run.
+    """
+
+    def __init__(self, settings: Settings | None = None) -> None:
+        """
+        Initialize the estimator.
+
+        Args:
+            settings: Application settings. Uses get_settings() if not provided.
+        """
+        self.settings = settings or get_settings()
+
+    def estimate(
+        self,
+        prompt: str,
+        provider: LLMProvider,
+        model: str,
+        iterations: int,
+        max_concurrency: int,
+        system_prompt: str | None = None,
+        max_tokens: int | None = None,
+        historical_completion_tokens: float | None = None,
+        historical_latency_ms: float | None = None,
+    ) -> PreflightEstimate:
+        """
+        Estimate tokens and cost for a batch and size its concurrency.
+
+        Args:
+            prompt: The user prompt.
+            provider: The LLM provider.
+            model: Resolved model identifier.
+            iterations: Planned iteration count.
+            max_concurrency: Upper bound on concurrency from the batch config.
+            system_prompt: Optional system prompt.
+            max_tokens: Optional completion token cap.
+            historical_completion_tokens: Average completion tokens from past runs.
+            historical_latency_ms: Average latency from past runs.
+
+        Returns:
+            PreflightEstimate: The batch sizing plan.
+        """
+        prompt_tokens = estimate_tokens(prompt) + MESSAGE_OVERHEAD_TOKENS
+        if system_prompt:
+            prompt_tokens += estimate_tokens(system_prompt) + MESSAGE_OVERHEAD_TOKENS
+
+        if historical_completion_tokens:
+            completion_tokens = math.ceil(historical_completion_tokens)
+            completion_source = "history"
+            if max_tokens is not None:
+                completion_tokens = min(completion_tokens, max_tokens)
+        elif max_tokens is not None:
+            completion_tokens = max_tokens
+            completion_source = "max_tokens"
+        else:
+            completion_tokens = self.settings.default_completion_tokens
+            completion_source = "default"
+
+        pricing = get_pricing(provider, model)
+        cost_per_iteration = self._cost(pricing, prompt_tokens, completion_tokens)
+
+        concurrency = self.recommend_concurrency(
+            tokens_per_iteration=prompt_tokens + completion_tokens,
+            latency_ms=historical_latency_ms or self.settings.default_latency_ms,
+            max_concurrency=max_concurrency,
+        )
+
+        return PreflightEstimate(
+            provider=provider,
+            model=model,
+            iterations=iterations,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            completion_source=completion_source,
+            cost_per_iteration_usd=cost_per_iteration,
+            estimated_cost_usd=cost_per_iteration * iterations,
+            tokens_per_minute=self.settings.rate_limit_tokens_per_minute,
+            recommended_concurrency=concurrency,
+        )
+
+    def recommend_concurrency(
+        self,
+        tokens_per_iteration: int,
+        latency_ms: float,
+        max_concurrency: int,
+    ) -> int:
+        """
+        Pick the concurrency whose steady-state throughput fits the budgets.
+
+        By Little's law, `concurrency = requests_per_second * latency_s`. The
+        sustainable request rate is the smaller of the request budget and the
+        token budget divided by tokens per request.
+
+        Args:
+            tokens_per_iteration: Estimated tokens per request.
+            latency_ms: Expected latency per request.
+            max_concurrency: Upper bound from the batch config.
+
+        Returns:
+            Recommended concurrency (at least 1).
+        """
+        request_rate = self.settings.rate_limit_requests / self.settings.rate_limit_window_seconds
+        token_rate = (
+            self.settings.rate_limit_tokens_per_minute / 60.0 / max(tokens_per_iteration, 1)
+        )
+        sustainable_rate = min(request_rate, token_rate)
+        concurrency = math.floor(sustainable_rate * latency_ms / 1000)
+        return max(1, min(max_concurrency, concurrency))
+
+    def iteration_cost(self, provider: LLMProvider, model: str, usage: UsageInfo | None) -> float:
+        """
+        Compute the actual cost of a completed iteration.
+
+        Args:
+            provider: The LLM provider.
+            model: Model that served the request.
+            usage: Reported token usage (None counts the request fee only).
+
+        Returns:
+            Cost in USD.
+        """
+        pricing = get_pricing(provider, model)
+        if usage is None:
+            return pricing.per_request
+
+        # Cached prompt tokens are billed at a provider-specific multiplier
+        read_multiplier, write_multiplier = CACHE_PRICE_MULTIPLIERS[provider]
+        uncached = usage.prompt_tokens - usage.cache_read_tokens - usage.cache_write_tokens
+        effective_prompt_tokens = (
+            max(uncached, 0)
+            + usage.cache_read_tokens * read_multiplier
+            + usage.cache_write_tokens * write_multiplier
+        )
+        return self._cost(pricing, effective_prompt_tokens, usage.completion_tokens)
+
+    @staticmethod
+    def _cost(pricing: ModelPricing, prompt_tokens: float, completion_tokens: int) -> float:
+        """Price a request from token counts."""
+        return (
+            prompt_tokens * pricing.input_per_million / 1_000_000
+            + completion_tokens * pricing.output_per_million / 1_000_000
+            + pricing.per_request
+        )
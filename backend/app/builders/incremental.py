@@ -0,0 +1,354 @@
+"""
+IncrementalAnalyzer - online visibility analytics for running batches.
+
+This module maintains visibility, share of voice, rank, latency and
+consistency statistics as iterations arrive one at a time, so a snapshot
+of the analysis is available at any moment without re-analyzing the
+whole batch.
+
+Consistency honors the configured metric: fuzzy similarities are scored
+as each response arrives, while TF-IDF (whose IDF depends on the whole
+corpus) is rescored over the responses so far when a snapshot is taken,
+exactly as the batch analysis would.
+
+Innovation: Running counters and Welford mean/variance make every
+snapshot O(brands), which enables live dashboards and early stopping of
+Monte Carlo batches once the metrics have converged.
+"""
+
+from dataclasses import dataclass, field
+from statistics import NormalDist
+
+import numpy as np
+import numpy.typing as npt
+from rapidfuzz import fuzz, process
+
+from backend.app.builders.analysis import (
+    CONSISTENCY_SAMPLE_SEED,
+    AnalysisBuilder,
+    BrandDictionary,
+    ConsistencyMetrics,
+    RankMetrics,
+    ShareOfVoice,
+    VisibilityMetrics,
+)
+from backend.app.builders.dedup import cluster_responses
+from backend.app.builders.normalization import NormalizedResponse, normalize_response
+from backend.app.core.config import Settings
+from backend.app.schemas.runner import IterationResult, IterationStatus
+
+
+@dataclass
+class RunningStats:
+    """
+    Online mean/variance accumulator (Welford, with Chan's batch merge).
+
+    Attributes:
+        count: Number of observations.
+        mean: Running mean.
+        m2: Running sum of squared deviations from the mean.
+        minimum: Smallest observation (inf when empty).
+        maximum: Largest observation (-inf when empty).
+    """
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    minimum: float = float("inf")
+    maximum: float = float("-inf")
+
+    def update(self, value: float) -> None:
+        """Add a single observation."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    def update_batch(self, values: npt.NDArray[np.float64]) -> None:
+        """Add many observations at once by merging their moments."""
+        if values.size == 0:
+            return
+        batch_count = int(values.size)
+        batch_mean = float(values.mean())
+        batch_m2 = float(((values - batch_mean) ** 2).sum())
+
+        total = self.count + batch_count
+        delta = batch_mean - self.mean
+        self.mean += delta * batch_count / total
+        self.m2 += batch_m2 + delta**2 * self.count * batch_count / total
+        self.count = total
+        self.minimum = min(self.minimum, float(values.min()))
+        self.maximum = max(self.maximum, float(values.max()))
+
+    @property
+    def variance(self) -> float:
+        """Population variance (0 with fewer than two observations)."""
+        return self.m2 / self.count if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation."""
+        return float(self.variance**0.5)
+
+
+@dataclass
+class AnalysisSnapshot:
+    """
+    Point-in-time view of a running analysis.
+
+    Attributes:
+        total_iterations: Iterations received so far (any status).
+        successful_iterations: Successful iterations received so far.
+        total_responses: Responses analyzed so far.
+        target_visibility: Visibility metrics for the target brand.
+        competitor_visibility: Visibility metrics for competitors.
+        share_of_voice: Share of Voice analysis.
+        rankings: Cross-brand rank metrics, in brand order.
+        consistency: Response consistency metrics.
+        avg_latency_ms: Mean latency of successful iterations.
+        latency_std_ms: Standard deviation of that latency.
+    """
+
+    total_iterations: int
+    successful_iterations: int
+    total_responses: int
+    target_visibility: VisibilityMetrics | None
+    competitor_visibility: list[VisibilityMetrics]
+    share_of_voice: list[ShareOfVoice]
+    rankings: list[RankMetrics]
+    consistency: ConsistencyMetrics
+    avg_latency_ms: float | None
+    latency_std_ms: float | None
+
+
+@dataclass
+class _BrandState:
+    """Running per-brand counters."""
+
+    mention_count: int = 0
+    responses_with_mention: int = 0
+    position_sum: int = 0
+    top1: int = 0
+    top3: int = 0
+    rank: RunningStats = field(default_factory=RunningStats)
+
+
+class IncrementalAnalyzer:
+    """
+    Online counterpart of AnalysisBuilder.analyze_batch.
+
+    Each added response is matched once and folded into running counters.
+    Consistency compares only the new response against earlier ones; beyond
+    the exact-scoring threshold it compares against a uniform sample of
+    earlier responses and reports a margin of error, like the batch path.
+    Fuzzy brand variants need the whole corpus, so only exact dictionary
+    forms (name, aliases, generated variants) are matched incrementally.
+
+    Innovation: Lets the runner stream iterations into live metrics, so
+    dashboards and early-stopping rules never wait for the full batch.
+    """
+
+    def __init__(
+        self,
+        target_brands: list[str],
+        brand_dictionary: BrandDictionary | None = None,
+        settings: Settings | None = None,
+    ) -> None:
+        """
+        Initialize the analyzer.
+
+        Args:
+            target_brands: List of brands to analyze (first is primary target).
+            brand_dictionary: Optional precompiled dictionary for target_brands.
+            settings: Application settings. Uses get_settings() if not provided.
+        """
+        self._builder = AnalysisBuilder(settings=settings)
+        self.settings = self._builder.settings
+        dictionary = brand_dictionary or self._builder.build_brand_dictionary(target_brands)
+        self.brands = dictionary.brands
+        self._matcher = dictionary.matcher
+
+        self._brands = [_BrandState() for _ in self.brands]
+        self._rank_counts = np.zeros((len(self.brands), len(self.brands)), dtype=np.int64)
+        # Casefolded normalized texts, for consistency scoring
+        self._responses: list[str] = []
+        # Normalized responses, kept for TF-IDF rescoring at snapshot time
+        self._tfidf = self._builder.consistency_metric == "tfidf"
+        self._normalized: list[NormalizedResponse] = []
+        self._similarity = RunningStats()
+        self._sampled = False
+        self._latency = RunningStats()
+        self._rng = np.random.default_rng(CONSISTENCY_SAMPLE_SEED)
+        self.total_iterations = 0
+        self.successful_iterations = 0
+
+    def add_iteration(self, iteration: IterationResult) -> None:
+        """
+        Fold a completed iteration into the running metrics.
+
+        Usable directly as the runner's iteration callback.
+
+        Args:
+            iteration: The iteration result (any status).
+        """
+        self.total_iterations += 1
+        if iteration.status != IterationStatus.SUCCESS or iteration.response is None:
+            return
+        self.successful_iterations += 1
+        self.add_response(iteration.response.content, latency_ms=iteration.latency_ms)
+
+    def add_response(self, text: str, latency_ms: float | None = None) -> None:
+        """
+        Fold a single response into the running metrics.
+
+        Args:
+            text: Response text.
+            latency_ms: Optional response latency.
+        """
+        if latency_ms is not None:
+            self._latency.update(latency_ms)
+
+        normalized = normalize_response(text)
+        matches = self._matcher.scan([normalized])
+        ranks = self._builder.rank_brands(matches)[0]
+        for index, state in enumerate(self._brands):
+            count = int(matches.counts[0, index])
+            if count == 0:
+                continue
+            rank = int(ranks[index])
+            state.mention_count += count
+            state.responses_with_mention += 1
+            state.position_sum += int(matches.first_positions[0, index])
+            state.top1 += rank == 1
+            state.top3 += rank <= 3
+            state.rank.update(rank)
+            self._rank_counts[index, rank - 1] += 1
+
+        if self._tfidf:
+            self._normalized.append(normalized)
+        else:
+            self._update_consistency(normalized.folded)
+        self._responses.append(normalized.folded)
+
+    def _update_consistency(self, text: str) -> None:
+        """Fuzzy-score the new (normalized, casefolded) response against earlier ones."""
+        if not self._responses:
+            return
+        previous = self._responses
+        limit = self.settings.consistency_exact_max_responses
+        if len(previous) > limit:
+            # Uniform sample of earlier responses keeps each update O(limit)
+            self._sampled = True
+            picks = self._rng.choice(len(previous), size=limit, replace=False)
+            previous = [previous[i] for i in picks]
+
+        scores = process.cdist(
+            [text],
+            previous,
+            scorer=fuzz.ratio,
+            dtype=np.float64,
+            workers=self.settings.analysis_workers,
+        )
+        self._similarity.update_batch(scores[0])
+
+    def snapshot(self) -> AnalysisSnapshot:
+        """
+        Build the current metrics in O(brands).
+
+        With the "tfidf" consistency metric, the responses so far are
+        also rescored (sparse, sampled above the batch thresholds).
+
+        Returns:
+            AnalysisSnapshot: Metrics over all responses received so far.
+        """
+        total = len(self._responses)
+        visibility = [
+            VisibilityMetrics(
+                brand=brand,
+                mention_count=state.mention_count,
+                visibility_rate=state.responses_with_mention / total if total else 0.0,
+                avg_mentions_per_response=(
+                    state.mention_count / state.responses_with_mention
+                    if state.responses_with_mention
+                    else 0.0
+                ),
+                first_mention_rate=state.top1 / total if total else 0.0,
+                avg_position=(
+                    state.position_sum / state.responses_with_mention
+                    if state.responses_with_mention
+                    else None
+                ),
+            )
+            for brand, state in zip(self.brands, self._brands, strict=True)
+        ]
+        rankings = [
+            RankMetrics(
+                brand=brand,
+                mean_rank=state.rank.mean if state.rank.count else None,
+                rank_variance=state.rank.variance if state.rank.count else None,
+                top1_rate=state.top1 / total if total else 0.0,
+                top3_rate=state.top3 / total if total else 0.0,
+                rank_distribution=self._rank_counts[index].tolist(),
+            )
+            for index, (brand, state) in enumerate(zip(self.brands, self._brands, strict=True))
+        ]
+
+        return AnalysisSnapshot(
+            total_iterations=self.total_iterations,
+            successful_iterations=self.successful_iterations,
+            total_responses=total,
+            target_visibility=visibility[0] if visibility else None,
+            competitor_visibility=visibility[1:],
+            share_of_voice=self._builder.compute_share_of_voice(visibility),
+            rankings=rankings,
+            consistency=self._consistency(),
+            avg_latency_ms=self._latency.mean if self._latency.count else None,
+            latency_std_ms=self._latency.std if self._latency.count else None,
+        )
+
+    def _consistency(self) -> ConsistencyMetrics:
+        """Consistency metrics from the running similarity statistics."""
+        if self._tfidf:
+            return self._tfidf_consistency()
+
+        stats = self._similarity
+        if stats.count == 0:
+            return ConsistencyMetrics(
+                avg_similarity=100.0,
+                min_similarity=100.0,
+                max_similarity=100.0,
+                std_deviation=0.0,
+                consistency_score=1.0,
+            )
+
+        margin_of_error = 0.0
+        if self._sampled:
+            z = NormalDist().inv_cdf((1 + self.settings.confidence_level) / 2)
+            margin_of_error = z * stats.std / stats.count**0.5
+
+        return ConsistencyMetrics(
+            avg_similarity=stats.mean,
+            min_similarity=stats.minimum,
+            max_similarity=stats.maximum,
+            std_deviation=stats.std,
+            consistency_score=stats.mean / 100.0,
+            method="sampled" if self._sampled else "exact",
+            sampled_pairs=stats.count if self._sampled else None,
+            margin_of_error=margin_of_error,
+        )
+
+    def _tfidf_consistency(self) -> ConsistencyMetrics:
+        """TF-IDF consistency over all responses so far, as the batch analysis scores it."""
+        if len(self._responses) < 2:
+            return self._builder.compute_consistency(self._responses)
+        clusters = (
+            cluster_responses(
+                self._normalized, max_distance=self.settings.near_duplicate_max_distance
+            )
+            if self.settings.response_clustering
+            else None
+        )
+        pair_scores = self._builder.score_pairs(self._responses, clusters)
+        return self._builder.compute_consistency(self._responses, pair_scores)
@@ -0,0 +1,214 @@
+"""
+Response normalization shared by all analysis metrics.
+
+This module turns a raw markdown response into clean text once: markdown
+syntax (headings, list markers, emphasis, links, images, rules) and
+citation markers such as "[1]" are removed, whitespace is collapsed, and
+the text is segmented into list items and sentences. An offset map leads
+from every clean character back to the original response.
+
+Innovation: Every stage (brand matching, ranking, competitor discovery,
+consistency) reads the same normalized form instead of re-scanning raw
+markdown, so formatting noise no longer distorts similarity scores and
+mention positions are comparable across responses.
+"""
+
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from functools import cached_property
+
+import numpy as np
+import numpy.typing as npt
+
+# Line prefix: indentation, blockquotes, then a heading or list marker
+_BLOCK_PREFIX = re.compile(
+    r"[ \t]*(?:>[ \t]?)*(?:#{1,6}[ \t]+|(?P<item>\d{1,3}[.)]|[-*•+])[ \t]+)?"
+)
+# Horizontal rules ("---", "***", "___") carry no text
+_RULE_PATTERN = re.compile(r"[ \t]*([-*_])(?:[ \t]*\1){2,}[ \t]*")
+# Characters that can start inline syntax; lines without them skip the scan
+_INLINE_CHARS = frozenset("![*_`~\t")
+# Inline syntax, tried left to right where a trigger character occurs
+_INLINE_PATTERN = re.compile(
+    r"(?=[!\[*_`~\t]|[ \t][ \t!\[])(?:"
+    r"[ \t]*!\[[^\]\n]*\]\([^)\n]*\)"  # images: dropped
+    r"|\[(?P<link>[^\]\n]+)\](?:\([^)\n]*\)|\[[^\]\n]*\])"  # links: text kept
+    r"|[ \t]*\[\d{1,3}(?:[ \t]*[,\u2013-][ \t]*\d{1,3})*\]"  # citations: dropped
+    r"|(?P<strong>\*\*|(?<!\w)__|__(?!\w))"  # bold: recorded as emphasis
+    r"|\*|`+|~~"  # italics, code and strikethrough markers: dropped
+    r"|(?P<space>[ \t]{2,}|\t)"  # whitespace runs: one character kept
+    r")"
+)
+# Sentence-ending punctuation or line breaks, with the whitespace after them
+_SENTENCE_BREAK = re.compile(r"[.!?\n][ \t\n]*")
+
+
+@dataclass(frozen=True, eq=False)
+class NormalizedResponse:
+    """
+    A response reduced to clean text, with its structure and offset map.
+
+    Attributes:
+        original: The raw response text.
+        text: Clean text (markdown and citation markers removed, case kept).
+        segments: (start, end) original slices concatenated into text.
+        item_starts: Clean offsets where numbered or bulleted list items
+            start (after the marker), in order.
+        item_ends: Clean offsets where those items end (next item or
+            blank line).
+        sentences: (start, end) clean offsets of each sentence.
+        emphasis: (start, end) clean offsets of bold spans.
+    """
+
+    original: str
+    text: str
+    segments: list[tuple[int, int]] = field(repr=False)
+    item_starts: list[int] = field(default_factory=list)
+    item_ends: list[int] = field(default_factory=list)
+    sentences: list[tuple[int, int]] = field(default_factory=list, repr=False)
+    emphasis: list[tuple[int, int]] = field(default_factory=list, repr=False)
+
+    @cached_property
+    def folded(self) -> str:
+        """Casefolded clean text, for case-insensitive comparisons."""
+        return self.text.casefold()
+
+    @cached_property
+    def offsets(self) -> npt.NDArray[np.int32]:
+        """Original offset of each clean character, plus len(original)."""
+        return np.concatenate(
+            [np.arange(start, end, dtype=np.int32) for start, end in self.segments]
+            + [np.array([len(self.original)], dtype=np.int32)]
+        )
+
+    def original_offset(self, position: int) -> int:
+        """
+        Map a clean-text offset back to the original response.
+
+        Args:
+            position: Offset in the clean text (0..len(text)).
+
+        Returns:
+            Offset of the same character in the original response.
+        """
+        return int(self.offsets[position])
+
+
+def normalize_response(text: str) -> NormalizedResponse:
+    """
+    Normalize one raw response.
+
+    Every clean character is a character of the original, so the offset
+    map is exact; repeated blank lines collapse to one, which still ends
+    a list item.
+
+    Args:
+        text: Raw (markdown) response text.
+
+    Returns:
+        NormalizedResponse: The clean text with its segmentation.
+    """
+    segments: list[tuple[int, int]] = []
+    length = 0
+    item_starts: list[int] = []
+    emphasis: list[tuple[int, int]] = []
+
+    def emit(start: int, end: int) -> None:
+        nonlocal length
+        if end > start:
+            segments.append((start, end))
+            length += end - start
+
+    line_start = 0
+    blank = False
+    for line in text.split("\n"):
+        start = line_start
+        end = start + len(line.rstrip())
+        line_start += len(line) + 1
+        if end == start or _RULE_PATTERN.fullmatch(text, start, end):
+            blank = True
+            continue
+        if length:
+            newline = start - 1
+            emit(newline, newline + 1)
+            if blank:
+                emit(newline, newline + 1)
+        blank = False
+
+        prefix = _BLOCK_PREFIX.match(text, start, end)
+        cursor = prefix.end() if prefix else start
+        if prefix and prefix.group("item"):
+            item_starts.append(length)
+
+        if _INLINE_CHARS.isdisjoint(line) and "  " not in line and " [" not in line:
+            emit(cursor, end)
+            continue
+
+        strong_start: int | None = None
+        for match in _INLINE_PATTERN.finditer(text, cursor, end):
+            emit(cursor, match.start())
+            cursor = match.end()
+            if match.group("link") is not None:
+                emit(match.start("link"), match.end("link"))
+            elif match.group("strong") is not None:
+                if strong_start is None:
+                    strong_start = length
+                else:
+                    if length > strong_start:
+                        emphasis.append((strong_start, length))
+                    strong_start = None
+            elif match.group("space") is not None:
+                emit(match.start(), match.start() + 1)
+        emit(cursor, end)
+
+    clean = "".join([text[start:end] for start, end in segments])
+
+    item_ends: list[int] = []
+    for i, item_start in enumerate(item_starts):
+        item_end = item_starts[i + 1] if i + 1 < len(item_starts) else len(clean)
+        paragraph_end = clean.find("\n\n", item_start, item_end)
+        item_ends.append(paragraph_end if paragraph_end >= 0 else item_end)
+
+    sentences: list[tuple[int, int]] = []
+    sentence_start = 0
+    for boundary in _SENTENCE_BREAK.finditer(clean):
+        end = boundary.start()
+        if clean[end] != "\n":
+            # Punctuation only ends a sentence before whitespace ("monday.com")
+            if boundary.end() == end + 1 and boundary.end() < len(clean):
+                continue
+            end += 1
+        if end > sentence_start:
+            sentences.append((sentence_start, end))
+        sentence_start = boundary.end()
+    if sentence_start < len(clean):
+        sentences.append((sentence_start, len(clean)))
+
+    return NormalizedResponse(
+        original=text,
+        text=clean,
+        segments=segments,
+        item_starts=item_starts,
+        item_ends=item_ends,
+        sentences=sentences,
+        emphasis=emphasis,
+    )
+
+
+def normalize_responses(
+    responses: Sequence[str | NormalizedResponse],
+) -> list[NormalizedResponse]:
+    """
+    Normalize responses, passing already normalized ones through.
+
+    Args:
+        responses: Raw or normalized responses.
+
+    Returns:
+        Normalized responses, in order.
+    """
+    return [
+        response if isinstance(response, NormalizedResponse) else normalize_response(response)
+        for response in responses
+    ]
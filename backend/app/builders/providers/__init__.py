@@ -0,0 +1,114 @@
+"""
+LLM Provider adapters implementing the unified interface.
+
+This package exposes the provider contract, its error types and the
+`get_provider` factory. Concrete adapters are resolved through the lazy
+registry, so importing this package does not import any adapter module
+until that provider is actually used.
+
+Innovation: The unified provider interface enables the probabilistic engine
+to run identical experiments across different LLMs, measuring variance in
+brand visibility recommendations between providers.
+"""
+
+from typing import Any
+
+from backend.app.builders.providers.base import (
+    BaseLLMProvider,
+    ProviderAuthError,
+    ProviderError,
+    RateLimitError,
+)
+from backend.app.builders.providers.registry import (
+    ProviderSpec,
+    get_default_model,
+    get_provider_spec,
+    load_provider_class,
+    register_provider,
+)
+from backend.app.core.config import Settings, get_settings
+from backend.app.schemas.llm import LLMProvider as LLMProviderEnum
+
+__all__ = [
+    "AnthropicProvider",
+    "BaseLLMProvider",
+    "OpenAICompatibleProvider",
+    "OpenAIProvider",
+    "PerplexityProvider",
+    "ProviderAuthError",
+    "ProviderError",
+    "ProviderSpec",
+    "RateLimitError",
+    "get_default_model",
+    "get_provider",
+    "get_provider_spec",
+    "load_provider_class",
+    "register_provider",
+]
+
+# Adapter classes re-exported lazily (see __getattr__)
+_LAZY_ADAPTERS = {
+    "PerplexityProvider": LLMProviderEnum.PERPLEXITY,
+    "OpenAIProvider": LLMProviderEnum.OPENAI,
+    "AnthropicProvider": LLMProviderEnum.ANTHROPIC,
+    "OpenAICompatibleProvider": LLMProviderEnum.OPENAI_COMPATIBLE,
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import built-in adapter classes on first attribute access."""
+    if name in _LAZY_ADAPTERS:
+        return load_provider_class(_LAZY_ADAPTERS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_provider(
+    provider: LLMProviderEnum | str,
+    api_key: str | None = None,
+    model: str | None = None,
+    settings: Settings | None = None,
+) -> BaseLLMProvider:
+    """
+    Factory function to get a provider instance.
+
+    The adapter class is imported on first use through the registry. When a
+    cassette is configured in settings, the provider is wrapped in a
+    CassetteProvider that records or replays its exchanges.
+
+    Args:
+        provider: The provider type (or registered provider name) to instantiate.
+        api_key: Optional API key override.
+        model: Optional model override.
+        settings: Application settings. Uses get_settings() if not provided.
+
+    Returns:
+        BaseLLMProvider: The configured provider instance.
+
+    Raises:
+        ValueError: If provider type is unknown.
+    """
+    settings = settings or get_settings()
+    replaying = settings.cassette_mode == "replay" and settings.cassette_path is not None
+    if replaying:
+        # Replay never touches the network, so no real key is required
+        api_key = api_key or "cassette-replay"
+
+    provider_class = load_provider_class(provider, settings)
+    kwargs: dict[str, Any] = {"api_key": api_key}
+    resolved_model = model or get_default_model(provider, settings)
+    if resolved_model is not None:
+        kwargs["model"] = resolved_model
+    llm_provider = provider_class(**kwargs)
+
+    if settings.cassette_mode != "off" and settings.cassette_path is not None:
+        from backend.app.builders.cassette import CassetteMode, CassetteProvider
+
+        return CassetteProvider(
+            inner=llm_provider,
+            path=settings.cassette_path,
+            mode=CassetteMode(settings.cassette_mode),
+            time_scale=settings.cassette_time_scale,
+            allow_unmatched=settings.cassette_allow_unmatched,
+        )
+
+    return llm_provider
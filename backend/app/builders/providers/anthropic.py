@@ -0,0 +1,192 @@
+"""
+Anthropic provider adapter.
+
+Implements the unified provider interface for Anthropic's Messages API,
+including prompt-cache breakpoints for the shared prompt prefix.
+"""
+
+from datetime import datetime
+from typing import Any
+
+import httpx
+
+from backend.app.builders.providers.base import (
+    BaseLLMProvider,
+    ProviderAuthError,
+    ProviderError,
+    RateLimitError,
+)
+from backend.app.core.config import get_settings
+from backend.app.schemas.llm import (
+    LLMProvider as LLMProviderEnum,
+)
+from backend.app.schemas.llm import (
+    LLMRequest,
+    LLMResponse,
+    MessageRole,
+    UsageInfo,
+)
+
+
+class AnthropicProvider(BaseLLMProvider):
+    """
+    Anthropic Claude API provider implementation.
+
+    Placeholder for Phase 2 completion - implements the interface
+    but will be fully implemented when Anthropic integration is needed.
+    """
+
+    MODEL_CLAUDE_4_SONNET = "claude-sonnet-4-20250514"
+    MODEL_CLAUDE_35_SONNET = "claude-3-5-sonnet-20241022"
+    MODEL_CLAUDE_35_HAIKU = "claude-3-5-haiku-20241022"
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        model: str = MODEL_CLAUDE_35_SONNET,
+        timeout: float = 30.0,
+    ) -> None:
+        """Initialize the Anthropic provider."""
+        settings = get_settings()
+        resolved_api_key = api_key or settings.anthropic_api_key
+
+        if not resolved_api_key:
+            raise ProviderAuthError("Anthropic API key not configured")
+
+        super().__init__(
+            api_key=resolved_api_key,
+            base_url="https://api.anthropic.com/v1",
+            timeout=timeout,
+        )
+        self._default_model = model
+
+    @property
+    def provider_name(self) -> LLMProviderEnum:
+        """Return the provider enum value."""
+        return LLMProviderEnum.ANTHROPIC
+
+    @property
+    def default_model(self) -> str:
+        """Return the default model for Anthropic."""
+        return self._default_model
+
+    def _get_headers(self) -> dict[str, str]:
+        """Get Anthropic-specific headers."""
+        return {
+            "x-api-key": self.api_key,
+            "Content-Type": "application/json",
+            "anthropic-version": "2023-06-01",
+        }
+
+    async def _make_request(self, request: LLMRequest) -> dict[str, Any]:
+        """Make a messages request to Anthropic."""
+        client = await self.get_client()
+
+        # Anthropic has a different message format - system is separate
+        system_content = None
+        messages: list[dict[str, Any]] = []
+        for m in request.messages:
+            if m.role == MessageRole.SYSTEM:
+                system_content = m.content
+            else:
+                messages.append({"role": m.role.value, "content": m.content})
+
+        # Innovation: cache_control breakpoints on the system prompt and the
+        # final user turn let every iteration after the first read the shared
+        # prefix from Anthropic's prompt cache
+        if request.cache_prompt and messages:
+            messages[-1]["content"] = [
+                {
+                    "type": "text",
+                    "text": messages[-1]["content"],
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
+
+        payload: dict[str, Any] = {
+            "model": request.model or self.default_model,
+            "messages": messages,
+            "max_tokens": request.max_tokens or 1024,
+            "temperature": request.temperature,
+            "top_p": request.top_p,
+        }
+
+        if system_content:
+            if request.cache_prompt:
+                payload["system"] = [
+                    {
+                        "type": "text",
+                        "text": system_content,
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ]
+            else:
+                payload["system"] = system_content
+
+        try:
+            response = await client.post("/messages", json=payload)
+
+            if response.status_code == 429:
+                retry_after = response.headers.get("Retry-After")
+                raise RateLimitError(
+                    "Anthropic rate limit exceeded",
+                    retry_after=float(retry_after) if retry_after else None,
+                )
+
+            if response.status_code in (401, 403):
+                raise ProviderAuthError(f"Anthropic authentication failed: {response.text}")
+
+            if response.status_code != 200:
+                raise ProviderError(
+                    f"Anthropic API error: {response.text}",
+                    status_code=response.status_code,
+                )
+
+            result: dict[str, Any] = response.json()
+            return result
+
+        except httpx.TimeoutException as e:
+            raise ProviderError(f"Anthropic request timeout: {e}") from e
+        except httpx.RequestError as e:
+            raise ProviderError(f"Anthropic request failed: {e}") from e
+
+    def _parse_response(
+        self,
+        raw_response: dict[str, Any],
+        latency_ms: float,
+    ) -> LLMResponse:
+        """Parse Anthropic's response into unified schema."""
+        # Anthropic returns content as a list of content blocks
+        content_blocks = raw_response.get("content", [])
+        content = ""
+        for block in content_blocks:
+            if block.get("type") == "text":
+                content += block.get("text", "")
+
+        usage_data = raw_response.get("usage")
+        usage = None
+        if usage_data:
+            # input_tokens excludes cached tokens, so add them back to keep
+            # prompt_tokens comparable across providers
+            cache_read = usage_data.get("cache_read_input_tokens") or 0
+            cache_write = usage_data.get("cache_creation_input_tokens") or 0
+            prompt_tokens = usage_data.get("input_tokens", 0) + cache_read + cache_write
+            usage = UsageInfo(
+                prompt_tokens=prompt_tokens,
+                completion_tokens=usage_data.get("output_tokens", 0),
+                total_tokens=prompt_tokens + usage_data.get("output_tokens", 0),
+                cache_read_tokens=cache_read,
+                cache_write_tokens=cache_write,
+            )
+
+        return LLMResponse(
+            id=raw_response.get("id", ""),
+            provider=self.provider_name,
+            model=raw_response.get("model", self.default_model),
+            content=content,
+            finish_reason=raw_response.get("stop_reason"),
+            usage=usage,
+            created_at=datetime.utcnow(),
+            latency_ms=latency_ms,
+            raw_response=raw_response,
+        )
@@ -0,0 +1,229 @@
+"""
+Base interface and errors shared by all LLM provider adapters.
+
+This module defines the abstract provider contract and the exception types
+the probabilistic engine relies on. Concrete adapters live in sibling
+modules and are imported lazily through the provider registry.
+
+Innovation: The unified provider interface enables the probabilistic engine
+to run identical experiments across different LLMs, measuring variance in
+brand visibility recommendations between providers.
+"""
+
+from abc import ABC, abstractmethod
+from time import perf_counter
+from typing import Any
+
+import httpx
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+from backend.app.core.http import get_http_client
+from backend.app.schemas.llm import (
+    LLMProvider as LLMProviderEnum,
+)
+from backend.app.schemas.llm import (
+    LLMRequest,
+    LLMResponse,
+    Message,
+    MessageRole,
+)
+
+
+class RateLimitError(Exception):
+    """Raised when an API rate limit is hit."""
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class ProviderAuthError(Exception):
+    """Raised when API authentication fails."""
+
+    pass
+
+
+class ProviderError(Exception):
+    """Generic provider error."""
+
+    def __init__(self, message: str, status_code: int | None = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class BaseLLMProvider(ABC):
+    """
+    Abstract base class for LLM provider implementations.
+
+    All provider implementations must inherit from this class and implement
+    the async generate method. This ensures consistent interface across
+    providers for the probabilistic engine.
+
+    Innovation: The abstract design allows new providers to be added without
+    modifying the core probabilistic engine logic.
+    """
+
+    def __init__(self, api_key: str, base_url: str, timeout: float = 30.0) -> None:
+        """
+        Initialize the provider with authentication and configuration.
+
+        Args:
+            api_key: API key for authentication.
+            base_url: Base URL for the provider's API.
+            timeout: Request timeout in seconds.
+        """
+        self.api_key = api_key
+        self.base_url = base_url
+        self.timeout = timeout
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    @abstractmethod
+    def provider_name(self) -> LLMProviderEnum:
+        """Return the provider enum value."""
+        ...
+
+    @property
+    @abstractmethod
+    def default_model(self) -> str:
+        """Return the default model for this provider."""
+        ...
+
+    async def get_client(self) -> httpx.AsyncClient:
+        """
+        Get the async HTTP client.
+
+        The client comes from the process-wide pool for this endpoint and
+        credentials, so connections stay open across provider instances.
+
+        Returns:
+            httpx.AsyncClient: The HTTP client instance.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = get_http_client(self.base_url, self.timeout, self._get_headers())
+        return self._client
+
+    @abstractmethod
+    def _get_headers(self) -> dict[str, str]:
+        """
+        Get provider-specific HTTP headers.
+
+        Returns:
+            dict: Headers including authentication.
+        """
+        ...
+
+    @abstractmethod
+    async def _make_request(
+        self,
+        request: LLMRequest,
+    ) -> dict[str, Any]:
+        """
+        Make the actual API request to the provider.
+
+        Args:
+            request: The unified LLM request.
+
+        Returns:
+            dict: Raw response from the provider.
+
+        Raises:
+            RateLimitError: If rate limit is exceeded.
+            ProviderAuthError: If authentication fails.
+            ProviderError: For other API errors.
+        """
+        ...
+
+    @abstractmethod
+    def _parse_response(
+        self,
+        raw_response: dict[str, Any],
+        latency_ms: float,
+    ) -> LLMResponse:
+        """
+        Parse the provider's raw response into unified schema.
+
+        Args:
+            raw_response: Raw JSON response from the provider.
+            latency_ms: Request latency in milliseconds.
+
+        Returns:
+            LLMResponse: Parsed response in unified format.
+        """
+        ...
+
+    @retry(
+        retry=retry_if_exception_type(RateLimitError),
+        wait=wait_exponential(multiplier=1, min=1, max=60),
+        stop=stop_after_attempt(5),
+        reraise=True,
+    )
+    async def generate(self, request: LLMRequest) -> LLMResponse:
+        """
+        Generate a completion from the LLM.
+
+        This method handles retries for rate limits using tenacity.
+        The @retry decorator implements exponential backoff.
+
+        Args:
+            request: The unified LLM request.
+
+        Returns:
+            LLMResponse: The generated response.
+
+        Raises:
+            RateLimitError: If rate limit exceeded after retries.
+            ProviderAuthError: If authentication fails.
+            ProviderError: For other API errors.
+        """
+        start_time = perf_counter()
+        raw_response = await self._make_request(request)
+        latency_ms = (perf_counter() - start_time) * 1000
+
+        return self._parse_response(raw_response, latency_ms)
+
+    async def generate_simple(self, prompt: str, system_prompt: str | None = None) -> LLMResponse:
+        """
+        Convenience method for simple single-turn generation.
+
+        Args:
+            prompt: The user prompt.
+            system_prompt: Optional system prompt.
+
+        Returns:
+            LLMResponse: The generated response.
+        """
+        messages: list[Message] = []
+        if system_prompt:
+            messages.append(Message(role=MessageRole.SYSTEM, content=system_prompt))
+        messages.append(Message(role=MessageRole.USER, content=prompt))
+
+        request = LLMRequest(messages=messages)
+        return await self.generate(request)
+
+    async def close(self) -> None:
+        """
+        Release the HTTP client.
+
+        The shared connection pool stays open for reuse; it is closed by
+        close_http_clients at process shutdown.
+        """
+        self._client = None
+
+    async def __aenter__(self) -> "BaseLLMProvider":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: Any,
+    ) -> None:
+        """Async context manager exit."""
+        await self.close()
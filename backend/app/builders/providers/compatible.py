@@ -0,0 +1,50 @@
+"""
+OpenAI-compatible provider adapter.
+
+Points the OpenAI adapter at any server that speaks the chat completions
+protocol (vLLM, llama.cpp server, or a fake used for load tests), with the
+base URL, key and default model taken from settings.
+"""
+
+from backend.app.builders.providers.openai import OpenAIProvider
+from backend.app.core.config import get_settings
+from backend.app.schemas.llm import LLMProvider as LLMProviderEnum
+
+
+class OpenAICompatibleProvider(OpenAIProvider):
+    """
+    Provider for self-hosted or fake OpenAI-compatible endpoints.
+
+    Innovation: Load tests and offline experiments can target a local
+    server through the same engine path as production providers.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        model: str | None = None,
+        timeout: float = 60.0,
+        base_url: str | None = None,
+    ) -> None:
+        """
+        Initialize the OpenAI-compatible provider.
+
+        Args:
+            api_key: API key. If None, loaded from settings (local servers
+                     usually accept any value).
+            model: Default model to use. If None, loaded from settings.
+            timeout: Request timeout in seconds.
+            base_url: Server base URL. If None, loaded from settings.
+        """
+        settings = get_settings()
+        super().__init__(
+            api_key=api_key or settings.openai_compatible_api_key or "not-needed",
+            model=model or settings.openai_compatible_model,
+            timeout=timeout,
+            base_url=base_url or settings.openai_compatible_base_url,
+        )
+
+    @property
+    def provider_name(self) -> LLMProviderEnum:
+        """Return the provider enum value."""
+        return LLMProviderEnum.OPENAI_COMPATIBLE
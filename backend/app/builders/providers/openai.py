@@ -0,0 +1,158 @@
+"""
+OpenAI provider adapter.
+
+Implements the unified provider interface for OpenAI's chat completions API.
+The same adapter backs OpenAI-compatible endpoints (see `compatible`).
+"""
+
+from datetime import datetime
+from typing import Any
+
+import httpx
+
+from backend.app.builders.providers.base import (
+    BaseLLMProvider,
+    ProviderAuthError,
+    ProviderError,
+    RateLimitError,
+)
+from backend.app.core.config import get_settings
+from backend.app.schemas.llm import (
+    LLMProvider as LLMProviderEnum,
+)
+from backend.app.schemas.llm import (
+    LLMRequest,
+    LLMResponse,
+    UsageInfo,
+)
+
+
+class OpenAIProvider(BaseLLMProvider):
+    """
+    OpenAI API provider implementation.
+
+    Placeholder for Phase 2 completion - implements the interface
+    but will be fully implemented when OpenAI integration is needed.
+    """
+
+    MODEL_GPT4O = "gpt-4o"
+    MODEL_GPT4O_MINI = "gpt-4o-mini"
+    MODEL_GPT4_TURBO = "gpt-4-turbo"
+
+    DEFAULT_BASE_URL = "https://api.openai.com/v1"
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        model: str = MODEL_GPT4O_MINI,
+        timeout: float = 30.0,
+        base_url: str = DEFAULT_BASE_URL,
+    ) -> None:
+        """Initialize the OpenAI provider."""
+        settings = get_settings()
+        resolved_api_key = api_key or settings.openai_api_key
+
+        if not resolved_api_key:
+            raise ProviderAuthError("OpenAI API key not configured")
+
+        super().__init__(
+            api_key=resolved_api_key,
+            base_url=base_url,
+            timeout=timeout,
+        )
+        self._default_model = model
+
+    @property
+    def provider_name(self) -> LLMProviderEnum:
+        """Return the provider enum value."""
+        return LLMProviderEnum.OPENAI
+
+    @property
+    def default_model(self) -> str:
+        """Return the default model for OpenAI."""
+        return self._default_model
+
+    def _get_headers(self) -> dict[str, str]:
+        """Get OpenAI-specific headers."""
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+
+    async def _make_request(self, request: LLMRequest) -> dict[str, Any]:
+        """Make a chat completion request to OpenAI."""
+        client = await self.get_client()
+
+        payload: dict[str, Any] = {
+            "model": request.model or self.default_model,
+            "messages": [{"role": m.role.value, "content": m.content} for m in request.messages],
+            "temperature": request.temperature,
+            "top_p": request.top_p,
+        }
+
+        if request.max_tokens:
+            payload["max_tokens"] = request.max_tokens
+
+        try:
+            response = await client.post("/chat/completions", json=payload)
+
+            if response.status_code == 429:
+                retry_after = response.headers.get("Retry-After")
+                raise RateLimitError(
+                    "OpenAI rate limit exceeded",
+                    retry_after=float(retry_after) if retry_after else None,
+                )
+
+            if response.status_code in (401, 403):
+                raise ProviderAuthError(f"OpenAI authentication failed: {response.text}")
+
+            if response.status_code != 200:
+                raise ProviderError(
+                    f"OpenAI API error: {response.text}",
+                    status_code=response.status_code,
+                )
+
+            result: dict[str, Any] = response.json()
+            return result
+
+        except httpx.TimeoutException as e:
+            raise ProviderError(f"OpenAI request timeout: {e}") from e
+        except httpx.RequestError as e:
+            raise ProviderError(f"OpenAI request failed: {e}") from e
+
+    def _parse_response(
+        self,
+        raw_response: dict[str, Any],
+        latency_ms: float,
+    ) -> LLMResponse:
+        """Parse OpenAI's response into unified schema."""
+        choices = raw_response.get("choices", [])
+        if not choices:
+            raise ProviderError("No choices in OpenAI response")
+
+        choice = choices[0]
+        message = choice.get("message", {})
+
+        usage_data = raw_response.get("usage")
+        usage = None
+        if usage_data:
+            # OpenAI caches long prompt prefixes automatically
+            prompt_details = usage_data.get("prompt_tokens_details") or {}
+            usage = UsageInfo(
+                prompt_tokens=usage_data.get("prompt_tokens", 0),
+                completion_tokens=usage_data.get("completion_tokens", 0),
+                total_tokens=usage_data.get("total_tokens", 0),
+                cache_read_tokens=prompt_details.get("cached_tokens") or 0,
+            )
+
+        return LLMResponse(
+            id=raw_response.get("id", ""),
+            provider=self.provider_name,
+            model=raw_response.get("model", self.default_model),
+            content=message.get("content", ""),
+            finish_reason=choice.get("finish_reason"),
+            usage=usage,
+            created_at=datetime.utcnow(),
+            latency_ms=latency_ms,
+            raw_response=raw_response,
+        )
@@ -0,0 +1,202 @@
+"""
+Perplexity provider adapter.
+
+Implements the unified provider interface for Perplexity's Sonar models,
+including parsing of web search results used for citation analysis.
+"""
+
+from datetime import datetime
+from typing import Any
+
+import httpx
+
+from backend.app.builders.providers.base import (
+    BaseLLMProvider,
+    ProviderAuthError,
+    ProviderError,
+    RateLimitError,
+)
+from backend.app.core.config import get_settings
+from backend.app.schemas.llm import (
+    LLMProvider as LLMProviderEnum,
+)
+from backend.app.schemas.llm import (
+    LLMRequest,
+    PerplexityResponse,
+    PerplexitySearchResult,
+    UsageInfo,
+)
+
+
+class PerplexityProvider(BaseLLMProvider):
+    """
+    Perplexity API provider implementation.
+
+    Innovation: Perplexity's Sonar models provide web-grounded responses,
+    enabling real-time brand visibility analysis with source citations.
+    The search_results field allows tracking which sources mention brands.
+    """
+
+    # Perplexity model options
+    MODEL_SONAR = "sonar"
+    MODEL_SONAR_PRO = "sonar-pro"
+    MODEL_SONAR_DEEP_RESEARCH = "sonar-deep-research"
+    MODEL_SONAR_REASONING_PRO = "sonar-reasoning-pro"
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        model: str = MODEL_SONAR,
+        timeout: float = 60.0,
+    ) -> None:
+        """
+        Initialize the Perplexity provider.
+
+        Args:
+            api_key: Perplexity API key. If None, loaded from settings.
+            model: Default model to use.
+            timeout: Request timeout in seconds.
+        """
+        settings = get_settings()
+        resolved_api_key = api_key or settings.perplexity_api_key
+
+        if not resolved_api_key:
+            raise ProviderAuthError("Perplexity API key not configured")
+
+        super().__init__(
+            api_key=resolved_api_key,
+            base_url="https://api.perplexity.ai",
+            timeout=timeout,
+        )
+        self._default_model = model
+
+    @property
+    def provider_name(self) -> LLMProviderEnum:
+        """Return the provider enum value."""
+        return LLMProviderEnum.PERPLEXITY
+
+    @property
+    def default_model(self) -> str:
+        """Return the default model for Perplexity."""
+        return self._default_model
+
+    def _get_headers(self) -> dict[str, str]:
+        """Get Perplexity-specific headers."""
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+
+    async def _make_request(self, request: LLMRequest) -> dict[str, Any]:
+        """
+        Make a chat completion request to Perplexity.
+
+        Args:
+            request: The unified LLM request.
+
+        Returns:
+            dict: Raw response from Perplexity.
+
+        Raises:
+            RateLimitError: If rate limit is exceeded (429).
+            ProviderAuthError: If authentication fails (401/403).
+            ProviderError: For other API errors.
+        """
+        client = await self.get_client()
+
+        # Build Perplexity-specific payload
+        payload: dict[str, Any] = {
+            "model": request.model or self.default_model,
+            "messages": [{"role": m.role.value, "content": m.content} for m in request.messages],
+            "temperature": request.temperature,
+            "top_p": request.top_p,
+        }
+
+        if request.max_tokens:
+            payload["max_tokens"] = request.max_tokens
+
+        try:
+            response = await client.post("/chat/completions", json=payload)
+
+            if response.status_code == 429:
+                retry_after = response.headers.get("Retry-After")
+                raise RateLimitError(
+                    "Perplexity rate limit exceeded",
+                    retry_after=float(retry_after) if retry_after else None,
+                )
+
+            if response.status_code in (401, 403):
+                raise ProviderAuthError(f"Perplexity authentication failed: {response.text}")
+
+            if response.status_code != 200:
+                raise ProviderError(
+                    f"Perplexity API error: {response.text}",
+                    status_code=response.status_code,
+                )
+
+            result: dict[str, Any] = response.json()
+            return result
+
+        except httpx.TimeoutException as e:
+            raise ProviderError(f"Perplexity request timeout: {e}") from e
+        except httpx.RequestError as e:
+            raise ProviderError(f"Perplexity request failed: {e}") from e
+
+    def _parse_response(
+        self,
+        raw_response: dict[str, Any],
+        latency_ms: float,
+    ) -> PerplexityResponse:
+        """
+        Parse Perplexity's response into unified schema.
+
+        Args:
+            raw_response: Raw JSON from Perplexity.
+            latency_ms: Request latency in milliseconds.
+
+        Returns:
+            PerplexityResponse: Parsed response with search results.
+        """
+        # Extract the main completion
+        choices = raw_response.get("choices", [])
+        if not choices:
+            raise ProviderError("No choices in Perplexity response")
+
+        choice = choices[0]
+        message = choice.get("message", {})
+
+        # Parse usage info
+        usage_data = raw_response.get("usage")
+        usage = None
+        if usage_data:
+            usage = UsageInfo(
+                prompt_tokens=usage_data.get("prompt_tokens", 0),
+                completion_tokens=usage_data.get("completion_tokens", 0),
+                total_tokens=usage_data.get("total_tokens", 0),
+            )
+
+        # Parse search results (Perplexity-specific)
+        search_results = None
+        raw_search = raw_response.get("search_results")
+        if raw_search:
+            search_results = [
+                PerplexitySearchResult(
+                    title=sr.get("title", ""),
+                    url=sr.get("url", ""),
+                    date=sr.get("date"),
+                )
+                for sr in raw_search
+            ]
+
+        return PerplexityResponse(
+            id=raw_response.get("id", ""),
+            provider=self.provider_name,
+            model=raw_response.get("model", self.default_model),
+            content=message.get("content", ""),
+            finish_reason=choice.get("finish_reason"),
+            usage=usage,
+            created_at=datetime.utcnow(),
+            latency_ms=latency_ms,
+            raw_response=raw_response,
+            search_results=search_results,
+        )
@@ -0,0 +1,192 @@
+"""
+Lazy, pluggable registry of LLM provider adapters.
+
+Providers are registered by name against a `module.path:ClassName` target
+and are imported only the first time they are requested. Besides the
+built-in adapters, providers can be added through the
+`ai_visibility.providers` entry point group or the `provider_modules`
+setting.
+
+Innovation: Keeping adapters out of the import graph until first use cuts
+worker startup time and isolates optional provider dependencies, while new
+providers (including local OpenAI-compatible servers) plug in without
+touching the probabilistic engine.
+"""
+
+import importlib
+import logging
+from dataclasses import dataclass
+from importlib.metadata import entry_points
+
+from backend.app.builders.providers.base import BaseLLMProvider
+from backend.app.core.config import Settings, get_settings
+from backend.app.schemas.llm import LLMProvider as LLMProviderEnum
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "ai_visibility.providers"
+
+
+@dataclass(frozen=True)
+class ProviderSpec:
+    """
+    Registration record for a provider adapter.
+
+    Attributes:
+        target: Import path of the adapter as `module.path:ClassName`.
+        default_model: Model used when no override is given.
+        model_setting: Settings attribute holding the default model, if the
+                       default is configurable (takes precedence).
+    """
+
+    target: str
+    default_model: str | None = None
+    model_setting: str | None = None
+
+
+_PROVIDERS: dict[str, ProviderSpec] = {
+    LLMProviderEnum.PERPLEXITY.value: ProviderSpec(
+        target="backend.app.builders.providers.perplexity:PerplexityProvider",
+        default_model="sonar",
+    ),
+    LLMProviderEnum.OPENAI.value: ProviderSpec(
+        target="backend.app.builders.providers.openai:OpenAIProvider",
+        default_model="gpt-4o-mini",
+    ),
+    LLMProviderEnum.ANTHROPIC.value: ProviderSpec(
+        target="backend.app.builders.providers.anthropic:AnthropicProvider",
+        default_model="claude-3-5-sonnet-20241022",
+    ),
+    LLMProviderEnum.OPENAI_COMPATIBLE.value: ProviderSpec(
+        target="backend.app.builders.providers.compatible:OpenAICompatibleProvider",
+        model_setting="openai_compatible_model",
+    ),
+}
+
+# Imported adapter classes, populated on first use
+_LOADED: dict[str, type[BaseLLMProvider]] = {}
+_discovered = False
+
+
+def register_provider(
+    name: str,
+    target: str,
+    default_model: str | None = None,
+) -> None:
+    """
+    Register (or replace) a provider adapter without importing it.
+
+    Args:
+        name: Provider name used by get_provider.
+        target: Import path as `module.path:ClassName`.
+        default_model: Model used when no override is given.
+    """
+    _PROVIDERS[name] = ProviderSpec(target=target, default_model=default_model)
+    _LOADED.pop(name, None)
+
+
+def _discover(settings: Settings) -> None:
+    """Register entry-point and settings-configured providers once."""
+    global _discovered
+    if _discovered:
+        return
+    _discovered = True
+
+    for ep in entry_points(group=ENTRY_POINT_GROUP):
+        # Entry points only contribute their target string; the module is
+        # not imported until the provider is actually requested
+        _PROVIDERS.setdefault(ep.name, ProviderSpec(target=ep.value))
+
+    for name, target in settings.provider_modules.items():
+        _PROVIDERS[name] = ProviderSpec(target=target)
+
+
+def _name(provider: LLMProviderEnum | str) -> str:
+    """Normalize a provider enum or name to its registry key."""
+    return provider.value if isinstance(provider, LLMProviderEnum) else provider
+
+
+def get_provider_spec(
+    provider: LLMProviderEnum | str,
+    settings: Settings | None = None,
+) -> ProviderSpec:
+    """
+    Look up a provider's registration record.
+
+    Args:
+        provider: Provider enum or registered name.
+        settings: Application settings. Uses get_settings() if not provided.
+
+    Returns:
+        ProviderSpec: The registration record.
+
+    Raises:
+        ValueError: If the provider is not registered.
+    """
+    name = _name(provider)
+    if name not in _PROVIDERS:
+        _discover(settings or get_settings())
+    spec = _PROVIDERS.get(name)
+    if spec is None:
+        raise ValueError(f"Unknown provider: {name}")
+    return spec
+
+
+def load_provider_class(
+    provider: LLMProviderEnum | str,
+    settings: Settings | None = None,
+) -> type[BaseLLMProvider]:
+    """
+    Import (on first use) and return a provider adapter class.
+
+    Args:
+        provider: Provider enum or registered name.
+        settings: Application settings. Uses get_settings() if not provided.
+
+    Returns:
+        The adapter class.
+
+    Raises:
+        ValueError: If the provider is unknown or its target is invalid.
+    """
+    name = _name(provider)
+    cached = _LOADED.get(name)
+    if cached is not None:
+        return cached
+
+    spec = get_provider_spec(name, settings)
+    module_path, _, class_name = spec.target.partition(":")
+    if not module_path or not class_name:
+        raise ValueError(f"Invalid provider target for {name}: {spec.target!r}")
+
+    module = importlib.import_module(module_path)
+    provider_class = getattr(module, class_name, None)
+    if not isinstance(provider_class, type) or not issubclass(provider_class, BaseLLMProvider):
+        raise ValueError(f"{spec.target} is not a BaseLLMProvider subclass")
+
+    logger.debug(f"Loaded provider {name} from {spec.target}")
+    _LOADED[name] = provider_class
+    return provider_class
+
+
+def get_default_model(
+    provider: LLMProviderEnum | str,
+    settings: Settings | None = None,
+) -> str | None:
+    """
+    Get the default model for a provider without importing its adapter.
+
+    Args:
+        provider: Provider enum or registered name.
+        settings: Application settings. Uses get_settings() if not provided.
+
+    Returns:
+        The default model, or None if the adapter chooses its own.
+    """
+    settings = settings or get_settings()
+    spec = get_provider_spec(provider, settings)
+    if spec.model_setting is not None:
+        configured: str | None = getattr(settings, spec.model_setting, None)
+        if configured:
+            return configured
+    return spec.default_model
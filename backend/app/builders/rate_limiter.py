@@ -0,0 +1,194 @@
+"""
+Token-aware rate limiting for provider requests.
+
+This module implements an async token bucket that keeps requests within a
+provider's tokens-per-minute budget. Buckets are shared per provider key:
+process-wide in memory, or across worker processes in Redis.
+
+Innovation: Pre-flight token estimates feed the bucket, so large batches
+are paced before the provider starts returning 429s rather than after.
+"""
+
+import asyncio
+import hashlib
+import logging
+from time import monotonic
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+
+class TokenRateLimiter:
+    """
+    Async token bucket for a tokens-per-minute budget.
+
+    The bucket starts full and refills continuously at `tokens_per_minute / 60`
+    tokens per second. Requests larger than the bucket are clamped to its
+    capacity so that a single oversized request can still proceed.
+
+    Attributes:
+        tokens_per_minute: Budget the bucket refills to every minute.
+    """
+
+    def __init__(self, tokens_per_minute: int) -> None:
+        """
+        Initialize the rate limiter.
+
+        Args:
+            tokens_per_minute: Maximum tokens to spend per minute.
+        """
+        self.tokens_per_minute = tokens_per_minute
+        self._capacity = float(tokens_per_minute)
+        self._available = float(tokens_per_minute)
+        self._refill_per_second = tokens_per_minute / 60.0
+        self._updated_at = monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add tokens accrued since the last update."""
+        now = monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._available = min(self._capacity, self._available + elapsed * self._refill_per_second)
+
+    async def acquire(self, tokens: int) -> None:
+        """
+        Wait until `tokens` can be spent, then spend them.
+
+        Args:
+            tokens: Estimated tokens for the upcoming request.
+        """
+        needed = min(float(tokens), self._capacity)
+        async with self._lock:
+            self._refill()
+            while self._available < needed:
+                await asyncio.sleep((needed - self._available) / self._refill_per_second)
+                self._refill()
+            self._available -= needed
+
+
+# Limiters shared by every batch in this process, bound to the loop that
+# created them (asyncio locks cannot cross event loops)
+_limiters: dict[str, TokenRateLimiter] = {}
+_limiters_loop: asyncio.AbstractEventLoop | None = None
+
+
+def rate_limit_key(provider: str, api_key: str) -> str:
+    """
+    Build the budget key shared by all requests on one provider key.
+
+    Args:
+        provider: Provider name.
+        api_key: API key the requests are billed to (only a digest is kept).
+
+    Returns:
+        Key identifying the tokens-per-minute budget.
+    """
+    return f"{provider}:{hashlib.sha256(api_key.encode()).hexdigest()[:16]}"
+
+
+def get_rate_limiter(key: str, tokens_per_minute: int) -> TokenRateLimiter:
+    """
+    Get or create the process-wide token bucket for a budget key.
+
+    Concurrent batches on the same provider key share one bucket, so the
+    budget holds across batches instead of per batch.
+
+    Args:
+        key: Budget key (see rate_limit_key).
+        tokens_per_minute: Budget of the bucket; a changed budget replaces it.
+
+    Returns:
+        TokenRateLimiter: The shared bucket.
+    """
+    global _limiters_loop
+    loop = asyncio.get_running_loop()
+    if loop is not _limiters_loop:
+        _limiters.clear()
+        _limiters_loop = loop
+
+    limiter = _limiters.get(key)
+    if limiter is None or limiter.tokens_per_minute != tokens_per_minute:
+        limiter = _limiters[key] = TokenRateLimiter(tokens_per_minute)
+    return limiter
+
+
+# Atomic refill-and-take: the caller always takes its tokens (the bucket may
+# go into debt) and is told how long to wait until that debt is repaid, so
+# waiters across processes are served in arrival order without polling
+_ACQUIRE_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local needed = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'available', 'updated_at')
+local available = tonumber(state[1]) or capacity
+local updated = tonumber(state[2]) or now
+available = math.min(capacity, available + math.max(0, now - updated) * rate) - needed
+redis.call('HSET', KEYS[1], 'available', available, 'updated_at', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 60)
+return tostring(math.max(0, -available / rate))
+"""
+
+
+class RedisTokenRateLimiter:
+    """
+    Token bucket kept in Redis, shared by every worker process.
+
+    Same contract as TokenRateLimiter, but the bucket state lives in one
+    Redis hash updated atomically by a Lua script, so the budget holds
+    across Celery tasks and worker processes. On Redis errors the
+    process-wide fallback bucket is used instead of failing the batch.
+
+    Attributes:
+        tokens_per_minute: Budget the bucket refills to every minute.
+    """
+
+    KEY_PREFIX = "rate_limit"
+
+    def __init__(
+        self,
+        redis: Redis,  # type: ignore[type-arg]
+        key: str,
+        tokens_per_minute: int,
+        fallback: TokenRateLimiter | None = None,
+    ) -> None:
+        """
+        Initialize the rate limiter.
+
+        Args:
+            redis: Async Redis client.
+            key: Budget key (see rate_limit_key).
+            tokens_per_minute: Maximum tokens to spend per minute.
+            fallback: Local bucket used when Redis is unavailable.
+        """
+        self.redis = redis
+        self.key = f"{self.KEY_PREFIX}:{key}"
+        self.tokens_per_minute = tokens_per_minute
+        self._fallback = fallback or TokenRateLimiter(tokens_per_minute)
+        self._script = redis.register_script(_ACQUIRE_SCRIPT)
+
+    async def acquire(self, tokens: int) -> None:
+        """
+        Spend `tokens` from the shared bucket, waiting until they are covered.
+
+        Args:
+            tokens: Estimated tokens for the upcoming request.
+        """
+        needed = min(tokens, self.tokens_per_minute)
+        try:
+            wait = float(
+                await self._script(
+                    keys=[self.key],
+                    args=[self.tokens_per_minute, self.tokens_per_minute / 60.0, needed],
+                )
+            )
+        except RedisError as e:
+            logger.warning(f"Shared rate limiter unavailable, limiting locally: {e}")
+            await self._fallback.acquire(tokens)
+            return
+        if wait > 0:
+            await asyncio.sleep(wait)
@@ -0,0 +1,130 @@
+"""
+Rollup contributions of analyzed batch runs.
+
+This module converts a batch run's stored metrics into the additive
+per-brand sums kept in the daily visibility rollups, and keys rollups by
+a hash of the normalized prompt so daily reruns of the same prompt land
+in the same series.
+
+Innovation: Contributions are exact integer counts recovered from the
+stored metrics, so a re-analysis can subtract a run's previous
+contribution and add the new one without rescanning any iterations.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from typing import Any
+
+
+def prompt_hash(prompt: str) -> str:
+    """
+    Hash a prompt for rollup keys.
+
+    Whitespace runs are collapsed and case is folded, so trivially
+    reformatted reruns of a prompt share one trend series.
+
+    Args:
+        prompt: Prompt text.
+
+    Returns:
+        Hex SHA-256 of the normalized prompt.
+    """
+    normalized = " ".join(prompt.split()).casefold()
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+@dataclass
+class RollupContribution:
+    """
+    One batch run's additive contribution to a brand's daily rollup.
+
+    Attributes:
+        brand: Tracked brand.
+        runs: Batch runs contributed (1, or -1 when retracting).
+        responses: Analyzed responses.
+        mentioned_responses: Responses mentioning the brand.
+        mention_count: Total mentions of the brand.
+        total_brand_mentions: Total mentions of all tracked brands.
+        rank_sum: Sum of the brand's rank over responses mentioning it.
+        top1_responses: Responses ranking the brand first.
+        consistency_sum: The run's consistency score (0-1).
+    """
+
+    brand: str
+    runs: int
+    responses: int
+    mentioned_responses: int
+    mention_count: int
+    total_brand_mentions: int
+    rank_sum: int
+    top1_responses: int
+    consistency_sum: float
+
+    def negated(self) -> "RollupContribution":
+        """Contribution that retracts this one."""
+        return RollupContribution(
+            brand=self.brand,
+            runs=-self.runs,
+            responses=-self.responses,
+            mentioned_responses=-self.mentioned_responses,
+            mention_count=-self.mention_count,
+            total_brand_mentions=-self.total_brand_mentions,
+            rank_sum=-self.rank_sum,
+            top1_responses=-self.top1_responses,
+            consistency_sum=-self.consistency_sum,
+        )
+
+
+def rollup_contributions(metrics: dict[str, Any] | None) -> list[RollupContribution]:
+    """
+    Derive per-brand rollup contributions from a batch run's metrics.
+
+    Args:
+        metrics: Stored metrics of the batch run (see AnalysisBuilder).
+
+    Returns:
+        One contribution per distinct tracked brand (a brand listed twice,
+        e.g. as target and competitor, contributes once); empty if nothing
+        was analyzed.
+    """
+    metrics = metrics or {}
+    total_responses = int(metrics.get("total_responses", 0))
+    if total_responses == 0:
+        return []
+
+    listed = [metrics["target_visibility"]] if metrics.get("target_visibility") else []
+    listed.extend(metrics.get("competitor_visibility", []))
+    # Rollup rows are keyed by brand, so a repeated brand counts once
+    visibility: dict[str, dict[str, Any]] = {}
+    for v in listed:
+        visibility.setdefault(v["brand"], v)
+    distributions = {r["brand"]: r["rank_distribution"] for r in metrics.get("rankings", [])}
+    total_mentions = sum(int(v["mention_count"]) for v in visibility.values())
+    consistency = float(metrics.get("consistency", {}).get("consistency_score", 0.0))
+
+    contributions: list[RollupContribution] = []
+    for brand, v in visibility.items():
+        distribution = distributions.get(brand)
+        if distribution is not None:
+            # Every response mentioning the brand has exactly one rank
+            mentioned = sum(distribution)
+            rank_sum = sum(rank * count for rank, count in enumerate(distribution, start=1))
+            top1 = distribution[0] if distribution else 0
+        else:
+            mentioned = round(float(v["visibility_rate"]) * total_responses)
+            rank_sum = 0
+            top1 = 0
+        contributions.append(
+            RollupContribution(
+                brand=brand,
+                runs=1,
+                responses=total_responses,
+                mentioned_responses=mentioned,
+                mention_count=int(v["mention_count"]),
+                total_brand_mentions=total_mentions,
+                rank_sum=rank_sum,
+                top1_responses=top1,
+                consistency_sum=consistency,
+            )
+        )
+    return contributions
@@ -13,11 +13,13 @@ single-shot tools cannot provide.
 
 import asyncio
 import logging
+from dataclasses import dataclass
 from datetime import datetime
 from time import perf_counter
 from typing import Any
 from uuid import UUID
 
+from redis.asyncio import Redis
 from tenacity import (
     RetryError,
     retry,
@@ -26,6 +28,7 @@ from tenacity import (
     wait_exponential,
 )
 
+from backend.app.builders.estimator import CostEstimator, PreflightEstimate
 from backend.app.builders.providers import (
     BaseLLMProvider,
     ProviderAuthError,
@@ -33,6 +36,12 @@ from backend.app.builders.providers import (
     RateLimitError,
     get_provider,
 )
+from backend.app.builders.rate_limiter import (
+    RedisTokenRateLimiter,
+    TokenRateLimiter,
+    get_rate_limiter,
+    rate_limit_key,
+)
 from backend.app.core.config import Settings, get_settings
 from backend.app.schemas.llm import (
     LLMProvider as LLMProviderEnum,
@@ -54,6 +63,38 @@ from backend.app.schemas.runner import (
 logger = logging.getLogger(__name__)
 
 
+class BudgetExceededError(Exception):
+    """Raised when starting an iteration would exceed the batch cost ceiling."""
+
+    pass
+
+
+@dataclass
+class _BatchState:
+    """
+    Execution state of one run_batch call.
+
+    Kept per batch so overlapping run_batch calls on one builder never
+    share budgets or concurrency limits.
+
+    Attributes:
+        preflight: Pre-flight estimate sizing the batch.
+        semaphore: Concurrency limit of the batch.
+        rate_limiter: Tokens-per-minute bucket shared with other batches
+            on the same provider key.
+        max_cost_usd: Optional cost ceiling of the batch.
+        spent_usd: Cost committed from completed iterations.
+        reserved_usd: Estimated cost held by in-flight iterations.
+    """
+
+    preflight: PreflightEstimate
+    semaphore: asyncio.Semaphore
+    rate_limiter: TokenRateLimiter | RedisTokenRateLimiter
+    max_cost_usd: float | None = None
+    spent_usd: float = 0.0
+    reserved_usd: float = 0.0
+
+
 class RunnerBuilder:
     """
     The Probabilistic Execution Engine.
@@ -68,14 +109,17 @@ class RunnerBuilder:
 
     Attributes:
         settings: Application settings for defaults and limits.
-        _semaphore: Asyncio semaphore for concurrency control.
         _progress_callback: Optional callback for progress updates.
+        _iteration_callback: Optional callback receiving each finished iteration.
+        _redis: Optional Redis client holding the shared rate-limit buckets.
     """
 
     def __init__(
         self,
         settings: Settings | None = None,
         progress_callback: Any | None = None,
+        iteration_callback: Any | None = None,
+        redis: Redis | None = None,  # type: ignore[type-arg]
     ) -> None:
         """
         Initialize the RunnerBuilder.
@@ -84,10 +128,18 @@ class RunnerBuilder:
             settings: Application settings. Uses get_settings() if not provided.
             progress_callback: Optional async callback for progress updates.
                               Signature: async def callback(progress: RunnerProgress) -> None
+            iteration_callback: Optional (sync or async) callback receiving each
+                               IterationResult as it completes, e.g.
+                               IncrementalAnalyzer.add_iteration for live metrics.
+            redis: Optional Redis client; when given, the tokens-per-minute
+                  budget is enforced across worker processes, otherwise
+                  across the batches of this process.
         """
         self.settings = settings or get_settings()
         self._progress_callback = progress_callback
-        self._semaphore: asyncio.Semaphore | None = None
+        self._iteration_callback = iteration_callback
+        self._redis = redis
+        self._estimator = CostEstimator(self.settings)
 
     async def run_batch(
         self,
@@ -95,6 +147,7 @@ class RunnerBuilder:
         provider: LLMProviderEnum,
         iterations: int | None = None,
         config: BatchConfig | None = None,
+        preflight: PreflightEstimate | None = None,
     ) -> BatchResult:
         """
         Run a prompt N times against an LLM provider.
@@ -111,6 +164,8 @@ class RunnerBuilder:
             provider: The LLM provider to use.
             iterations: Number of iterations (overrides config if provided).
             config: Batch configuration. Uses defaults if not provided.
+            preflight: Pre-flight estimate (e.g. sized from historical usage).
+                       Estimated from the prompt alone if not provided.
 
         Returns:
             BatchResult: Complete results from all iterations with statistics.
@@ -122,14 +177,7 @@ class RunnerBuilder:
         # Build configuration
         config = config or BatchConfig()
         if iterations is not None:
-            config = BatchConfig(
-                iterations=iterations,
-                max_concurrency=config.max_concurrency,
-                temperature=config.temperature,
-                max_tokens=config.max_tokens,
-                model=config.model,
-                system_prompt=config.system_prompt,
-            )
+            config = config.model_copy(update={"iterations": iterations})
 
         # Validate iterations against settings
         if config.iterations > self.settings.max_iterations:
@@ -142,22 +190,63 @@ class RunnerBuilder:
         llm_provider = get_provider(
             provider=provider,
             model=config.model,
+            settings=self.settings,
         )
 
+        model = llm_provider.default_model if config.model is None else config.model
+
+        # Size the batch before any provider call is made
+        if preflight is None:
+            preflight = self._estimator.estimate(
+                prompt=prompt,
+                provider=provider,
+                model=model,
+                iterations=config.iterations,
+                max_concurrency=config.max_concurrency,
+                system_prompt=config.system_prompt,
+                max_tokens=config.max_tokens,
+            )
         # Create batch result
         batch_result = BatchResult(
             provider=provider,
-            model=llm_provider.default_model if config.model is None else config.model,
+            model=model,
             prompt=prompt,
             system_prompt=config.system_prompt,
             config=config,
             started_at=datetime.utcnow(),
+            estimated_cost_usd=preflight.estimated_cost_usd,
         )
 
         # Initialize semaphore for concurrency control
         # Innovation: Semaphore prevents overwhelming the API with too many
-        # concurrent requests, reducing rate limit errors
-        self._semaphore = asyncio.Semaphore(config.max_concurrency)
+        # concurrent requests, reducing rate limit errors. The token bucket,
+        # shared by every batch on the provider key, keeps them all inside
+        # the provider's tokens-per-minute budget.
+        concurrency = min(config.max_concurrency, preflight.recommended_concurrency)
+        budget_key = rate_limit_key(provider.value, llm_provider.api_key)
+        local_limiter = get_rate_limiter(budget_key, preflight.tokens_per_minute)
+        rate_limiter: TokenRateLimiter | RedisTokenRateLimiter = (
+            RedisTokenRateLimiter(
+                self._redis,
+                budget_key,
+                preflight.tokens_per_minute,
+                fallback=local_limiter,
+            )
+            if self._redis is not None
+            else local_limiter
+        )
+        state = _BatchState(
+            preflight=preflight,
+            semaphore=asyncio.Semaphore(concurrency),
+            rate_limiter=rate_limiter,
+            max_cost_usd=config.max_cost_usd,
+        )
+
+        logger.info(
+            f"Batch {batch_result.batch_id} pre-flight: "
+            f"~{preflight.estimated_total_tokens} tokens, "
+            f"~${preflight.estimated_cost_usd:.4f}, concurrency {concurrency}"
+        )
 
         start_time = perf_counter()
 
@@ -174,6 +263,9 @@ class RunnerBuilder:
                     model=config.model,
                     temperature=config.temperature,
                     max_tokens=config.max_tokens,
+                    # Innovation: Every iteration shares the same prefix, so
+                    # only the first pays full prompt cost and TTFT
+                    cache_prompt=config.prompt_caching,
                 )
 
                 # Create tasks for all iterations
@@ -181,6 +273,7 @@ class RunnerBuilder:
                 # dramatically reducing total batch time compared to sequential
                 tasks = [
                     self._run_single_iteration(
+                        state=state,
                         provider=llm_provider,
                         request=llm_request,
                         iteration_index=i,
@@ -215,7 +308,8 @@ class RunnerBuilder:
                     batch_result.iterations.append(iteration_result)
 
         finally:
-            # Record completion time
+            # Record completion time and spend
+            batch_result.total_cost_usd = state.spent_usd
             batch_result.completed_at = datetime.utcnow()
             batch_result.total_duration_ms = (perf_counter() - start_time) * 1000
 
@@ -232,6 +326,7 @@ class RunnerBuilder:
 
     async def _run_single_iteration(
         self,
+        state: _BatchState,
         provider: BaseLLMProvider,
         request: LLMRequest,
         iteration_index: int,
@@ -246,6 +341,7 @@ class RunnerBuilder:
         retry logic for transient failures.
 
         Args:
+            state: Execution state of the batch.
             provider: The LLM provider instance.
             request: The LLM request to execute.
             iteration_index: Zero-based index of this iteration.
@@ -255,13 +351,16 @@ class RunnerBuilder:
         Returns:
             IterationResult: Result of this single iteration.
         """
-        assert self._semaphore is not None, "Semaphore must be initialized"
-
         start_time = perf_counter()
         retry_count = 0
+        reserved_usd = 0.0
 
-        async with self._semaphore:
+        async with state.semaphore:
             try:
+                # Reserve the estimated cost before spending anything
+                reserved_usd = self._reserve_budget(state)
+                await state.rate_limiter.acquire(state.preflight.tokens_per_iteration)
+
                 # The provider.generate method already has tenacity retry
                 # for rate limits, but we add our own handling for tracking
                 response = await self._execute_with_retry(
@@ -270,6 +369,11 @@ class RunnerBuilder:
                 )
 
                 latency_ms = (perf_counter() - start_time) * 1000
+                state.spent_usd += self._estimator.iteration_cost(
+                    provider.provider_name,
+                    response.model,
+                    response.usage,
+                )
 
                 result = IterationResult(
                     iteration_index=iteration_index,
@@ -279,6 +383,15 @@ class RunnerBuilder:
                     retry_count=retry_count,
                 )
 
+            except BudgetExceededError as e:
+                result = IterationResult(
+                    iteration_index=iteration_index,
+                    status=IterationStatus.BUDGET_EXCEEDED,
+                    error_message=str(e),
+                    latency_ms=0.0,
+                )
+                logger.info(f"Iteration {iteration_index} skipped: {e}")
+
             except RateLimitError as e:
                 latency_ms = (perf_counter() - start_time) * 1000
                 result = IterationResult(
@@ -336,6 +449,14 @@ class RunnerBuilder:
                 )
                 logger.exception(f"Iteration {iteration_index} unexpected error")
 
+            finally:
+                state.reserved_usd -= reserved_usd
+
+        result.completed_at = datetime.utcnow()
+
+        # Stream the finished iteration to live consumers
+        await self._send_iteration(result)
+
         # Send progress update if callback is configured
         await self._send_progress(
             batch_id=batch_id,
@@ -346,6 +467,32 @@ class RunnerBuilder:
 
         return result
 
+    def _reserve_budget(self, state: _BatchState) -> float:
+        """
+        Reserve the estimated cost of one iteration against the cost ceiling.
+
+        Spend is committed from actual usage as iterations complete; in-flight
+        iterations hold a reservation so concurrent starts cannot overshoot.
+
+        Args:
+            state: Execution state of the batch.
+
+        Returns:
+            The reserved amount in USD (released when the iteration ends).
+
+        Raises:
+            BudgetExceededError: If the reservation would exceed the ceiling.
+        """
+        estimate = state.preflight.cost_per_iteration_usd
+        if state.max_cost_usd is not None:
+            committed = state.spent_usd + state.reserved_usd
+            if committed + estimate > state.max_cost_usd:
+                raise BudgetExceededError(
+                    f"Cost ceiling ${state.max_cost_usd:.4f} reached (spent ${state.spent_usd:.4f})"
+                )
+        state.reserved_usd += estimate
+        return estimate
+
     @retry(
         retry=retry_if_exception_type(RateLimitError),
         wait=wait_exponential(multiplier=1, min=2, max=60),
@@ -377,6 +524,24 @@ class RunnerBuilder:
         """
         return await provider.generate(request)
 
+    async def _send_iteration(self, result: IterationResult) -> None:
+        """
+        Pass a finished iteration to the iteration callback if configured.
+
+        Args:
+            result: The finished iteration.
+        """
+        if self._iteration_callback is None:
+            return
+
+        try:
+            if asyncio.iscoroutinefunction(self._iteration_callback):
+                await self._iteration_callback(result)
+            else:
+                self._iteration_callback(result)
+        except Exception as e:
+            logger.warning(f"Iteration callback failed: {e}")
+
     async def _send_progress(
         self,
         batch_id: UUID,
@@ -423,6 +588,7 @@ async def run_batch(
     temperature: float = 0.7,
     system_prompt: str | None = None,
     model: str | None = None,
+    max_cost_usd: float | None = None,
 ) -> BatchResult:
     """
     Convenience function to run a probabilistic batch.
@@ -440,6 +606,7 @@ async def run_batch(
         temperature: Sampling temperature (default: 0.7 for variety).
         system_prompt: Optional system prompt.
         model: Optional model override.
+        max_cost_usd: Optional cost ceiling enforced mid-batch.
 
     Returns:
         BatchResult: Complete results with statistics.
@@ -461,6 +628,7 @@ async def run_batch(
         temperature=temperature,
         system_prompt=system_prompt,
         model=model,
+        max_cost_usd=max_cost_usd,
     )
 
     runner = RunnerBuilder()
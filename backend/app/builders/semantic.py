@@ -0,0 +1,132 @@
+"""
+Hashed n-gram TF-IDF vectors for response similarity.
+
+This module turns responses into sparse TF-IDF vectors over hashed word
+unigrams and bigrams and scores cosine similarity between them, as a
+content-level alternative to character-level fuzz.ratio consistency.
+
+Innovation: Hashing n-grams into a fixed feature space needs no fitted
+vocabulary, and one sparse matrix product yields every pairwise cosine,
+so cost grows with the number of distinct n-grams rather than with the
+product of response lengths, and formatting or ordering changes that
+leave the content intact no longer read as inconsistency.
+"""
+
+import re
+from collections import Counter
+from itertools import pairwise
+from zlib import crc32
+
+import numpy as np
+import numpy.typing as npt
+from scipy import sparse
+
+# Hashed feature space; collisions are negligible at response scale
+NGRAM_FEATURES = 1 << 20
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def _ngrams(text: str) -> Counter[str]:
+    """Count the lowercase word unigrams and bigrams of a text."""
+    tokens = _WORD_PATTERN.findall(text.lower())
+    counts = Counter(tokens)
+    counts.update(f"{a} {b}" for a, b in pairwise(tokens))
+    return counts
+
+
+def tfidf_vectors(
+    responses: list[str],
+    n_features: int = NGRAM_FEATURES,
+    weights: npt.NDArray[np.int64] | None = None,
+) -> sparse.csr_matrix:
+    """
+    Build L2-normalized TF-IDF vectors over hashed word n-grams.
+
+    Term frequencies are sublinear (1 + log tf) and document frequencies
+    use smoothed IDF over the given responses. N-grams are hashed with
+    CRC32, which is stable across processes (unlike hash()).
+
+    Args:
+        responses: Response texts.
+        n_features: Size of the hashed feature space.
+        weights: Optional number of documents each response stands for
+            in the document frequencies (near-duplicate cluster sizes).
+
+    Returns:
+        (responses, n_features) CSR matrix with unit-norm rows (all-zero
+        rows for responses without words).
+    """
+    feature_of: dict[str, int] = {}
+    indptr = [0]
+    indices: list[int] = []
+    data: list[float] = []
+    for text in responses:
+        row: dict[int, int] = {}
+        for term, count in _ngrams(text).items():
+            feature = feature_of.get(term)
+            if feature is None:
+                feature = crc32(term.encode()) % n_features
+                feature_of[term] = feature
+            row[feature] = row.get(feature, 0) + count
+        indices.extend(row)
+        data.extend(row.values())
+        indptr.append(len(indices))
+
+    matrix = sparse.csr_matrix(
+        (np.asarray(data, dtype=np.float64), np.asarray(indices, dtype=np.int32), indptr),
+        shape=(len(responses), n_features),
+    )
+    matrix.data = 1.0 + np.log(matrix.data)
+
+    if weights is None:
+        n = len(responses)
+        document_frequency = np.bincount(matrix.indices, minlength=n_features)
+    else:
+        n = int(weights.sum())
+        document_frequency = np.bincount(
+            matrix.indices,
+            weights=np.repeat(weights, np.diff(matrix.indptr)),
+            minlength=n_features,
+        )
+    idf = np.log((1 + n) / (1 + document_frequency[matrix.indices])) + 1.0
+    matrix.data *= idf
+
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    normalized: sparse.csr_matrix = sparse.diags(1.0 / norms) @ matrix
+    return normalized.tocsr()
+
+
+def cosine_matrix(vectors: sparse.csr_matrix) -> npt.NDArray[np.float64]:
+    """
+    All pairwise cosine similarities in one sparse product.
+
+    Args:
+        vectors: Unit-norm rows from tfidf_vectors.
+
+    Returns:
+        Symmetric (n, n) matrix of similarities on a 0-100 scale.
+    """
+    product: npt.NDArray[np.float64] = (vectors @ vectors.T).toarray()
+    return np.clip(product * 100.0, 0.0, 100.0)
+
+
+def paired_cosine(
+    vectors: sparse.csr_matrix,
+    first: npt.NDArray[np.int64],
+    second: npt.NDArray[np.int64],
+) -> npt.NDArray[np.float64]:
+    """
+    Cosine similarities of the given row pairs.
+
+    Args:
+        vectors: Unit-norm rows from tfidf_vectors.
+        first: Row index of each pair's first response.
+        second: Row index of each pair's second response.
+
+    Returns:
+        Array of similarities on a 0-100 scale, one per pair.
+    """
+    products = vectors[first].multiply(vectors[second]).sum(axis=1)
+    return np.clip(np.asarray(products, dtype=np.float64).ravel() * 100.0, 0.0, 100.0)
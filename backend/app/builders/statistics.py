@@ -0,0 +1,230 @@
+"""
+Confidence intervals for probabilistic visibility metrics.
+
+This module provides closed-form binomial intervals (Wilson and
+Clopper-Pearson) for rate metrics and a vectorized nonparametric bootstrap
+for ratio and pairwise metrics (share of voice, mean rank, consistency).
+
+Innovation: Every resample is a row of bootstrap weights, so thousands of
+resamples reduce to a handful of matrix products over the responses x
+brands indicator matrix instead of Python loops over responses.
+"""
+
+import warnings
+from collections.abc import Iterator
+
+import numpy as np
+import numpy.typing as npt
+from scipy.stats import beta, norm
+
+# Resamples per weight block; bounds memory at block x n weights
+BOOTSTRAP_BLOCK_SIZE = 1000
+
+# Fixed seed so stored intervals are reproducible across re-analyses
+BOOTSTRAP_SEED = 0
+
+FloatArray = npt.NDArray[np.float64]
+
+
+def wilson_interval(
+    successes: npt.ArrayLike,
+    trials: int,
+    confidence: float,
+) -> tuple[FloatArray, FloatArray]:
+    """
+    Wilson score interval for binomial proportions.
+
+    Args:
+        successes: Success counts (scalar or array).
+        trials: Number of trials.
+        confidence: Confidence level (e.g. 0.95).
+
+    Returns:
+        Tuple of (lower, upper) bounds, shaped like successes.
+    """
+    k = np.asarray(successes, dtype=np.float64)
+    if trials <= 0:
+        return np.zeros_like(k), np.ones_like(k)
+    z = norm.ppf((1 + confidence) / 2)
+    p = k / trials
+    denominator = 1 + z**2 / trials
+    center = (p + z**2 / (2 * trials)) / denominator
+    half_width = z * np.sqrt(p * (1 - p) / trials + z**2 / (4 * trials**2)) / denominator
+    return np.clip(center - half_width, 0.0, 1.0), np.clip(center + half_width, 0.0, 1.0)
+
+
+def clopper_pearson_interval(
+    successes: npt.ArrayLike,
+    trials: int,
+    confidence: float,
+) -> tuple[FloatArray, FloatArray]:
+    """
+    Exact (Clopper-Pearson) interval for binomial proportions.
+
+    Args:
+        successes: Success counts (scalar or array).
+        trials: Number of trials.
+        confidence: Confidence level (e.g. 0.95).
+
+    Returns:
+        Tuple of (lower, upper) bounds, shaped like successes.
+    """
+    k = np.asarray(successes, dtype=np.float64)
+    if trials <= 0:
+        return np.zeros_like(k), np.ones_like(k)
+    alpha = 1 - confidence
+    lower = np.where(k > 0, beta.ppf(alpha / 2, k, trials - k + 1), 0.0)
+    upper = np.where(k < trials, beta.ppf(1 - alpha / 2, k + 1, trials - k), 1.0)
+    return np.nan_to_num(lower), np.nan_to_num(upper, nan=1.0)
+
+
+def bootstrap_weights(
+    n: int,
+    resamples: int,
+    rng: np.random.Generator,
+    block_size: int = BOOTSTRAP_BLOCK_SIZE,
+) -> Iterator[npt.NDArray[np.float32]]:
+    """
+    Yield blocks of bootstrap weights (how often each response is drawn).
+
+    Each row counts the draws of every response in one resample of size n,
+    built with a single bincount per block.
+
+    Args:
+        n: Number of responses.
+        resamples: Total number of resamples.
+        rng: Random generator.
+        block_size: Resamples per yielded block.
+
+    Yields:
+        (block, n) float32 weight matrices whose rows sum to n.
+    """
+    for start in range(0, resamples, block_size):
+        rows = min(block_size, resamples - start)
+        draws = rng.integers(0, n, size=(rows, n), dtype=np.int64)
+        draws += np.arange(rows, dtype=np.int64)[:, None] * n
+        counts = np.bincount(draws.ravel(), minlength=rows * n)
+        yield counts.reshape(rows, n).astype(np.float32)
+
+
+def percentile_interval(
+    estimates: FloatArray,
+    confidence: float,
+) -> tuple[FloatArray, FloatArray]:
+    """
+    Percentile bootstrap interval along the resample axis.
+
+    Args:
+        estimates: (resamples, ...) bootstrap estimates (NaN ignored).
+        confidence: Confidence level (e.g. 0.95).
+
+    Returns:
+        Tuple of (lower, upper) bounds.
+    """
+    alpha = 1 - confidence
+    with warnings.catch_warnings():
+        # Columns that are undefined in every resample yield NaN bounds
+        warnings.simplefilter("ignore", RuntimeWarning)
+        lower, upper = np.nanquantile(estimates, [alpha / 2, 1 - alpha / 2], axis=0)
+    return lower, upper
+
+
+def bootstrap_brand_metrics(
+    counts: npt.NDArray[np.int64],
+    ranks: npt.NDArray[np.int64],
+    resamples: int,
+    rng: np.random.Generator,
+) -> tuple[FloatArray, FloatArray]:
+    """
+    Bootstrap share of voice and mean rank for every brand at once.
+
+    Args:
+        counts: (responses, brands) mention counts.
+        ranks: (responses, brands) ranks (0 = not mentioned).
+        resamples: Number of resamples.
+        rng: Random generator.
+
+    Returns:
+        Tuple of (share of voice, mean rank) estimates, each shaped
+        (resamples, brands); NaN where undefined in a resample.
+    """
+    n, n_brands = counts.shape
+    mentions = counts.astype(np.float32)
+    rank_values = ranks.astype(np.float32)
+    present = (ranks > 0).astype(np.float32)
+
+    shares = np.empty((resamples, n_brands), dtype=np.float64)
+    mean_ranks = np.empty((resamples, n_brands), dtype=np.float64)
+    row = 0
+    for weights in bootstrap_weights(n, resamples, rng):
+        block = weights.shape[0]
+        resampled_mentions = weights @ mentions
+        totals = resampled_mentions.sum(axis=1, keepdims=True)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            shares[row : row + block] = resampled_mentions / totals
+            mean_ranks[row : row + block] = (weights @ rank_values) / (weights @ present)
+        row += block
+    return shares, mean_ranks
+
+
+def bootstrap_pairwise_mean(
+    similarity: FloatArray,
+    resamples: int,
+    rng: np.random.Generator,
+) -> FloatArray:
+    """
+    Bootstrap the mean pairwise similarity by resampling responses.
+
+    For weights w, the resampled mean over pairs of distinct draws is
+    (w'Sw - sum(w_i^2 S_ii)) / ((sum w)^2 - sum(w_i^2)).
+
+    Args:
+        similarity: (n, n) symmetric similarity matrix.
+        resamples: Number of resamples.
+        rng: Random generator.
+
+    Returns:
+        (resamples,) bootstrap estimates of the mean similarity.
+    """
+    n = similarity.shape[0]
+    matrix = similarity.astype(np.float32)
+    diagonal = np.diag(matrix)
+    estimates = np.empty(resamples, dtype=np.float64)
+    row = 0
+    for weights in bootstrap_weights(n, resamples, rng):
+        block = weights.shape[0]
+        quadratic = ((weights @ matrix) * weights).sum(axis=1)
+        squared = weights**2
+        numerator = quadratic - squared @ diagonal
+        denominator = float(n) ** 2 - squared.sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            estimates[row : row + block] = numerator / denominator
+        row += block
+    return estimates
+
+
+def bootstrap_mean(
+    values: FloatArray,
+    resamples: int,
+    rng: np.random.Generator,
+) -> FloatArray:
+    """
+    Bootstrap the mean of independent observations.
+
+    Args:
+        values: (n,) observations.
+        resamples: Number of resamples.
+        rng: Random generator.
+
+    Returns:
+        (resamples,) bootstrap estimates of the mean.
+    """
+    n = values.shape[0]
+    observations = values.astype(np.float32)
+    estimates = np.empty(resamples, dtype=np.float64)
+    row = 0
+    for weights in bootstrap_weights(n, resamples, rng):
+        block = weights.shape[0]
+        estimates[row : row + block] = (weights @ observations) / n
+        row += block
+    return estimates
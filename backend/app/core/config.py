@@ -14,6 +14,9 @@ from typing import Literal
 from pydantic import Field, PostgresDsn, RedisDsn, computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Pair similarity measures available for consistency scoring
+ConsistencyMetric = Literal["fuzzy", "tfidf"]
+
 
 class Settings(BaseSettings):
     """
@@ -125,6 +128,26 @@ class Settings(BaseSettings):
     anthropic_api_key: str | None = Field(default=None, description="Anthropic API key")
     perplexity_api_key: str | None = Field(default=None, description="Perplexity API key")
 
+    # OpenAI-compatible endpoint (vLLM, llama.cpp server, fakes for load tests)
+    openai_compatible_base_url: str = Field(
+        default="http://localhost:8080/v1",
+        description="Base URL of an OpenAI-compatible chat completions server",
+    )
+    openai_compatible_api_key: str | None = Field(
+        default=None,
+        description="API key for the OpenAI-compatible server (often unused locally)",
+    )
+    openai_compatible_model: str = Field(
+        default="local-model",
+        description="Default model served by the OpenAI-compatible server",
+    )
+
+    # Provider Registry
+    provider_modules: dict[str, str] = Field(
+        default_factory=dict,
+        description="Extra providers as a name -> 'module.path:ClassName' map",
+    )
+
     # Rate Limiting
     rate_limit_requests: int = Field(
         default=100,
@@ -134,6 +157,151 @@ class Settings(BaseSettings):
         default=60,
         description="Rate limit window in seconds",
     )
+    rate_limit_tokens_per_minute: int = Field(
+        default=200_000,
+        ge=1,
+        description="Maximum tokens per minute per provider",
+    )
+
+    # Pre-flight Estimation
+    default_completion_tokens: int = Field(
+        default=512,
+        ge=1,
+        description="Completion tokens assumed per iteration when no history exists",
+    )
+    default_latency_ms: float = Field(
+        default=8000.0,
+        gt=0,
+        description="Latency assumed per iteration when no history exists",
+    )
+
+    # Provider HTTP Connection Pools
+    http_max_connections: int = Field(
+        default=100,
+        ge=1,
+        description="Maximum open connections per provider HTTP pool",
+    )
+    http_keepalive_expiry_seconds: float = Field(
+        default=30.0,
+        ge=0,
+        description="Seconds an idle provider connection is kept for reuse",
+    )
+
+    # Record/Replay Cassettes
+    # Innovation: Cassettes capture real provider exchanges so the full pipeline
+    # can be benchmarked offline against production-shaped responses
+    cassette_mode: Literal["off", "record", "replay"] = Field(
+        default="off",
+        description="Wrap providers in a record/replay cassette (off, record, replay)",
+    )
+    cassette_path: str | None = Field(
+        default=None,
+        description="Path to the gzip'd JSONL cassette (recordings go to <path>.d/)",
+    )
+    cassette_time_scale: float = Field(
+        default=1.0,
+        ge=0.0,
+        description="Multiplier for recorded latencies on replay (0 = no delay)",
+    )
+    cassette_allow_unmatched: bool = Field(
+        default=False,
+        description="On replay, answer unrecorded requests with other recorded responses",
+    )
+
+    # Analysis Engine
+    analysis_workers: int = Field(
+        default=-1,
+        description="CPU workers for pairwise similarity (-1 = all cores)",
+    )
+    analysis_pool_size: int = Field(
+        default=2,
+        ge=-1,
+        description=(
+            "Analysis processes per worker process, started on first use "
+            "(0 = run in a thread, -1 = all cores)"
+        ),
+    )
+    analysis_pool_min_responses: int = Field(
+        default=100,
+        ge=0,
+        description="Smaller batches are analyzed in a thread instead of the process pool",
+    )
+    consistency_metric: ConsistencyMetric = Field(
+        default="fuzzy",
+        description="Pair similarity for consistency: fuzzy (fuzz.ratio) or tfidf (n-gram cosine)",
+    )
+    consistency_exact_max_responses: int = Field(
+        default=300,
+        ge=2,
+        description="Above this many responses, consistency uses sampled pairs",
+    )
+    consistency_exact_max_chars: int = Field(
+        default=500_000,
+        ge=1,
+        description="Above this many total response characters, consistency uses sampled pairs",
+    )
+    consistency_sample_pairs: int = Field(
+        default=2000,
+        ge=100,
+        description="Number of response pairs scored in sampled consistency mode",
+    )
+    response_clustering: bool = Field(
+        default=True,
+        description="Match exact duplicates once and score near-duplicate clusters once",
+    )
+    near_duplicate_max_distance: int = Field(
+        default=3,
+        ge=0,
+        le=15,
+        description="Maximum SimHash bit distance of near duplicates for consistency scoring",
+    )
+    bootstrap_resamples: int = Field(
+        default=2000,
+        ge=0,
+        le=100_000,
+        description="Bootstrap resamples for metric confidence intervals (0 = disabled)",
+    )
+    brand_fuzzy_matching: bool = Field(
+        default=True,
+        description="Credit misspelled brand mentions found by fuzzy matching",
+    )
+    brand_fuzzy_threshold: float = Field(
+        default=85.0,
+        ge=50.0,
+        le=100.0,
+        description="Minimum fuzz.ratio score (0-100) for a fuzzy brand mention",
+    )
+    competitor_discovery_top_n: int = Field(
+        default=10,
+        ge=0,
+        le=100,
+        description="Untracked brands reported by competitor discovery (0 = disabled)",
+    )
+    competitor_discovery_min_responses: int = Field(
+        default=2,
+        ge=1,
+        description="Minimum responses mentioning an entity for it to be reported",
+    )
+    citation_top_hosts: int = Field(
+        default=50,
+        ge=1,
+        description="Number of most cited hosts reported in citation analytics",
+    )
+    brand_dictionary_ttl_seconds: int = Field(
+        default=86400,
+        ge=1,
+        description="How long compiled brand dictionaries stay cached in Redis",
+    )
+    analysis_cache_ttl_seconds: int = Field(
+        default=86400,
+        ge=0,
+        description="How long analysis results stay cached in Redis (0 = no caching)",
+    )
+    analysis_cache_local_size: int = Field(
+        default=128,
+        ge=0,
+        description="Analysis results kept in each process's in-memory LRU",
+    )
 
     # Celery Configuration
     celery_broker_url: str | None = Field(
@@ -105,6 +105,20 @@ def get_session_factory() -> async_sessionmaker[AsyncSession]:
     return _session_factory
 
 
+async def dispose_engine() -> None:
+    """
+    Dispose the database engine singleton and its connection pool.
+
+    Must run on the event loop the pooled connections were opened on;
+    the next get_engine call creates a fresh engine.
+    """
+    global _engine, _session_factory
+    if _engine is not None:
+        await _engine.dispose()
+    _engine = None
+    _session_factory = None
+
+
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """
     FastAPI dependency for database session injection.
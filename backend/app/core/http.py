@@ -0,0 +1,122 @@
+"""
+Shared HTTP connection pools for LLM provider clients.
+
+This module keeps one httpx.AsyncClient per provider endpoint and
+credentials for the lifetime of the event loop, so successive batches
+reuse open TLS connections instead of handshaking again.
+
+Innovation: Provider adapters are created per batch, but their
+connections outlive them; a worker process with a persistent event loop
+pays connection setup once per endpoint rather than once per task.
+"""
+
+import asyncio
+import logging
+
+import httpx
+
+from backend.app.core.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+# Module-level pools (initialized lazily), bound to the loop that created them
+_clients: dict[tuple[str, float, tuple[tuple[str, str], ...]], httpx.AsyncClient] = {}
+_clients_loop: asyncio.AbstractEventLoop | None = None
+
+
+def create_http_client(
+    base_url: str,
+    timeout: float,
+    headers: dict[str, str],
+    settings: Settings | None = None,
+) -> httpx.AsyncClient:
+    """
+    Create an async HTTP client with a keep-alive connection pool.
+
+    Args:
+        base_url: Base URL of the provider's API.
+        timeout: Request timeout in seconds.
+        headers: Default headers (authentication, content type).
+        settings: Application settings with the pool limits.
+
+    Returns:
+        httpx.AsyncClient: Configured async HTTP client.
+    """
+    settings = settings or get_settings()
+    return httpx.AsyncClient(
+        base_url=base_url,
+        timeout=timeout,
+        headers=headers,
+        limits=httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_connections,
+            keepalive_expiry=settings.http_keepalive_expiry_seconds,
+        ),
+    )
+
+
+def get_http_client(
+    base_url: str,
+    timeout: float,
+    headers: dict[str, str],
+) -> httpx.AsyncClient:
+    """
+    Get or create the shared HTTP client for an endpoint and credentials.
+
+    Connections belong to the running event loop; when called from a
+    different loop (a new asyncio.run), pools of the previous loop are
+    not reused. They are closed on their own loop if it is still running
+    in another thread; otherwise they are dropped with a warning, since
+    their loop can no longer run the close (close_http_clients before
+    the loop ends avoids this).
+
+    Args:
+        base_url: Base URL of the provider's API.
+        timeout: Request timeout in seconds.
+        headers: Default headers (authentication, content type).
+
+    Returns:
+        httpx.AsyncClient: The shared HTTP client.
+    """
+    global _clients_loop
+    loop = asyncio.get_running_loop()
+    if loop is not _clients_loop:
+        if _clients_loop is not None and _clients:
+            _release_clients(_clients_loop, list(_clients.values()))
+        _clients.clear()
+        _clients_loop = loop
+
+    key = (base_url, timeout, tuple(sorted(headers.items())))
+    client = _clients.get(key)
+    if client is None or client.is_closed:
+        client = _clients[key] = create_http_client(base_url, timeout, headers)
+    return client
+
+
+def _release_clients(loop: asyncio.AbstractEventLoop, clients: list[httpx.AsyncClient]) -> None:
+    """Close another loop's clients on that loop, or log them as leaked."""
+    if loop.is_running() and not loop.is_closed():
+        for client in clients:
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        return
+    open_clients = [str(client.base_url) for client in clients if not client.is_closed]
+    if open_clients:
+        logger.warning(
+            f"Dropping {len(open_clients)} unclosed HTTP client(s) of a finished event loop: "
+            f"{', '.join(open_clients)}"
+        )
+
+
+async def close_http_clients() -> None:
+    """
+    Close every shared HTTP client.
+
+    Should be called on the owning event loop during shutdown to release
+    all pooled connections.
+    """
+    global _clients_loop
+    clients = list(_clients.values())
+    _clients.clear()
+    _clients_loop = None
+    for client in clients:
+        await client.aclose()
@@ -16,9 +16,10 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from backend.app.core.config import Settings, get_settings
-from backend.app.core.database import get_engine
+from backend.app.core.database import dispose_engine, get_engine
+from backend.app.core.http import close_http_clients
 from backend.app.core.redis import check_redis_health, close_redis_connection
-from backend.app.routers import experiments_router
+from backend.app.routers import experiments_router, trends_router
 
 
 @asynccontextmanager
@@ -56,8 +57,9 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     # Shutdown: Cleanup resources
     print("Shutting down application...")
+    await close_http_clients()
     await close_redis_connection()
-    await engine.dispose()
+    await dispose_engine()
     print("Cleanup complete")
 
 
@@ -136,6 +138,11 @@ def _register_routers(app: FastAPI, settings: Settings) -> None:
         experiments_router,
         prefix=settings.api_v1_prefix,
     )
+    # Cross-experiment trends served from the daily visibility rollups
+    app.include_router(
+        trends_router,
+        prefix=settings.api_v1_prefix,
+    )
 
 
 # Create the application instance
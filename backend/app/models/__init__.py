@@ -7,16 +7,20 @@ results, and statistical analysis data.
 
 from backend.app.models.experiment import (
     BatchRun,
+    BatchRunMetrics,
     BatchRunStatus,
     Experiment,
     ExperimentStatus,
     Iteration,
 )
+from backend.app.models.rollup import VisibilityRollup
 
 __all__ = [
     "BatchRun",
+    "BatchRunMetrics",
     "BatchRunStatus",
     "Experiment",
     "ExperimentStatus",
     "Iteration",
+    "VisibilityRollup",
 ]
@@ -24,6 +24,7 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    UniqueConstraint,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
@@ -276,10 +277,95 @@ class BatchRun(Base):
         cascade="all, delete-orphan",
         lazy="selectin",
     )
+    metrics_versions: Mapped[list["BatchRunMetrics"]] = relationship(
+        "BatchRunMetrics",
+        back_populates="batch_run",
+        cascade="all, delete-orphan",
+        order_by="BatchRunMetrics.version",
+    )
 
     __table_args__ = (Index("ix_batch_runs_experiment_provider", "experiment_id", "provider"),)
 
 
+class BatchRunMetrics(Base):
+    """
+    A versioned snapshot of the metrics computed for a batch run.
+
+    Version 1 is written when the batch runs; every re-analysis of the
+    stored iterations (e.g. with an added competitor or a new whitelist)
+    appends the next version. BatchRun.metrics always mirrors the latest.
+
+    Innovation: Re-analysis turns stored Monte Carlo responses into a
+    reusable asset - brands and trust rules can change after the fact
+    without paying for N more LLM calls, and every version stays auditable.
+
+    Attributes:
+        id: Unique identifier for the metrics record.
+        batch_run_id: Foreign key to the analyzed batch run.
+        version: 1-based version number within the batch run.
+        source: What produced the metrics ("run" or "reanalysis").
+        target_brands: Brands analyzed (first is primary target).
+        domain_whitelist: Trusted domains used for the hallucination check.
+        metrics: Computed analytics.
+        created_at: When the metrics were computed.
+        batch_run: Parent batch run relationship.
+    """
+
+    __tablename__ = "batch_run_metrics"
+
+    id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        primary_key=True,
+        default=uuid4,
+    )
+    batch_run_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("batch_runs.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="1-based metrics version within the batch run",
+    )
+    source: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        default="run",
+        comment="What produced the metrics: run or reanalysis",
+    )
+    target_brands: Mapped[list[str]] = mapped_column(
+        JSONB,
+        nullable=False,
+        comment="Brands analyzed (first is primary target)",
+    )
+    domain_whitelist: Mapped[list[str] | None] = mapped_column(
+        JSONB,
+        nullable=True,
+        comment="Trusted domains used for hallucination detection",
+    )
+    metrics: Mapped[dict[str, Any]] = mapped_column(
+        JSONB,
+        nullable=False,
+        comment="Computed analytics for this version",
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=datetime.utcnow,
+    )
+
+    # Relationships
+    batch_run: Mapped["BatchRun"] = relationship(
+        "BatchRun",
+        back_populates="metrics_versions",
+    )
+
+    __table_args__ = (
+        UniqueConstraint("batch_run_id", "version", name="uq_batch_run_metrics_version"),
+    )
+
+
 class Iteration(Base):
     """
     Stores individual iteration data from a batch run.
@@ -306,7 +392,9 @@ class Iteration(Base):
         is_success: Whether the iteration completed successfully.
         error_message: Error details if iteration failed.
         extracted_brands: Brands mentioned in the response (for quick queries).
+        brand_positions: Mention count, first position and rank per brand.
         citations: Source URLs if provider supports citations (Perplexity).
+        citation_hosts: Distinct hosts of the cited URLs.
         batch_run: Parent batch run relationship.
     """
 
@@ -366,11 +454,21 @@ class Iteration(Base):
         nullable=True,
         comment="Brands mentioned in this response",
     )
+    brand_positions: Mapped[dict[str, dict[str, int]] | None] = mapped_column(
+        JSONB,
+        nullable=True,
+        comment="Per mentioned brand: mention count, first position and rank",
+    )
     citations: Mapped[list[str] | None] = mapped_column(
         JSONB,
         nullable=True,
         comment="Source URLs from Perplexity responses",
     )
+    citation_hosts: Mapped[list[str] | None] = mapped_column(
+        JSONB,
+        nullable=True,
+        comment="Distinct hosts of the cited URLs",
+    )
 
     # Token usage for this iteration
     prompt_tokens: Mapped[int | None] = mapped_column(
@@ -402,4 +500,19 @@ class Iteration(Base):
     __table_args__ = (
         Index("ix_iterations_batch_success", "batch_run_id", "is_success"),
         Index("ix_iterations_batch_index", "batch_run_id", "iteration_index"),
+        Index("ix_iterations_created_success", "created_at", "is_success"),
+        # Innovation: GIN indexes answer containment queries such as
+        # extracted_brands @> '["Salesforce"]' across every stored run
+        Index(
+            "ix_iterations_extracted_brands",
+            "extracted_brands",
+            postgresql_using="gin",
+            postgresql_ops={"extracted_brands": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_iterations_citation_hosts",
+            "citation_hosts",
+            postgresql_using="gin",
+            postgresql_ops={"citation_hosts": "jsonb_path_ops"},
+        ),
     )
@@ -0,0 +1,89 @@
+"""
+SQLAlchemy model for daily cross-experiment visibility rollups.
+
+This module defines the rollup table that aggregates brand visibility per
+prompt, brand, provider, model and day across every completed batch run.
+
+Innovation: Rollups store additive sums (not rates), so each completed or
+re-analyzed batch run updates them incrementally with one upsert, and
+trend dashboards read O(days) rows instead of scanning O(iterations).
+"""
+
+from datetime import date, datetime
+from uuid import UUID, uuid4
+
+from sqlalchemy import Date, DateTime, Float, Index, Integer, String, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.app.core.database import Base
+
+
+class VisibilityRollup(Base):
+    """
+    Daily visibility aggregates of one brand for one prompt and model.
+
+    Rates are derived at read time from the sums, so merging days,
+    providers or models stays exact (e.g. visibility = mentioned_responses
+    / responses, share of voice = mention_count / total_brand_mentions).
+
+    Attributes:
+        id: Unique identifier for the rollup row.
+        prompt_hash: SHA-256 of the normalized prompt.
+        brand: Tracked brand.
+        provider: LLM provider.
+        model: Model identifier.
+        day: UTC day the batch runs completed.
+        runs: Batch runs aggregated.
+        responses: Analyzed responses.
+        mentioned_responses: Responses mentioning the brand.
+        mention_count: Total mentions of the brand.
+        total_brand_mentions: Total mentions of all tracked brands.
+        rank_sum: Sum of the brand's rank over responses mentioning it.
+        top1_responses: Responses ranking the brand first.
+        consistency_sum: Sum of the runs' consistency scores (0-1).
+        updated_at: Last incremental update.
+    """
+
+    __tablename__ = "visibility_rollups"
+
+    id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        primary_key=True,
+        default=uuid4,
+    )
+    prompt_hash: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+        comment="SHA-256 of the normalized prompt",
+    )
+    brand: Mapped[str] = mapped_column(String(255), nullable=False)
+    provider: Mapped[str] = mapped_column(String(50), nullable=False)
+    model: Mapped[str] = mapped_column(String(100), nullable=False)
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    runs: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    responses: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    mentioned_responses: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    mention_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_brand_mentions: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rank_sum: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    top1_responses: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    consistency_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "prompt_hash",
+            "brand",
+            "provider",
+            "model",
+            "day",
+            name="uq_visibility_rollups_key",
+        ),
+        Index("ix_visibility_rollups_brand_day", "brand", "day"),
+    )
@@ -5,14 +5,24 @@ This module implements the Repository pattern, abstracting database
 operations from business logic. All SQL queries are encapsulated here.
 """
 
+from backend.app.repositories.cache_repo import (
+    AnalysisResultCache,
+    BrandDictionaryCache,
+    CachedAnalysis,
+)
 from backend.app.repositories.experiment_repo import (
     BatchRunRepository,
     ExperimentRepository,
     IterationRepository,
 )
+from backend.app.repositories.rollup_repo import VisibilityRollupRepository
 
 __all__ = [
+    "AnalysisResultCache",
     "BatchRunRepository",
+    "BrandDictionaryCache",
+    "CachedAnalysis",
     "ExperimentRepository",
     "IterationRepository",
+    "VisibilityRollupRepository",
 ]
@@ -0,0 +1,304 @@
+"""
+Repository for Redis-cached analysis artifacts.
+
+This module stores compiled analysis structures and analysis results in
+Redis so repeated analyses of the same experiment skip rebuilding them.
+
+Innovation: Caching per-experiment artifacts in Redis lets every worker
+process share one compiled brand dictionary instead of regenerating
+variants on each analysis run, and memoized results make repeated
+what-if analyses of a batch return without recomputation.
+"""
+
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from backend.app.builders.analysis import BrandDictionary
+
+logger = logging.getLogger(__name__)
+
+
+class BrandDictionaryCache:
+    """
+    Redis cache of compiled brand dictionaries, keyed per experiment.
+
+    Cache failures never fail an analysis: on any Redis error the
+    dictionary is built locally and returned.
+    """
+
+    KEY_PREFIX = "brand_dictionary"
+
+    def __init__(self, redis: Redis, ttl_seconds: int) -> None:  # type: ignore[type-arg]
+        """
+        Initialize the cache.
+
+        Args:
+            redis: Async Redis client.
+            ttl_seconds: Expiry of cached dictionaries.
+        """
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+
+    def _key(self, experiment_id: str) -> str:
+        """Build the Redis key for an experiment."""
+        return f"{self.KEY_PREFIX}:{experiment_id}"
+
+    @staticmethod
+    def source(
+        brands: list[str],
+        aliases: dict[str, list[str]] | None,
+        fingerprint: str,
+    ) -> str:
+        """
+        Digest of everything a compiled dictionary is built from.
+
+        Args:
+            brands: Tracked brands, in column order.
+            aliases: Optional explicit aliases per brand.
+            fingerprint: analysis_fingerprint() of the building settings
+                (covers the fuzzy matching settings).
+
+        Returns:
+            Hex digest; a cached dictionary with another digest is stale.
+        """
+        parameters = json.dumps(
+            [
+                brands,
+                {brand: sorted(names) for brand, names in (aliases or {}).items()},
+                fingerprint,
+            ],
+            sort_keys=True,
+        )
+        return hashlib.sha256(parameters.encode()).hexdigest()[:32]
+
+    async def get(self, experiment_id: str, source: str) -> BrandDictionary | None:
+        """
+        Load a cached dictionary.
+
+        Args:
+            experiment_id: The experiment UUID string.
+            source: Expected source() digest of the dictionary.
+
+        Returns:
+            BrandDictionary or None if absent, stale or unreadable.
+        """
+        try:
+            data = await self.redis.get(self._key(experiment_id))
+        except RedisError as e:
+            logger.warning(f"Brand dictionary cache read failed: {e}")
+            return None
+        if data is None:
+            return None
+        try:
+            entry = json.loads(data)
+            if entry.get("source") != source:
+                return None
+            return BrandDictionary.from_json(entry["dictionary"])
+        except (ValueError, KeyError, AttributeError) as e:
+            logger.warning(f"Ignoring malformed cached brand dictionary: {e}")
+            return None
+
+    async def set(self, experiment_id: str, dictionary: BrandDictionary, source: str) -> None:
+        """
+        Store a dictionary with the configured TTL.
+
+        Args:
+            experiment_id: The experiment UUID string.
+            dictionary: The compiled dictionary.
+            source: source() digest of what the dictionary was built from.
+        """
+        try:
+            await self.redis.set(
+                self._key(experiment_id),
+                json.dumps({"source": source, "dictionary": dictionary.to_json()}),
+                ex=self.ttl_seconds,
+            )
+        except RedisError as e:
+            logger.warning(f"Brand dictionary cache write failed: {e}")
+
+    async def get_or_build(
+        self,
+        experiment_id: str,
+        brands: list[str],
+        build: Callable[[], BrandDictionary],
+        aliases: dict[str, list[str]] | None = None,
+        fingerprint: str = "",
+    ) -> BrandDictionary:
+        """
+        Return the cached dictionary for these inputs, building it on a miss.
+
+        A cached entry built for other brands, aliases or matching
+        settings is rebuilt.
+
+        Args:
+            experiment_id: The experiment UUID string.
+            brands: Tracked brands.
+            build: Factory returning a freshly compiled dictionary.
+            aliases: Explicit aliases the dictionary is built with.
+            fingerprint: analysis_fingerprint() of the building settings.
+
+        Returns:
+            BrandDictionary: The cached or newly built dictionary.
+        """
+        source = self.source(brands, aliases, fingerprint)
+        cached = await self.get(experiment_id, source)
+        if cached is not None:
+            return cached
+
+        dictionary = build()
+        await self.set(experiment_id, dictionary, source)
+        return dictionary
+
+
+@dataclass
+class CachedAnalysis:
+    """
+    The parts of an analysis result that callers store or return.
+
+    Attributes:
+        raw_metrics: Metrics dictionary, as AnalysisResult.raw_metrics.
+        response_brands: Per-response brand hits, as
+            AnalysisResult.response_brands.
+    """
+
+    raw_metrics: dict[str, Any]
+    response_brands: list[dict[str, dict[str, int]]]
+
+
+# Serialized results recently used in this process, most recent last
+_local_results: OrderedDict[str, str] = OrderedDict()
+
+
+class AnalysisResultCache:
+    """
+    Two-level cache of analysis results: an in-process LRU over Redis.
+
+    Keys combine the analyzed content (a batch run id or a payload
+    digest), the tracked brands and aliases, the whitelist and the
+    analysis fingerprint (ANALYSIS_VERSION plus result-affecting
+    settings), so a new analyzer version never reads stale entries;
+    those expire with the TTL. Entries are stored serialized, so callers
+    can mutate what they get back. Cache failures never fail an
+    analysis.
+    """
+
+    KEY_PREFIX = "analysis_result"
+
+    def __init__(
+        self,
+        redis: Redis,  # type: ignore[type-arg]
+        ttl_seconds: int,
+        local_size: int = 128,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            redis: Async Redis client.
+            ttl_seconds: Expiry of cached results in Redis (0 = caching off).
+            local_size: Results kept in the in-process LRU (0 = none).
+        """
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+        self.local_size = local_size
+
+    def key(
+        self,
+        subject: str,
+        brands: list[str],
+        fingerprint: str,
+        aliases: dict[str, list[str]] | None = None,
+        domain_whitelist: list[str] | None = None,
+    ) -> str:
+        """
+        Build the cache key of an analysis.
+
+        The target brand keeps its place; competitors, aliases and
+        whitelist entries are order-insensitive.
+
+        Args:
+            subject: Batch run id, or AnalysisPayload.digest() of the content.
+            brands: Tracked brands (first is primary target).
+            fingerprint: analysis_fingerprint() of the analyzing settings.
+            aliases: Optional extra names per brand.
+            domain_whitelist: Optional trusted domains.
+
+        Returns:
+            The Redis key.
+        """
+        parameters = json.dumps(
+            [
+                brands[:1],
+                sorted(brands[1:]),
+                {brand: sorted(names) for brand, names in (aliases or {}).items()},
+                sorted(domain_whitelist or []),
+            ],
+            sort_keys=True,
+        )
+        digest = hashlib.sha256(parameters.encode()).hexdigest()[:32]
+        return f"{self.KEY_PREFIX}:{fingerprint}:{subject}:{digest}"
+
+    def _remember(self, key: str, data: str) -> None:
+        """Store a serialized result in the in-process LRU."""
+        if self.local_size <= 0:
+            return
+        _local_results[key] = data
+        _local_results.move_to_end(key)
+        while len(_local_results) > self.local_size:
+            _local_results.popitem(last=False)
+
+    async def get(self, key: str) -> CachedAnalysis | None:
+        """
+        Load a cached result, from this process first, then from Redis.
+
+        Args:
+            key: Key from key().
+
+        Returns:
+            CachedAnalysis or None if absent, unreadable or caching is off.
+        """
+        if self.ttl_seconds <= 0:
+            return None
+        data = _local_results.get(key)
+        if data is not None:
+            _local_results.move_to_end(key)
+        else:
+            try:
+                data = await self.redis.get(key)
+            except RedisError as e:
+                logger.warning(f"Analysis result cache read failed: {e}")
+                return None
+            if data is None:
+                return None
+            self._remember(key, data)
+        try:
+            return CachedAnalysis(**json.loads(data))
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Ignoring malformed cached analysis result: {e}")
+            _local_results.pop(key, None)
+            return None
+
+    async def set(self, key: str, result: CachedAnalysis) -> None:
+        """
+        Store a result in this process and in Redis with the configured TTL.
+
+        Args:
+            key: Key from key().
+            result: The analysis result to cache.
+        """
+        if self.ttl_seconds <= 0:
+            return
+        data = json.dumps(asdict(result))
+        self._remember(key, data)
+        try:
+            await self.redis.set(key, data, ex=self.ttl_seconds)
+        except RedisError as e:
+            logger.warning(f"Analysis result cache write failed: {e}")
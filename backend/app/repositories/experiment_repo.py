@@ -9,16 +9,18 @@ enabling testability and flexibility. Async operations ensure non-blocking
 database access for high-concurrency probabilistic workloads.
 """
 
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select, update
+from sqlalchemy import func, or_, select, true, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import noload, selectinload
 
 from backend.app.models.experiment import (
     BatchRun,
+    BatchRunMetrics,
     BatchRunStatus,
     Experiment,
     ExperimentStatus,
@@ -81,17 +83,25 @@ class ExperimentRepository:
         await self.session.refresh(experiment)
         return experiment
 
-    async def get_experiment(self, experiment_id: UUID) -> Experiment | None:
+    async def get_experiment(
+        self,
+        experiment_id: UUID,
+        with_batch_runs: bool = True,
+    ) -> Experiment | None:
         """
         Get an experiment by ID.
 
         Args:
             experiment_id: The experiment UUID.
+            with_batch_runs: If False, skip loading batch runs (and their
+                iterations) for callers that only need the experiment row.
 
         Returns:
             Experiment or None if not found.
         """
         stmt = select(Experiment).where(Experiment.id == experiment_id)
+        if not with_batch_runs:
+            stmt = stmt.options(noload(Experiment.batch_runs))
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
@@ -143,6 +153,34 @@ class ExperimentRepository:
         )
         await self.session.execute(stmt)
 
+    async def update_analysis_config(
+        self,
+        experiment_id: UUID,
+        competitor_brands: list[str] | None,
+        domain_whitelist: list[str] | None,
+        config: dict[str, Any],
+    ) -> None:
+        """
+        Update the brands, whitelist and config used to analyze an experiment.
+
+        Args:
+            experiment_id: The experiment UUID.
+            competitor_brands: Competitor brands for Share of Voice analysis.
+            domain_whitelist: Trusted domains for hallucination detection.
+            config: Experiment configuration (including brand aliases).
+        """
+        stmt = (
+            update(Experiment)
+            .where(Experiment.id == experiment_id)
+            .values(
+                competitor_brands=competitor_brands,
+                domain_whitelist=domain_whitelist,
+                config=config,
+                updated_at=datetime.utcnow(),
+            )
+        )
+        await self.session.execute(stmt)
+
     async def list_experiments(
         self,
         limit: int = 50,
@@ -224,6 +262,33 @@ class BatchRunRepository:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def list_batch_runs(
+        self,
+        experiment_id: UUID,
+        status: BatchRunStatus | None = None,
+    ) -> list[BatchRun]:
+        """
+        List an experiment's batch runs without loading their iterations.
+
+        Args:
+            experiment_id: Parent experiment UUID.
+            status: Optional status filter.
+
+        Returns:
+            List of batch runs, oldest first.
+        """
+        stmt = (
+            select(BatchRun)
+            .where(BatchRun.experiment_id == experiment_id)
+            .options(noload(BatchRun.iterations))
+            .order_by(BatchRun.created_at)
+        )
+        if status:
+            stmt = stmt.where(BatchRun.status == status.value)
+
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
     async def get_batch_run_with_iterations(
         self,
         batch_run_id: UUID,
@@ -315,6 +380,52 @@ class BatchRunRepository:
         )
         await self.session.execute(stmt)
 
+    async def save_metrics_version(
+        self,
+        batch_run_id: UUID,
+        metrics: dict[str, Any],
+        target_brands: list[str],
+        domain_whitelist: list[str] | None = None,
+        source: str = "run",
+    ) -> BatchRunMetrics:
+        """
+        Append a metrics version and make it the batch run's current metrics.
+
+        The version number is stored in the metrics as "metrics_version".
+
+        Args:
+            batch_run_id: The batch run UUID.
+            metrics: Computed analytics dictionary.
+            target_brands: Brands analyzed (first is primary target).
+            domain_whitelist: Trusted domains used for hallucination detection.
+            source: What produced the metrics ("run" or "reanalysis").
+
+        Returns:
+            BatchRunMetrics: The stored metrics version.
+        """
+        latest = await self.session.execute(
+            select(func.max(BatchRunMetrics.version)).where(
+                BatchRunMetrics.batch_run_id == batch_run_id
+            )
+        )
+        version = (latest.scalar_one_or_none() or 0) + 1
+        metrics = {**metrics, "metrics_version": version}
+
+        record = BatchRunMetrics(
+            batch_run_id=batch_run_id,
+            version=version,
+            source=source,
+            target_brands=target_brands,
+            domain_whitelist=domain_whitelist,
+            metrics=metrics,
+        )
+        self.session.add(record)
+        await self.session.execute(
+            update(BatchRun).where(BatchRun.id == batch_run_id).values(metrics=metrics)
+        )
+        await self.session.flush()
+        return record
+
 
 class IterationRepository:
     """
@@ -338,7 +449,9 @@ class IterationRepository:
         status: str = "pending",
         error_message: str | None = None,
         extracted_brands: list[str] | None = None,
+        brand_positions: dict[str, dict[str, int]] | None = None,
         citations: list[str] | None = None,
+        citation_hosts: list[str] | None = None,
         prompt_tokens: int | None = None,
         completion_tokens: int | None = None,
         total_tokens: int | None = None,
@@ -355,7 +468,9 @@ class IterationRepository:
             status: Iteration status string.
             error_message: Error details if failed.
             extracted_brands: Brands mentioned in response.
+            brand_positions: Mention count, first position and rank per brand.
             citations: Source URLs from Perplexity.
+            citation_hosts: Distinct hosts of the cited URLs.
             prompt_tokens: Prompt token count.
             completion_tokens: Completion token count.
             total_tokens: Total token count.
@@ -372,7 +487,9 @@ class IterationRepository:
             status=status,
             error_message=error_message,
             extracted_brands=extracted_brands,
+            brand_positions=brand_positions,
             citations=citations,
+            citation_hosts=citation_hosts,
             prompt_tokens=prompt_tokens,
             completion_tokens=completion_tokens,
             total_tokens=total_tokens,
@@ -428,3 +545,190 @@ class IterationRepository:
 
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
+
+    async def stream_analysis_inputs(
+        self,
+        batch_run_id: UUID,
+        chunk_size: int = 500,
+    ) -> AsyncIterator[tuple[UUID, str, list[str]]]:
+        """
+        Stream the response text and citations of successful iterations.
+
+        Only these columns are fetched, in chunks from a server-side
+        cursor, so re-analysis never materializes full ORM iterations.
+
+        Args:
+            batch_run_id: The batch run UUID.
+            chunk_size: Rows fetched per round trip.
+
+        Yields:
+            Tuple of (iteration id, response text, citation URLs) in
+            iteration order.
+        """
+        stmt = (
+            select(Iteration.id, Iteration.raw_response, Iteration.citations)
+            .where(
+                Iteration.batch_run_id == batch_run_id,
+                Iteration.is_success.is_(True),
+                Iteration.raw_response.is_not(None),
+            )
+            .order_by(Iteration.iteration_index)
+            .execution_options(yield_per=chunk_size)
+        )
+        result = await self.session.stream(stmt)
+        async for iteration_id, raw_response, citations in result:
+            yield iteration_id, raw_response or "", citations or []
+
+    async def update_brand_hits(
+        self,
+        hits: dict[UUID, dict[str, dict[str, int]]],
+    ) -> None:
+        """
+        Rewrite the extracted brands of iterations after a re-analysis.
+
+        Args:
+            hits: Per iteration id, {brand: {"count", "position", "rank"}}.
+        """
+        if not hits:
+            return
+        await self.session.execute(
+            update(Iteration),
+            [
+                {
+                    "id": iteration_id,
+                    "extracted_brands": list(brands),
+                    "brand_positions": brands,
+                }
+                for iteration_id, brands in hits.items()
+            ],
+        )
+
+    async def get_brand_visibility(
+        self,
+        brand: str,
+        since: datetime,
+        until: datetime | None = None,
+        provider: str | None = None,
+    ) -> tuple[int, int, float | None]:
+        """
+        Aggregate a brand's visibility across every stored run in a window.
+
+        Counts analyzed, successful iterations of experiments that track
+        the brand, using the GIN index on extracted_brands for mentions.
+
+        Innovation: Cross-experiment visibility becomes one indexed SQL
+        aggregate instead of a rescan of every raw response.
+
+        Args:
+            brand: Brand name exactly as tracked by the experiments.
+            since: Window start (iteration creation time, inclusive).
+            until: Optional window end (exclusive).
+            provider: Optional provider filter.
+
+        Returns:
+            Tuple of (analyzed responses, responses mentioning the brand,
+            mean rank when mentioned).
+        """
+        mentioned = Iteration.extracted_brands.contains([brand])
+        stmt = (
+            select(
+                func.count(Iteration.id),
+                func.count(Iteration.id).filter(mentioned),
+                func.avg(Iteration.brand_positions[brand]["rank"].as_integer()),
+            )
+            .join(BatchRun, Iteration.batch_run_id == BatchRun.id)
+            .join(Experiment, BatchRun.experiment_id == Experiment.id)
+            .where(
+                Iteration.is_success.is_(True),
+                Iteration.extracted_brands.is_not(None),
+                Iteration.created_at >= since,
+                or_(
+                    Experiment.target_brand == brand,
+                    Experiment.competitor_brands.contains([brand]),
+                ),
+            )
+        )
+        if until is not None:
+            stmt = stmt.where(Iteration.created_at < until)
+        if provider is not None:
+            stmt = stmt.where(BatchRun.provider == provider)
+
+        result = await self.session.execute(stmt)
+        total, mentions, avg_rank = result.one()
+        return int(total), int(mentions), float(avg_rank) if avg_rank is not None else None
+
+    async def get_citation_hosts_first_seen(self, hosts: list[str]) -> dict[str, datetime]:
+        """
+        Find when each host was first cited by any stored iteration.
+
+        Candidate iterations are found through the GIN index on
+        citation_hosts, then their host arrays are unnested and grouped.
+
+        Args:
+            hosts: Normalized hosts to look up.
+
+        Returns:
+            Mapping of host to its earliest citation time (hosts never
+            cited before are omitted).
+        """
+        if not hosts:
+            return {}
+
+        cited = (
+            func.jsonb_array_elements_text(Iteration.citation_hosts)
+            .table_valued("value")
+            .lateral("cited")
+        )
+        stmt = (
+            select(cited.c.value, func.min(Iteration.created_at))
+            .select_from(Iteration)
+            .join(cited, true())
+            .where(
+                or_(*(Iteration.citation_hosts.contains([host]) for host in hosts)),
+                cited.c.value.in_(hosts),
+            )
+            .group_by(cited.c.value)
+        )
+
+        result = await self.session.execute(stmt)
+        return dict(result.tuples().all())
+
+    async def get_usage_history(
+        self,
+        provider: str,
+        model: str,
+    ) -> tuple[float | None, float | None, int]:
+        """
+        Get historical completion-token and latency averages for a model.
+
+        Innovation: Feeds the pre-flight estimator with observed usage, so
+        batch sizing improves as more experiments run against each model.
+
+        Args:
+            provider: LLM provider name.
+            model: Model identifier.
+
+        Returns:
+            Tuple of (avg completion tokens, avg latency ms, sample count).
+        """
+        stmt = (
+            select(
+                func.avg(Iteration.completion_tokens),
+                func.avg(Iteration.latency_ms),
+                func.count(Iteration.id),
+            )
+            .join(BatchRun, Iteration.batch_run_id == BatchRun.id)
+            .where(
+                BatchRun.provider == provider,
+                BatchRun.model == model,
+                Iteration.is_success.is_(True),
+                Iteration.completion_tokens.is_not(None),
+            )
+        )
+        result = await self.session.execute(stmt)
+        avg_tokens, avg_latency, samples = result.one()
+        return (
+            float(avg_tokens) if avg_tokens is not None else None,
+            float(avg_latency) if avg_latency is not None else None,
+            int(samples),
+        )
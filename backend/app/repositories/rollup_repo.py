@@ -0,0 +1,147 @@
+"""
+Repository for daily visibility rollups.
+
+This module maintains the visibility_rollups table incrementally and
+serves trend queries over it.
+
+Innovation: Each batch run touches one row per tracked brand through an
+atomic additive upsert, so concurrent workers never lose updates and
+trend reads cost O(days) regardless of how many iterations were stored.
+"""
+
+from collections.abc import Sequence
+from datetime import date
+from typing import Any
+
+from sqlalchemy import Row, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.builders.rollups import RollupContribution
+from backend.app.models.rollup import VisibilityRollup
+
+# Additive columns updated by every contribution
+_SUM_COLUMNS = (
+    "runs",
+    "responses",
+    "mentioned_responses",
+    "mention_count",
+    "total_brand_mentions",
+    "rank_sum",
+    "top1_responses",
+    "consistency_sum",
+)
+
+
+class VisibilityRollupRepository:
+    """
+    Repository for VisibilityRollup upserts and trend queries.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize the repository with a database session."""
+        self.session = session
+
+    async def apply(
+        self,
+        prompt_hash: str,
+        provider: str,
+        model: str,
+        day: date,
+        contributions: list[RollupContribution],
+    ) -> None:
+        """
+        Add batch run contributions to the day's rollups.
+
+        Negated contributions retract a previously applied run (used when
+        a re-analysis replaces its metrics). Contributions of the same brand
+        are summed first, since one upsert may not touch a row twice.
+
+        Args:
+            prompt_hash: Hash of the normalized prompt (see prompt_hash).
+            provider: LLM provider.
+            model: Model identifier.
+            day: UTC day the batch run completed.
+            contributions: One contribution per tracked brand.
+        """
+        if not contributions:
+            return
+
+        rows: dict[str, dict[str, Any]] = {}
+        for c in contributions:
+            row = rows.get(c.brand)
+            if row is None:
+                rows[c.brand] = {
+                    "prompt_hash": prompt_hash,
+                    "brand": c.brand,
+                    "provider": provider,
+                    "model": model,
+                    "day": day,
+                    **{column: getattr(c, column) for column in _SUM_COLUMNS},
+                }
+            else:
+                for column in _SUM_COLUMNS:
+                    row[column] += getattr(c, column)
+        stmt = insert(VisibilityRollup).values(list(rows.values()))
+        table = VisibilityRollup.__table__.c
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_visibility_rollups_key",
+            set_={
+                **{column: table[column] + stmt.excluded[column] for column in _SUM_COLUMNS},
+                "updated_at": func.now(),
+            },
+        )
+        await self.session.execute(stmt)
+
+    async def get_trend(
+        self,
+        brand: str,
+        since: date,
+        until: date | None = None,
+        prompt_hash: str | None = None,
+        provider: str | None = None,
+        model: str | None = None,
+    ) -> Sequence[Row[Any]]:
+        """
+        Daily aggregates of a brand, per provider and model.
+
+        Args:
+            brand: Tracked brand.
+            since: First day (inclusive).
+            until: Optional last day (inclusive).
+            prompt_hash: Optional prompt filter; all prompts if None.
+            provider: Optional provider filter.
+            model: Optional model filter.
+
+        Returns:
+            Rows of (day, provider, model, *summed columns) ordered by day.
+        """
+        stmt = (
+            select(
+                VisibilityRollup.day,
+                VisibilityRollup.provider,
+                VisibilityRollup.model,
+                *(
+                    func.sum(getattr(VisibilityRollup, column)).label(column)
+                    for column in _SUM_COLUMNS
+                ),
+            )
+            .where(
+                VisibilityRollup.brand == brand,
+                VisibilityRollup.day >= since,
+                VisibilityRollup.runs > 0,
+            )
+            .group_by(VisibilityRollup.day, VisibilityRollup.provider, VisibilityRollup.model)
+            .order_by(VisibilityRollup.day, VisibilityRollup.provider, VisibilityRollup.model)
+        )
+        if until is not None:
+            stmt = stmt.where(VisibilityRollup.day <= until)
+        if prompt_hash is not None:
+            stmt = stmt.where(VisibilityRollup.prompt_hash == prompt_hash)
+        if provider is not None:
+            stmt = stmt.where(VisibilityRollup.provider == provider)
+        if model is not None:
+            stmt = stmt.where(VisibilityRollup.model == model)
+
+        result = await self.session.execute(stmt)
+        return result.all()
@@ -6,5 +6,6 @@ to the builders module following the Repository/Builder pattern.
 """
 
 from backend.app.routers.experiments import router as experiments_router
+from backend.app.routers.trends import router as trends_router
 
-__all__ = ["experiments_router"]
+__all__ = ["experiments_router", "trends_router"]
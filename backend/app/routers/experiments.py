@@ -15,10 +15,21 @@ from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query, status
 
+from backend.app.builders.analysis import (
+    AnalysisBuilder,
+    AnalysisPayload,
+    analysis_fingerprint,
+)
+from backend.app.builders.analysis_pool import analyze_offloaded
+from backend.app.core.config import get_settings
 from backend.app.core.database import DbSession
-from backend.app.models.experiment import ExperimentStatus
+from backend.app.core.redis import RedisClient
+from backend.app.models.experiment import BatchRunStatus, ExperimentStatus
+from backend.app.repositories.cache_repo import AnalysisResultCache, CachedAnalysis
 from backend.app.repositories.experiment_repo import (
+    BatchRunRepository,
     ExperimentRepository,
+    IterationRepository,
 )
 from backend.app.schemas.experiment import (
     BatchRunResult,
@@ -28,9 +39,11 @@ from backend.app.schemas.experiment import (
     ExperimentResponse,
     ExperimentStatusResponse,
     IterationDetail,
+    ReanalyzeRequest,
     VisibilityReport,
+    WhatIfResponse,
 )
-from backend.app.worker import execute_experiment_task
+from backend.app.worker import execute_experiment_task, reanalyze_experiment_task
 
 router = APIRouter(prefix="/experiments", tags=["Experiments"])
 
@@ -84,6 +97,10 @@ async def create_experiment(
         config["model"] = request.model
     if request.system_prompt:
         config["system_prompt"] = request.system_prompt
+    if request.max_cost_usd is not None:
+        config["max_cost_usd"] = request.max_cost_usd
+    if request.brand_aliases:
+        config["brand_aliases"] = request.brand_aliases
 
     # Create experiment in database
     exp_repo = ExperimentRepository(session)
@@ -112,6 +129,201 @@ async def create_experiment(
     )
 
 
+@router.post(
+    "/{experiment_id}/reanalyze",
+    response_model=ExperimentResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Re-analyze stored iterations",
+    description="""
+    Recompute an experiment's metrics from its stored iterations.
+
+    Competitor brands, brand aliases and the domain whitelist can be
+    replaced; omitted fields keep their current values. No LLM provider is
+    called. Each re-analysis stores a new metrics version on the batch run,
+    which becomes the batch run's current metrics.
+
+    **Innovation**: Revising the competitive set after the fact reuses the
+    Monte Carlo responses already paid for instead of re-running them.
+    """,
+)
+async def reanalyze_experiment(
+    experiment_id: UUID,
+    request: ReanalyzeRequest,
+    session: DbSession,
+) -> ExperimentResponse:
+    """
+    Queue a re-analysis of an experiment's stored iterations.
+
+    Args:
+        experiment_id: The experiment UUID.
+        request: Replacement brands and whitelist.
+        session: Database session.
+
+    Returns:
+        ExperimentResponse with experiment ID and job ID.
+
+    Raises:
+        HTTPException: If experiment not found or not complete.
+    """
+    exp_repo = ExperimentRepository(session)
+    experiment = await exp_repo.get_experiment(experiment_id, with_batch_runs=False)
+
+    if not experiment:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Experiment {experiment_id} not found",
+        )
+
+    if experiment.status != ExperimentStatus.COMPLETED.value:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Experiment is {experiment.status}, re-analysis requires a completed run",
+        )
+
+    task = reanalyze_experiment_task.delay(
+        experiment_id=str(experiment.id),
+        competitor_brands=request.competitor_brands,
+        brand_aliases=request.brand_aliases,
+        domain_whitelist=request.domain_whitelist,
+        batch_run_id=str(request.batch_run_id) if request.batch_run_id else None,
+    )
+
+    logger.info(f"Re-analysis of experiment {experiment.id} queued as task {task.id}")
+
+    return ExperimentResponse(
+        experiment_id=experiment.id,
+        job_id=task.id,
+        status="pending",
+        message="Re-analysis queued; no provider calls will be made",
+    )
+
+
+@router.post(
+    "/{experiment_id}/what-if",
+    response_model=WhatIfResponse,
+    summary="Analyze a stored batch run with other brands or whitelist",
+    description="""
+    Compute an experiment's metrics for a different competitor set, brand
+    aliases or domain whitelist without storing them.
+
+    Omitted fields keep the experiment's current values. The latest
+    completed batch run is analyzed unless batch_run_id is given. Results
+    are memoized per batch run and parameters, so repeated queries
+    (e.g. dashboard variants) return without recomputation.
+
+    **Innovation**: Competitive-set exploration runs against responses
+    already paid for, and the analysis cache makes it interactive.
+    """,
+)
+async def what_if_analysis(
+    experiment_id: UUID,
+    request: ReanalyzeRequest,
+    session: DbSession,
+    redis: RedisClient,  # type: ignore[type-arg]
+) -> WhatIfResponse:
+    """
+    Analyze a stored batch run with replacement brands or whitelist.
+
+    Args:
+        experiment_id: The experiment UUID.
+        request: Replacement brands, aliases and whitelist.
+        session: Database session.
+        redis: Redis client for the analysis cache.
+
+    Returns:
+        WhatIfResponse with the computed metrics.
+
+    Raises:
+        HTTPException: If the experiment or a completed batch run is not found.
+    """
+    settings = get_settings()
+    experiment = await ExperimentRepository(session).get_experiment(
+        experiment_id, with_batch_runs=False
+    )
+    if not experiment:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Experiment {experiment_id} not found",
+        )
+
+    batch_runs = await BatchRunRepository(session).list_batch_runs(
+        experiment_id,
+        status=BatchRunStatus.COMPLETED,
+    )
+    if request.batch_run_id is not None:
+        batch_runs = [br for br in batch_runs if br.id == request.batch_run_id]
+    if not batch_runs:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No completed batch run to analyze for experiment {experiment_id}",
+        )
+    batch_run = batch_runs[-1]
+
+    competitor_brands = request.competitor_brands
+    if competitor_brands is None:
+        competitor_brands = experiment.competitor_brands
+    domain_whitelist = request.domain_whitelist
+    if domain_whitelist is None:
+        domain_whitelist = experiment.domain_whitelist
+    aliases = request.brand_aliases
+    if aliases is None:
+        aliases = (experiment.config or {}).get("brand_aliases")
+    target_brands = [experiment.target_brand, *(competitor_brands or [])]
+
+    cache = AnalysisResultCache(
+        redis,
+        ttl_seconds=settings.analysis_cache_ttl_seconds,
+        local_size=settings.analysis_cache_local_size,
+    )
+    cache_key = cache.key(
+        str(batch_run.id),
+        target_brands,
+        analysis_fingerprint(settings),
+        aliases=aliases,
+        domain_whitelist=domain_whitelist,
+    )
+    analysis = await cache.get(cache_key)
+    cached = analysis is not None
+
+    if analysis is None:
+        responses: list[str] = []
+        citations: list[list[str]] = []
+        async for _, text, urls in IterationRepository(session).stream_analysis_inputs(
+            batch_run.id
+        ):
+            responses.append(text)
+            citations.append([url for url in urls if url])
+
+        result = await analyze_offloaded(
+            AnalysisPayload(
+                batch_id=str(batch_run.id),
+                provider=batch_run.provider,
+                model=batch_run.model,
+                responses=responses,
+                citations=citations,
+            ),
+            target_brands=target_brands,
+            domain_whitelist=domain_whitelist,
+            brand_dictionary=AnalysisBuilder(settings=settings).build_brand_dictionary(
+                target_brands, aliases=aliases
+            ),
+            settings=settings,
+        )
+        analysis = CachedAnalysis(
+            raw_metrics=result.raw_metrics,
+            response_brands=result.response_brands,
+        )
+        await cache.set(cache_key, analysis)
+
+    return WhatIfResponse(
+        experiment_id=experiment.id,
+        batch_run_id=batch_run.id,
+        target_brands=target_brands,
+        cached=cached,
+        metrics=analysis.raw_metrics,
+    )
+
+
 @router.get(
     "/{experiment_id}",
     response_model=ExperimentStatusResponse,
@@ -330,6 +542,7 @@ async def get_visibility_report(
     consistency = metrics.get("consistency", {})
     hallucination = metrics.get("hallucination")
     sov = metrics.get("share_of_voice", [])
+    rankings = metrics.get("rankings", [])
 
     # Find target brand's share of voice
     target_sov = 0.0
@@ -337,6 +550,9 @@ async def get_visibility_report(
         if item.get("brand") == experiment.target_brand:
             target_sov = item.get("share", 0.0)
             break
+    target_rank: dict[str, Any] = next(
+        (r for r in rankings if r.get("brand") == experiment.target_brand), {}
+    )
 
     return VisibilityReport(
         experiment_id=experiment.id,
@@ -350,7 +566,14 @@ async def get_visibility_report(
         hallucination_rate=(
             hallucination.get("hallucination_rate", 0.0) * 100 if hallucination else None
         ),
+        mean_rank=target_rank.get("mean_rank"),
+        rank_variance=target_rank.get("rank_variance"),
+        top_rank_rate=target_rank.get("top1_rate", 0.0) * 100,
         share_of_voice_ranking=sov,
+        rank_distribution=rankings,
+        discovered_competitors=metrics.get("discovered_competitors", []),
+        citation_sources=metrics.get("citations"),
+        response_diversity=metrics.get("diversity"),
         total_iterations=batch_run.total_iterations,
         successful_iterations=batch_run.successful_iterations,
         total_tokens=batch_run.total_tokens,
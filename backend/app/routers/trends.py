@@ -0,0 +1,118 @@
+"""
+FastAPI router for cross-experiment trend endpoints.
+
+This module serves brand visibility time series from the daily
+visibility rollups maintained by the worker.
+
+Innovation: Trends are read from pre-aggregated rollups, so charting a
+brand across months of daily reruns costs one small indexed query
+instead of fetching every experiment report.
+"""
+
+from datetime import date, timedelta
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException, Query, status
+
+from backend.app.builders.rollups import prompt_hash as hash_prompt
+from backend.app.core.database import DbSession
+from backend.app.repositories.experiment_repo import ExperimentRepository
+from backend.app.repositories.rollup_repo import VisibilityRollupRepository
+from backend.app.schemas.trends import TrendPoint, VisibilityTrendResponse
+
+router = APIRouter(prefix="/trends", tags=["Trends"])
+
+# Window used when no start day is given
+DEFAULT_TREND_DAYS = 30
+
+
+@router.get(
+    "/visibility",
+    response_model=VisibilityTrendResponse,
+    summary="Get a brand's visibility trend",
+    description="""
+    Daily visibility, share of voice, rank and consistency of a brand,
+    per provider and model, aggregated across all completed batch runs.
+
+    Filter to one prompt with prompt_hash, or with experiment_id to use
+    that experiment's prompt. Re-analyses update the series in place.
+    """,
+)
+async def get_visibility_trend(
+    session: DbSession,
+    brand: str = Query(min_length=1, description="Tracked brand"),
+    since: date | None = Query(default=None, description="First day (default: 30 days ago)"),
+    until: date | None = Query(default=None, description="Last day (inclusive)"),
+    prompt_hash: str | None = Query(default=None, min_length=64, max_length=64),
+    experiment_id: UUID | None = Query(default=None, description="Use this experiment's prompt"),
+    provider: str | None = Query(default=None),
+    model: str | None = Query(default=None),
+) -> VisibilityTrendResponse:
+    """
+    Get a brand's visibility trend.
+
+    Args:
+        session: Database session.
+        brand: Tracked brand.
+        since: First day (inclusive).
+        until: Last day (inclusive).
+        prompt_hash: Optional prompt filter.
+        experiment_id: Optional experiment whose prompt to filter on.
+        provider: Optional provider filter.
+        model: Optional model filter.
+
+    Returns:
+        VisibilityTrendResponse with one point per day, provider and model.
+
+    Raises:
+        HTTPException: If the experiment is not found.
+    """
+    if experiment_id is not None:
+        experiment = await ExperimentRepository(session).get_experiment(
+            experiment_id, with_batch_runs=False
+        )
+        if not experiment:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Experiment {experiment_id} not found",
+            )
+        prompt_hash = hash_prompt(experiment.prompt)
+
+    since = since or date.today() - timedelta(days=DEFAULT_TREND_DAYS)
+    rows = await VisibilityRollupRepository(session).get_trend(
+        brand,
+        since=since,
+        until=until,
+        prompt_hash=prompt_hash,
+        provider=provider,
+        model=model,
+    )
+
+    points = [
+        TrendPoint(
+            day=row.day,
+            provider=row.provider,
+            model=row.model,
+            runs=row.runs,
+            responses=row.responses,
+            visibility_rate=_percent(row.mentioned_responses, row.responses),
+            share_of_voice=_percent(row.mention_count, row.total_brand_mentions),
+            mean_rank=row.rank_sum / row.mentioned_responses if row.mentioned_responses else None,
+            top_rank_rate=_percent(row.top1_responses, row.responses),
+            consistency_score=row.consistency_sum / row.runs * 100,
+        )
+        for row in rows
+    ]
+
+    return VisibilityTrendResponse(
+        brand=brand,
+        prompt_hash=prompt_hash,
+        since=since,
+        until=until,
+        points=points,
+    )
+
+
+def _percent(part: int, whole: int) -> float:
+    """Part of a whole on a 0-100 scale (0 for an empty whole)."""
+    return part / whole * 100 if whole else 0.0
@@ -13,7 +13,9 @@ from backend.app.schemas.experiment import (
     ExperimentResponse,
     ExperimentStatusResponse,
     IterationDetail,
+    ReanalyzeRequest,
     VisibilityReport,
+    WhatIfResponse,
 )
 from backend.app.schemas.llm import (
     LLMError,
@@ -34,6 +36,7 @@ from backend.app.schemas.runner import (
     RunnerProgress,
     RunnerRequest,
 )
+from backend.app.schemas.trends import TrendPoint, VisibilityTrendResponse
 
 __all__ = [
     "BatchConfig",
@@ -55,8 +58,12 @@ __all__ = [
     "MessageRole",
     "PerplexityResponse",
     "PerplexitySearchResult",
+    "ReanalyzeRequest",
     "RunnerProgress",
     "RunnerRequest",
+    "TrendPoint",
     "UsageInfo",
     "VisibilityReport",
+    "VisibilityTrendResponse",
+    "WhatIfResponse",
 ]
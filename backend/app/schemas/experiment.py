@@ -45,6 +45,11 @@ class ExperimentRequest(BaseModel):
         description="Optional list of competitor brands for Share of Voice analysis",
         examples=[["HubSpot", "Pipedrive", "Zoho CRM"]],
     )
+    brand_aliases: dict[str, list[str]] | None = Field(
+        default=None,
+        description="Optional extra names per brand counted as mentions",
+        examples=[{"Salesforce": ["SFDC", "Sales Cloud"]}],
+    )
     provider: LLMProvider = Field(
         description="LLM provider to use",
         examples=[LLMProvider.PERPLEXITY],
@@ -82,6 +87,61 @@ class ExperimentRequest(BaseModel):
         max_length=2000,
         description="Optional system prompt for all iterations",
     )
+    max_cost_usd: float | None = Field(
+        default=None,
+        gt=0,
+        description="Optional cost ceiling in USD, enforced while the batch runs",
+        examples=[0.5],
+    )
+
+
+class ReanalyzeRequest(BaseModel):
+    """
+    Request schema for re-analyzing an experiment's stored iterations.
+
+    Omitted fields keep the experiment's current values; the target brand
+    and prompt cannot change because the stored responses answer them.
+
+    Innovation: Re-analysis recomputes every metric from responses that
+    were already paid for, so competitors and trusted domains can be
+    revised without re-running the Monte Carlo simulation.
+    """
+
+    competitor_brands: list[str] | None = Field(
+        default=None,
+        max_length=20,
+        description="Replacement list of competitor brands",
+        examples=[["HubSpot", "Pipedrive", "Zoho CRM", "Monday CRM"]],
+    )
+    brand_aliases: dict[str, list[str]] | None = Field(
+        default=None,
+        description="Replacement extra names per brand counted as mentions",
+        examples=[{"Salesforce": ["SFDC", "Sales Cloud"]}],
+    )
+    domain_whitelist: list[str] | None = Field(
+        default=None,
+        description="Replacement trusted domains for hallucination detection",
+        examples=[["salesforce.com", "hubspot.com", "gartner.com"]],
+    )
+    batch_run_id: UUID | None = Field(
+        default=None,
+        description="Re-analyze only this batch run (default: all completed runs)",
+    )
+
+
+class WhatIfResponse(BaseModel):
+    """
+    Response schema for a what-if analysis of a stored batch run.
+
+    Metrics are computed for the requested brands and whitelist without
+    being stored; repeated queries are served from the analysis cache.
+    """
+
+    experiment_id: UUID = Field(description="Experiment ID")
+    batch_run_id: UUID = Field(description="Analyzed batch run")
+    target_brands: list[str] = Field(description="Analyzed brands (first is the target)")
+    cached: bool = Field(description="Whether the result came from the analysis cache")
+    metrics: dict[str, Any] = Field(description="Computed metrics, as stored for batch runs")
 
 
 class ExperimentResponse(BaseModel):
@@ -208,12 +268,40 @@ class VisibilityReport(BaseModel):
         default=None,
         description="Rate of unverified citations (0-100, Perplexity only)",
     )
+    mean_rank: float | None = Field(
+        default=None,
+        description="Target brand's mean rank among tracked brands (1 = first)",
+    )
+    rank_variance: float | None = Field(
+        default=None,
+        description="Variance of the target brand's rank across responses",
+    )
+    top_rank_rate: float = Field(
+        default=0.0,
+        description="Percentage of responses ranking the target brand first (0-100)",
+    )
 
     # Competitive analysis
     share_of_voice_ranking: list[dict[str, Any]] = Field(
         default_factory=list,
         description="All brands ranked by Share of Voice",
     )
+    rank_distribution: list[dict[str, Any]] = Field(
+        default_factory=list,
+        description="Per-brand mean rank, rank variance, top-1/top-3 rates and rank counts",
+    )
+    discovered_competitors: list[dict[str, Any]] = Field(
+        default_factory=list,
+        description="Frequently mentioned brands that are not tracked, with frequencies",
+    )
+    citation_sources: dict[str, Any] | None = Field(
+        default=None,
+        description="Most cited hosts, source stability and per-brand co-cited hosts",
+    )
+    response_diversity: dict[str, Any] | None = Field(
+        default=None,
+        description="Distinct response clusters (exact and near-duplicate) in the run",
+    )
 
     # Metadata
     total_iterations: int = Field(description="Number of iterations")
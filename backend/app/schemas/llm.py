@@ -21,6 +21,7 @@ class LLMProvider(str, Enum):
     OPENAI = "openai"
     ANTHROPIC = "anthropic"
     PERPLEXITY = "perplexity"
+    OPENAI_COMPATIBLE = "openai_compatible"
 
 
 class MessageRole(str, Enum):
@@ -72,6 +73,10 @@ class LLMRequest(BaseModel):
         le=1.0,
         description="Nucleus sampling threshold",
     )
+    cache_prompt: bool = Field(
+        default=False,
+        description="Mark the shared prompt prefix as cacheable (provider-side prompt caching)",
+    )
 
 
 class UsageInfo(BaseModel):
@@ -80,6 +85,14 @@ class UsageInfo(BaseModel):
     prompt_tokens: int = Field(description="Tokens in the prompt")
     completion_tokens: int = Field(description="Tokens in the completion")
     total_tokens: int = Field(description="Total tokens used")
+    cache_read_tokens: int = Field(
+        default=0,
+        description="Prompt tokens served from the provider's prompt cache",
+    )
+    cache_write_tokens: int = Field(
+        default=0,
+        description="Prompt tokens written to the provider's prompt cache",
+    )
 
 
 class LLMResponse(BaseModel):
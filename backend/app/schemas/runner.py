@@ -8,11 +8,14 @@ Innovation: The BatchResult schema captures per-iteration variance data
 enabling Monte Carlo-style statistical analysis of LLM responses.
 """
 
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+import numpy as np
+import numpy.typing as npt
+from pydantic import BaseModel, Field, PrivateAttr
 
 from backend.app.schemas.llm import LLMProvider, LLMResponse
 
@@ -25,6 +28,7 @@ class IterationStatus(str, Enum):
     RATE_LIMITED = "rate_limited"
     TIMEOUT = "timeout"
     AUTH_ERROR = "auth_error"
+    BUDGET_EXCEEDED = "budget_exceeded"
 
 
 class IterationResult(BaseModel):
@@ -53,6 +57,172 @@ class IterationResult(BaseModel):
         default=0,
         description="Number of retries before success/failure",
     )
+    completed_at: datetime | None = Field(
+        default=None,
+        description="When this iteration finished",
+    )
+
+
+# Status column codes index into this tuple
+ITERATION_STATUSES = tuple(IterationStatus)
+_STATUS_CODES = {status: code for code, status in enumerate(ITERATION_STATUSES)}
+
+# Percentiles reported for latency and completion tokens
+PERCENTILES = (50, 90, 95, 99)
+
+
+@dataclass(frozen=True)
+class BatchColumns:
+    """
+    Columnar view of a batch's iterations, built in one pass.
+
+    Every array has one entry per iteration, in iteration order. Missing
+    latencies and timestamps are NaN and missing usage counts are 0.
+
+    Innovation: Batch statistics and the analysis stage read these arrays
+    instead of re-walking pydantic objects, so every aggregate is a single
+    vectorized NumPy reduction.
+
+    Attributes:
+        status: Status codes (indices into ITERATION_STATUSES).
+        success: Successful iterations with a response.
+        latency_ms: Iteration latency (including queueing and retries).
+        response_latency_ms: Provider-reported response latency.
+        completed_s: Completion time in seconds after the batch started.
+        prompt_tokens: Prompt tokens per iteration.
+        completion_tokens: Completion tokens per iteration.
+        total_tokens: Total tokens per iteration.
+        cache_read_tokens: Prompt tokens served from the prompt cache.
+        cache_write_tokens: Prompt tokens written to the prompt cache.
+        responses: Text of successful responses, in iteration order.
+    """
+
+    status: npt.NDArray[np.int8]
+    success: npt.NDArray[np.bool_]
+    latency_ms: npt.NDArray[np.float64]
+    response_latency_ms: npt.NDArray[np.float64]
+    completed_s: npt.NDArray[np.float64]
+    prompt_tokens: npt.NDArray[np.int64]
+    completion_tokens: npt.NDArray[np.int64]
+    total_tokens: npt.NDArray[np.int64]
+    cache_read_tokens: npt.NDArray[np.int64]
+    cache_write_tokens: npt.NDArray[np.int64]
+    responses: list[str]
+
+    @classmethod
+    def from_iterations(
+        cls,
+        iterations: list[IterationResult],
+        started_at: datetime | None = None,
+    ) -> "BatchColumns":
+        """
+        Build the columns from iteration results.
+
+        Args:
+            iterations: Iteration results, in order.
+            started_at: Batch start time for relative completion times.
+
+        Returns:
+            BatchColumns: The columnar view.
+        """
+        nan = float("nan")
+        status: list[int] = []
+        success: list[bool] = []
+        latency: list[float] = []
+        response_latency: list[float] = []
+        completed: list[float] = []
+        usage: list[tuple[int, int, int, int, int]] = []
+        responses: list[str] = []
+
+        for iteration in iterations:
+            response = iteration.response
+            ok = iteration.status == IterationStatus.SUCCESS and response is not None
+            status.append(_STATUS_CODES[iteration.status])
+            success.append(ok)
+            latency.append(nan if iteration.latency_ms is None else iteration.latency_ms)
+            completed.append(
+                (iteration.completed_at - started_at).total_seconds()
+                if iteration.completed_at is not None and started_at is not None
+                else nan
+            )
+            if ok and response is not None:
+                responses.append(response.content)
+                response_latency.append(nan if response.latency_ms is None else response.latency_ms)
+                u = response.usage
+                usage.append(
+                    (
+                        u.prompt_tokens,
+                        u.completion_tokens,
+                        u.total_tokens,
+                        u.cache_read_tokens,
+                        u.cache_write_tokens,
+                    )
+                    if u is not None
+                    else (0, 0, 0, 0, 0)
+                )
+            else:
+                response_latency.append(nan)
+                usage.append((0, 0, 0, 0, 0))
+
+        tokens = np.array(usage, dtype=np.int64).reshape(-1, 5)
+        return cls(
+            status=np.array(status, dtype=np.int8),
+            success=np.array(success, dtype=np.bool_),
+            latency_ms=np.array(latency, dtype=np.float64),
+            response_latency_ms=np.array(response_latency, dtype=np.float64),
+            completed_s=np.array(completed, dtype=np.float64),
+            prompt_tokens=tokens[:, 0],
+            completion_tokens=tokens[:, 1],
+            total_tokens=tokens[:, 2],
+            cache_read_tokens=tokens[:, 3],
+            cache_write_tokens=tokens[:, 4],
+            responses=responses,
+        )
+
+    def __len__(self) -> int:
+        """Number of iterations."""
+        return int(self.status.size)
+
+    def status_counts(self) -> dict[str, int]:
+        """Iteration count per status (every status, including zeros)."""
+        counts = np.bincount(self.status, minlength=len(ITERATION_STATUSES))
+        return {s.value: int(c) for s, c in zip(ITERATION_STATUSES, counts, strict=True)}
+
+    def percentiles(self, values: npt.NDArray[np.float64]) -> dict[str, float]:
+        """p50/p90/p95/p99 of the finite values ({} when there are none)."""
+        finite = values[np.isfinite(values)]
+        if finite.size == 0:
+            return {}
+        points = np.percentile(finite, PERCENTILES)
+        return {f"p{p}": float(v) for p, v in zip(PERCENTILES, points, strict=True)}
+
+    def throughput(self, bucket_s: float = 1.0) -> list[dict[str, float]]:
+        """
+        Completions per time bucket since the batch started.
+
+        Args:
+            bucket_s: Bucket width in seconds.
+
+        Returns:
+            One point per bucket up to the last completion: bucket start
+            offset, completed and successful iterations, and completions
+            per second.
+        """
+        timed = np.isfinite(self.completed_s)
+        if not timed.any():
+            return []
+        buckets = np.floor(np.maximum(self.completed_s[timed], 0.0) / bucket_s).astype(np.int64)
+        completed = np.bincount(buckets)
+        successful = np.bincount(buckets, weights=self.success[timed], minlength=completed.size)
+        return [
+            {
+                "offset_s": i * bucket_s,
+                "completed": int(c),
+                "successful": int(ok),
+                "per_second": float(c) / bucket_s,
+            }
+            for i, (c, ok) in enumerate(zip(completed, successful, strict=True))
+        ]
 
 
 class BatchConfig(BaseModel):
@@ -90,6 +260,15 @@ class BatchConfig(BaseModel):
         default=None,
         description="System prompt to prepend to all iterations",
     )
+    max_cost_usd: float | None = Field(
+        default=None,
+        gt=0,
+        description="Cost ceiling in USD; remaining iterations are skipped once reached",
+    )
+    prompt_caching: bool = Field(
+        default=True,
+        description="Mark the shared system/user prompt prefix as cacheable",
+    )
 
 
 class BatchResult(BaseModel):
@@ -159,6 +338,24 @@ class BatchResult(BaseModel):
     total_prompt_tokens: int = Field(default=0, description="Total prompt tokens used")
     total_completion_tokens: int = Field(default=0, description="Total completion tokens used")
     total_tokens: int = Field(default=0, description="Total tokens used across all iterations")
+    total_cache_read_tokens: int = Field(
+        default=0,
+        description="Total prompt tokens served from the provider's prompt cache",
+    )
+    total_cache_write_tokens: int = Field(
+        default=0,
+        description="Total prompt tokens written to the provider's prompt cache",
+    )
+
+    # Cost Tracking
+    estimated_cost_usd: float | None = Field(
+        default=None,
+        description="Pre-flight cost estimate in USD",
+    )
+    total_cost_usd: float = Field(
+        default=0.0,
+        description="Actual cost in USD of completed iterations",
+    )
 
     # Latency Statistics
     avg_latency_ms: float | None = Field(
@@ -173,6 +370,22 @@ class BatchResult(BaseModel):
         default=None,
         description="Maximum response latency in milliseconds",
     )
+    latency_percentiles_ms: dict[str, float] = Field(
+        default_factory=dict,
+        description="p50/p90/p95/p99 response latency in milliseconds",
+    )
+    completion_token_percentiles: dict[str, float] = Field(
+        default_factory=dict,
+        description="p50/p90/p95/p99 completion tokens of successful iterations",
+    )
+    status_counts: dict[str, int] = Field(
+        default_factory=dict,
+        description="Iteration count per status",
+    )
+    throughput: list[dict[str, float]] = Field(
+        default_factory=list,
+        description="Completions per second over the batch (1-second buckets)",
+    )
 
     # Raw content for analysis phase
     raw_responses: list[str] = Field(
@@ -180,48 +393,69 @@ class BatchResult(BaseModel):
         description="Raw text content from successful iterations for analysis",
     )
 
+    # Columnar view built by the last compute_statistics call
+    _columns: BatchColumns | None = PrivateAttr(default=None)
+
+    def columns(self) -> BatchColumns:
+        """
+        Get the columnar view of the iterations.
+
+        Returns the view built by the last compute_statistics call, so the
+        analysis stage reads the same columns as the statistics; before
+        statistics are computed, a fresh view is built on every call.
+
+        Returns:
+            BatchColumns: Per-iteration NumPy columns.
+        """
+        if self._columns is not None:
+            return self._columns
+        return BatchColumns.from_iterations(self.iterations, self.started_at)
+
     def compute_statistics(self) -> None:
         """
         Compute aggregated statistics from iteration results.
 
         This method should be called after all iterations complete
-        to populate the summary statistics fields.
+        to populate the summary statistics fields. The columnar view is
+        rebuilt on every call and every field is assigned from it, so
+        repeated calls are idempotent and reflect later iteration edits.
         """
+        self._columns = None
         if not self.iterations:
             return
 
-        self.total_iterations = len(self.iterations)
-        self.successful_iterations = sum(
-            1 for i in self.iterations if i.status == IterationStatus.SUCCESS
+        columns = self._columns = BatchColumns.from_iterations(self.iterations, self.started_at)
+        success = columns.success
+
+        self.total_iterations = len(columns)
+        self.successful_iterations = int(
+            np.count_nonzero(columns.status == _STATUS_CODES[IterationStatus.SUCCESS])
         )
         self.failed_iterations = self.total_iterations - self.successful_iterations
-        self.success_rate = (
-            self.successful_iterations / self.total_iterations if self.total_iterations > 0 else 0.0
-        )
+        self.success_rate = self.successful_iterations / self.total_iterations
+        self.status_counts = columns.status_counts()
 
         # Collect successful responses
-        self.raw_responses = []
-        latencies: list[float] = []
+        self.raw_responses = list(columns.responses)
 
-        for iteration in self.iterations:
-            if iteration.status == IterationStatus.SUCCESS and iteration.response:
-                self.raw_responses.append(iteration.response.content)
-
-                # Aggregate usage
-                if iteration.response.usage:
-                    self.total_prompt_tokens += iteration.response.usage.prompt_tokens
-                    self.total_completion_tokens += iteration.response.usage.completion_tokens
-                    self.total_tokens += iteration.response.usage.total_tokens
-
-                # Collect latency
-                if iteration.response.latency_ms is not None:
-                    latencies.append(iteration.response.latency_ms)
+        # Aggregate usage
+        self.total_prompt_tokens = int(columns.prompt_tokens.sum())
+        self.total_completion_tokens = int(columns.completion_tokens.sum())
+        self.total_tokens = int(columns.total_tokens.sum())
+        self.total_cache_read_tokens = int(columns.cache_read_tokens.sum())
+        self.total_cache_write_tokens = int(columns.cache_write_tokens.sum())
 
         # Compute latency statistics
-        if latencies:
-            self.avg_latency_ms = sum(latencies) / len(latencies)
-            self.min_latency_ms = min(latencies)
-            self.max_latency_ms = max(latencies)
+        latencies = columns.response_latency_ms[np.isfinite(columns.response_latency_ms)]
+        if latencies.size:
+            self.avg_latency_ms = float(latencies.mean())
+            self.min_latency_ms = float(latencies.min())
+            self.max_latency_ms = float(latencies.max())
+        self.latency_percentiles_ms = columns.percentiles(latencies)
+        self.completion_token_percentiles = columns.percentiles(
+            columns.completion_tokens[success].astype(np.float64)
+        )
+        self.throughput = columns.throughput()
 
 
 class RunnerRequest(BaseModel):
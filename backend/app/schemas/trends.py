@@ -0,0 +1,43 @@
+"""
+Pydantic schemas for cross-experiment trend responses.
+
+This module defines the API contract for visibility time series built
+from the daily rollups.
+
+Innovation: Trend points expose the same business metrics as the
+per-experiment visibility report, so a dashboard can chart how a brand's
+visibility for a prompt moves day over day.
+"""
+
+from datetime import date
+
+from pydantic import BaseModel, Field
+
+
+class TrendPoint(BaseModel):
+    """
+    Visibility of a brand on one day for one provider and model.
+    """
+
+    day: date = Field(description="UTC day")
+    provider: str = Field(description="LLM provider")
+    model: str = Field(description="Model used")
+    runs: int = Field(description="Batch runs aggregated")
+    responses: int = Field(description="Analyzed responses")
+    visibility_rate: float = Field(description="Responses mentioning the brand (0-100)")
+    share_of_voice: float = Field(description="Share of tracked brand mentions (0-100)")
+    mean_rank: float | None = Field(description="Mean rank when mentioned (1 = first)")
+    top_rank_rate: float = Field(description="Responses ranking the brand first (0-100)")
+    consistency_score: float = Field(description="Mean run consistency (0-100)")
+
+
+class VisibilityTrendResponse(BaseModel):
+    """
+    Daily visibility time series of a brand.
+    """
+
+    brand: str = Field(description="Tracked brand")
+    prompt_hash: str | None = Field(description="Prompt filter (all prompts if null)")
+    since: date = Field(description="First day (inclusive)")
+    until: date | None = Field(description="Last day (inclusive)")
+    points: list[TrendPoint] = Field(description="Points ordered by day")
@@ -12,14 +12,19 @@ to thousands of concurrent experiments.
 
 import asyncio
 import logging
-from datetime import datetime
-from typing import Any
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
 
 from backend.app.core.config import get_settings
 
+if TYPE_CHECKING:
+    from backend.app.repositories.experiment_repo import IterationRepository
+    from backend.app.repositories.rollup_repo import VisibilityRollupRepository
+
 # Initialize Celery app
 settings = get_settings()
 
@@ -47,22 +52,84 @@ celery_app.conf.update(
 logger = logging.getLogger(__name__)
 
 
+# Long-lived event loop of this worker process; the database engine, Redis
+# client and provider HTTP pools are bound to it and reused across tasks
+_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_worker_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get or create the worker process's event loop.
+
+    Created on worker_process_init for prefork workers, or lazily on the
+    first task for pools that do not fire it (solo).
+
+    Returns:
+        asyncio.AbstractEventLoop: The persistent event loop.
+    """
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+    return _loop
+
+
+@worker_process_init.connect  # type: ignore[untyped-decorator]
+def _start_event_loop(**_: Any) -> None:
+    """Create the persistent event loop when a worker process boots."""
+    get_worker_loop()
+
+
+async def _close_connections() -> None:
+    """Close the HTTP pools, Redis client and database engine of the loop."""
+    from backend.app.core.database import dispose_engine
+    from backend.app.core.http import close_http_clients
+    from backend.app.core.redis import close_redis_connection
+
+    await close_http_clients()
+    await close_redis_connection()
+    await dispose_engine()
+
+
+@worker_process_shutdown.connect  # type: ignore[untyped-decorator]
+def _stop_event_loop(**_: Any) -> None:
+    """Release the loop's connections and close it when a worker process exits."""
+    global _loop
+    if _loop is None or _loop.is_closed():
+        return
+    try:
+        _loop.run_until_complete(_close_connections())
+        _loop.run_until_complete(_loop.shutdown_asyncgens())
+    except Exception:
+        logger.exception("Error closing worker connections")
+    finally:
+        _loop.close()
+        _loop = None
+
+
+@worker_process_shutdown.connect  # type: ignore[untyped-decorator]
+def _stop_analysis_pool(**_: Any) -> None:
+    """Stop the analysis process pool when a worker process exits."""
+    from backend.app.builders.analysis_pool import shutdown_analysis_pool
+
+    shutdown_analysis_pool()
+
+
 def run_async(coro: Any) -> Any:
     """
     Helper to run async code in sync Celery tasks.
 
+    Runs on the worker process's persistent event loop, so pooled
+    database, Redis and HTTP connections are reused across tasks and
+    never outlive the loop they were opened on.
+
     Args:
         coro: Coroutine to execute.
 
     Returns:
         Result of the coroutine.
     """
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
+    return get_worker_loop().run_until_complete(coro)
 
 
 @celery_app.task(bind=True, name="execute_experiment")  # type: ignore[untyped-decorator]
@@ -131,18 +198,31 @@ async def _execute_experiment_async(
     Returns:
         Dictionary with execution results.
     """
-    from backend.app.builders.analysis import AnalysisBuilder
+    from backend.app.builders.analysis import (
+        AnalysisBuilder,
+        AnalysisPayload,
+        analysis_fingerprint,
+        extract_citations,
+    )
+    from backend.app.builders.analysis_pool import analyze_offloaded
+    from backend.app.builders.domains import extract_host
+    from backend.app.builders.estimator import CostEstimator
+    from backend.app.builders.providers import get_default_model
+    from backend.app.builders.rollups import prompt_hash
     from backend.app.builders.runner import RunnerBuilder
     from backend.app.core.database import get_session_factory
+    from backend.app.core.redis import get_redis_client
     from backend.app.models.experiment import (
         BatchRunStatus,
         ExperimentStatus,
     )
+    from backend.app.repositories.cache_repo import BrandDictionaryCache
     from backend.app.repositories.experiment_repo import (
         BatchRunRepository,
         ExperimentRepository,
         IterationRepository,
     )
+    from backend.app.repositories.rollup_repo import VisibilityRollupRepository
     from backend.app.schemas.llm import LLMProvider
     from backend.app.schemas.runner import BatchConfig, IterationStatus
 
@@ -166,11 +246,21 @@ async def _execute_experiment_async(
                 ExperimentStatus.RUNNING,
             )
 
+            # Parse provider enum and resolve the model actually used
+            provider_enum = LLMProvider(provider)
+            config_dict = experiment.config or {}
+            resolved_model = (
+                model
+                or config_dict.get("model")
+                or get_default_model(provider_enum)
+                or provider_enum.value
+            )
+
             # Create batch run record
             batch_run = await batch_repo.create_batch_run(
                 experiment_id=UUID(experiment_id),
                 provider=provider,
-                model=model or "default",
+                model=resolved_model,
             )
 
             # Update batch status to running
@@ -182,11 +272,7 @@ async def _execute_experiment_async(
 
             await session.commit()
 
-            # Parse provider enum
-            provider_enum = LLMProvider(provider)
-
             # Build batch configuration from experiment config
-            config_dict = experiment.config or {}
             batch_config = BatchConfig(
                 iterations=config_dict.get("iterations", 10),
                 max_concurrency=config_dict.get("max_concurrency", 10),
@@ -194,6 +280,31 @@ async def _execute_experiment_async(
                 max_tokens=config_dict.get("max_tokens"),
                 model=model or config_dict.get("model"),
                 system_prompt=config_dict.get("system_prompt"),
+                max_cost_usd=config_dict.get("max_cost_usd"),
+                prompt_caching=config_dict.get("prompt_caching", True),
+            )
+
+            # Pre-flight: size the batch from historical usage of this model
+            avg_completion, avg_latency, samples = await iter_repo.get_usage_history(
+                provider=provider,
+                model=resolved_model,
+            )
+            preflight = CostEstimator().estimate(
+                prompt=experiment.prompt,
+                provider=provider_enum,
+                model=resolved_model,
+                iterations=batch_config.iterations,
+                max_concurrency=batch_config.max_concurrency,
+                system_prompt=batch_config.system_prompt,
+                max_tokens=batch_config.max_tokens,
+                historical_completion_tokens=avg_completion,
+                historical_latency_ms=avg_latency,
+            )
+            logger.info(
+                f"Pre-flight for experiment {experiment_id}: "
+                f"~${preflight.estimated_cost_usd:.4f} "
+                f"({preflight.completion_source}, {samples} samples), "
+                f"concurrency {preflight.recommended_concurrency}"
             )
 
             # Execute the batch run
@@ -202,14 +313,50 @@ async def _execute_experiment_async(
                 f"{batch_config.iterations} iterations"
             )
 
-            runner = RunnerBuilder()
+            runner = RunnerBuilder(redis=get_redis_client())
             batch_result = await runner.run_batch(
                 prompt=experiment.prompt,
                 provider=provider_enum,
                 config=batch_config,
+                preflight=preflight,
             )
 
-            # Store iteration results
+            # Run analysis
+            logger.info(f"Analyzing results for experiment {experiment_id}")
+
+            target_brands = [experiment.target_brand]
+            if experiment.competitor_brands:
+                target_brands.extend(experiment.competitor_brands)
+
+            analyzer = AnalysisBuilder(settings=settings)
+
+            # Reuse the experiment's compiled brand dictionary across runs
+            brand_dictionary = await BrandDictionaryCache(
+                get_redis_client(),
+                ttl_seconds=settings.brand_dictionary_ttl_seconds,
+            ).get_or_build(
+                experiment_id,
+                target_brands,
+                build=lambda: analyzer.build_brand_dictionary(
+                    target_brands,
+                    aliases=config_dict.get("brand_aliases"),
+                ),
+                aliases=config_dict.get("brand_aliases"),
+                fingerprint=analysis_fingerprint(settings),
+            )
+
+            # CPU-bound; runs in the analysis pool so the event loop stays free
+            analysis_result = await analyze_offloaded(
+                AnalysisPayload.from_batch(batch_result),
+                target_brands=target_brands,
+                domain_whitelist=experiment.domain_whitelist,
+                brand_dictionary=brand_dictionary,
+                settings=settings,
+            )
+
+            # Store iteration results with their brand hits and citation hosts;
+            # successful responses line up with the analyzed payload in order
+            response_brands = iter(analysis_result.response_brands)
             iterations_data = []
             for iteration in batch_result.iterations:
                 iter_data: dict[str, Any] = {
@@ -223,46 +370,89 @@ async def _execute_experiment_async(
 
                 if iteration.response:
                     iter_data["raw_response"] = iteration.response.content
+                    # Stored so re-analysis can re-check citations later
+                    citations = extract_citations(iteration.response)
+                    iter_data["citations"] = citations or None
+                    hosts = dict.fromkeys(extract_host(url) for url in citations if url)
+                    hosts.pop("", None)
+                    iter_data["citation_hosts"] = list(hosts) or None
                     if iteration.response.usage:
                         iter_data["prompt_tokens"] = iteration.response.usage.prompt_tokens
                         iter_data["completion_tokens"] = iteration.response.usage.completion_tokens
                         iter_data["total_tokens"] = iteration.response.usage.total_tokens
+                    if iter_data["is_success"]:
+                        hits = next(response_brands, {})
+                        iter_data["extracted_brands"] = list(hits)
+                        iter_data["brand_positions"] = hits
 
                 iterations_data.append(iter_data)
 
             await iter_repo.bulk_create_iterations(iterations_data)
 
-            # Run analysis
-            logger.info(f"Analyzing results for experiment {experiment_id}")
-
-            target_brands = [experiment.target_brand]
-            if experiment.competitor_brands:
-                target_brands.extend(experiment.competitor_brands)
-
-            analyzer = AnalysisBuilder()
-            analysis_result = analyzer.analyze_batch(
-                batch_result=batch_result,
-                target_brands=target_brands,
-                domain_whitelist=experiment.domain_whitelist,
-            )
+            # Attach cost accounting and the rollup key to the stored metrics
+            completed_at = datetime.utcnow()
+            metrics = {
+                **analysis_result.raw_metrics,
+                "cost": {
+                    "preflight": preflight.to_dict(),
+                    "total_cost_usd": batch_result.total_cost_usd,
+                    "cache_read_tokens": batch_result.total_cache_read_tokens,
+                    "cache_write_tokens": batch_result.total_cache_write_tokens,
+                    "budget_exceeded_iterations": batch_result.status_counts.get(
+                        IterationStatus.BUDGET_EXCEEDED.value, 0
+                    ),
+                },
+                "runtime": {
+                    "latency_percentiles_ms": batch_result.latency_percentiles_ms,
+                    "completion_token_percentiles": batch_result.completion_token_percentiles,
+                    "status_counts": batch_result.status_counts,
+                    "throughput": batch_result.throughput,
+                },
+                "rollup": {
+                    "prompt_hash": prompt_hash(experiment.prompt),
+                    "day": completed_at.date().isoformat(),
+                },
+            }
+            await _attach_first_seen(iter_repo, metrics, default=completed_at)
+
+            # Fold the run into the daily cross-experiment rollups; a run
+            # whose rollup failed records no rollup key, so re-analysis adds
+            # its contribution instead of retracting one never applied
+            await session.flush()
+            if not await _apply_rollup(
+                VisibilityRollupRepository(session),
+                metrics,
+                provider=provider,
+                model=resolved_model,
+            ):
+                del metrics["rollup"]
 
             # Update batch run with metrics
             await batch_repo.update_batch_status(
                 batch_run.id,
                 BatchRunStatus.COMPLETED,
-                completed_at=datetime.utcnow(),
+                completed_at=completed_at,
                 duration_ms=batch_result.total_duration_ms,
             )
 
             await batch_repo.update_batch_metrics(
                 batch_run.id,
-                metrics=analysis_result.raw_metrics,
+                metrics=metrics,
                 total_iterations=batch_result.total_iterations,
                 successful_iterations=batch_result.successful_iterations,
                 failed_iterations=batch_result.failed_iterations,
                 total_tokens=batch_result.total_tokens,
             )
 
+            # Version 1 of the metrics; re-analyses append later versions
+            metrics_version = await batch_repo.save_metrics_version(
+                batch_run.id,
+                metrics=metrics,
+                target_brands=target_brands,
+                domain_whitelist=experiment.domain_whitelist,
+            )
+            metrics = metrics_version.metrics
+
             # Update experiment status to completed
             await exp_repo.update_experiment_status(
                 UUID(experiment_id),
@@ -284,7 +474,7 @@ async def _execute_experiment_async(
                 "total_iterations": batch_result.total_iterations,
                 "successful_iterations": batch_result.successful_iterations,
                 "duration_ms": batch_result.total_duration_ms,
-                "metrics": analysis_result.raw_metrics,
+                "metrics": metrics,
             }
 
         except Exception as e:
@@ -293,6 +483,352 @@ async def _execute_experiment_async(
             raise
 
 
+@celery_app.task(bind=True, name="reanalyze_experiment")  # type: ignore[untyped-decorator]
+def reanalyze_experiment_task(
+    self: Any,
+    experiment_id: str,
+    competitor_brands: list[str] | None = None,
+    brand_aliases: dict[str, list[str]] | None = None,
+    domain_whitelist: list[str] | None = None,
+    batch_run_id: str | None = None,
+) -> dict[str, Any]:
+    """
+    Recompute an experiment's metrics from its stored iterations.
+
+    No provider is called: responses and citations are streamed from the
+    database and analyzed with the (optionally replaced) brands and
+    whitelist, and each batch run gets a new metrics version.
+
+    Innovation: Turns stored Monte Carlo responses into a reusable asset,
+    so the competitive set can change after the fact at no LLM cost.
+
+    Args:
+        self: Celery task instance (for task_id access).
+        experiment_id: UUID of the experiment to re-analyze.
+        competitor_brands: Replacement competitor brands (None keeps current).
+        brand_aliases: Replacement brand aliases (None keeps current).
+        domain_whitelist: Replacement trusted domains (None keeps current).
+        batch_run_id: Re-analyze only this batch run (default: all completed).
+
+    Returns:
+        Dictionary with re-analysis status and metrics versions.
+    """
+    logger.info(f"Re-analyzing experiment {experiment_id}")
+
+    try:
+        result: dict[str, Any] = run_async(
+            _reanalyze_experiment_async(
+                experiment_id=experiment_id,
+                competitor_brands=competitor_brands,
+                brand_aliases=brand_aliases,
+                domain_whitelist=domain_whitelist,
+                batch_run_id=batch_run_id,
+                task_id=self.request.id,
+            )
+        )
+        return result
+    except Exception as e:
+        # The previous metrics stay valid, so the experiment is not failed
+        logger.exception(f"Re-analysis of experiment {experiment_id} failed: {e}")
+        raise
+
+
+async def _reanalyze_experiment_async(
+    experiment_id: str,
+    competitor_brands: list[str] | None,
+    brand_aliases: dict[str, list[str]] | None,
+    domain_whitelist: list[str] | None,
+    batch_run_id: str | None,
+    task_id: str | None,
+) -> dict[str, Any]:
+    """
+    Async implementation of experiment re-analysis.
+
+    Args:
+        experiment_id: UUID of the experiment.
+        competitor_brands: Replacement competitor brands (None keeps current).
+        brand_aliases: Replacement brand aliases (None keeps current).
+        domain_whitelist: Replacement trusted domains (None keeps current).
+        batch_run_id: Re-analyze only this batch run (default: all completed).
+        task_id: Celery task ID for tracking.
+
+    Returns:
+        Dictionary with re-analysis results.
+    """
+    from backend.app.builders.analysis import (
+        AnalysisBuilder,
+        AnalysisPayload,
+        analysis_fingerprint,
+    )
+    from backend.app.builders.analysis_pool import analyze_offloaded
+    from backend.app.builders.rollups import prompt_hash, rollup_contributions
+    from backend.app.core.database import get_session_factory
+    from backend.app.core.redis import get_redis_client
+    from backend.app.models.experiment import BatchRunStatus
+    from backend.app.repositories.cache_repo import (
+        AnalysisResultCache,
+        BrandDictionaryCache,
+        CachedAnalysis,
+    )
+    from backend.app.repositories.experiment_repo import (
+        BatchRunRepository,
+        ExperimentRepository,
+        IterationRepository,
+    )
+    from backend.app.repositories.rollup_repo import VisibilityRollupRepository
+
+    session_factory = get_session_factory()
+    redis_client = get_redis_client()
+    result_cache = AnalysisResultCache(
+        redis_client,
+        ttl_seconds=settings.analysis_cache_ttl_seconds,
+        local_size=settings.analysis_cache_local_size,
+    )
+
+    async with session_factory() as session:
+        try:
+            exp_repo = ExperimentRepository(session)
+            batch_repo = BatchRunRepository(session)
+            iter_repo = IterationRepository(session)
+            rollup_repo = VisibilityRollupRepository(session)
+
+            experiment = await exp_repo.get_experiment(UUID(experiment_id), with_batch_runs=False)
+            if not experiment:
+                raise ValueError(f"Experiment {experiment_id} not found")
+
+            # Replacements override the stored analysis configuration
+            config_dict = dict(experiment.config or {})
+            if competitor_brands is None:
+                competitor_brands = experiment.competitor_brands
+            if domain_whitelist is None:
+                domain_whitelist = experiment.domain_whitelist
+            if brand_aliases is not None:
+                config_dict["brand_aliases"] = brand_aliases
+
+            target_brands = [experiment.target_brand, *(competitor_brands or [])]
+
+            analyzer = AnalysisBuilder(settings=settings)
+            brand_dictionary = analyzer.build_brand_dictionary(
+                target_brands,
+                aliases=config_dict.get("brand_aliases"),
+            )
+
+            batch_runs = await batch_repo.list_batch_runs(
+                UUID(experiment_id),
+                status=BatchRunStatus.COMPLETED,
+            )
+            if batch_run_id is not None:
+                batch_runs = [br for br in batch_runs if str(br.id) == batch_run_id]
+            if not batch_runs:
+                raise ValueError(f"No completed batch runs to re-analyze for {experiment_id}")
+
+            fingerprint = analysis_fingerprint(settings)
+            versions: dict[str, int] = {}
+            for batch_run in batch_runs:
+                iteration_ids: list[UUID] = []
+                responses: list[str] = []
+                citations: list[list[str]] = []
+                async for iteration_id, text, urls in iter_repo.stream_analysis_inputs(
+                    batch_run.id
+                ):
+                    iteration_ids.append(iteration_id)
+                    responses.append(text)
+                    citations.append([url for url in urls if url])
+
+                # Same brands, aliases and whitelist as an earlier (what-if)
+                # analysis of this run: reuse its result
+                cache_key = result_cache.key(
+                    str(batch_run.id),
+                    target_brands,
+                    fingerprint,
+                    aliases=config_dict.get("brand_aliases"),
+                    domain_whitelist=domain_whitelist,
+                )
+                analysis = await result_cache.get(cache_key)
+                if analysis is None or len(analysis.response_brands) != len(iteration_ids):
+                    analysis_result = await analyze_offloaded(
+                        AnalysisPayload(
+                            batch_id=str(batch_run.id),
+                            provider=batch_run.provider,
+                            model=batch_run.model,
+                            responses=responses,
+                            citations=citations,
+                        ),
+                        target_brands=target_brands,
+                        domain_whitelist=domain_whitelist,
+                        brand_dictionary=brand_dictionary,
+                        settings=settings,
+                    )
+                    analysis = CachedAnalysis(
+                        raw_metrics=analysis_result.raw_metrics,
+                        response_brands=analysis_result.response_brands,
+                    )
+                    await result_cache.set(cache_key, analysis)
+
+                # Per-iteration brand hits follow the revised brand list
+                await iter_repo.update_brand_hits(
+                    dict(zip(iteration_ids, analysis.response_brands, strict=True))
+                )
+
+                previous = batch_run.metrics or {}
+                metrics = _reanalysis_metrics(previous, analysis.raw_metrics)
+
+                # Replace the run's contribution to its day's rollups; runs
+                # analyzed before rollups existed have nothing to retract
+                await _attach_first_seen(
+                    iter_repo, metrics, default=batch_run.completed_at or batch_run.created_at
+                )
+
+                metrics["rollup"] = previous.get("rollup") or {
+                    "prompt_hash": prompt_hash(experiment.prompt),
+                    "day": (batch_run.completed_at or batch_run.created_at).date().isoformat(),
+                }
+                retracted = (
+                    [c.negated() for c in rollup_contributions(previous)]
+                    if "rollup" in previous
+                    else []
+                )
+                for contributions in (retracted, rollup_contributions(metrics)):
+                    await rollup_repo.apply(
+                        metrics["rollup"]["prompt_hash"],
+                        provider=batch_run.provider,
+                        model=batch_run.model,
+                        day=date.fromisoformat(metrics["rollup"]["day"]),
+                        contributions=contributions,
+                    )
+
+                metrics_version = await batch_repo.save_metrics_version(
+                    batch_run.id,
+                    metrics=metrics,
+                    target_brands=target_brands,
+                    domain_whitelist=domain_whitelist,
+                    source="reanalysis",
+                )
+                versions[str(batch_run.id)] = metrics_version.version
+
+            # Later runs and reports use the revised analysis configuration
+            await exp_repo.update_analysis_config(
+                UUID(experiment_id),
+                competitor_brands=competitor_brands,
+                domain_whitelist=domain_whitelist,
+                config=config_dict,
+            )
+
+            await session.commit()
+
+            # Refresh the cached dictionary for the revised brands
+            await BrandDictionaryCache(
+                redis_client,
+                ttl_seconds=settings.brand_dictionary_ttl_seconds,
+            ).set(
+                experiment_id,
+                brand_dictionary,
+                BrandDictionaryCache.source(
+                    target_brands, config_dict.get("brand_aliases"), fingerprint
+                ),
+            )
+
+            logger.info(f"Experiment {experiment_id} re-analyzed: versions {versions}")
+
+            return {
+                "status": "completed",
+                "experiment_id": experiment_id,
+                "task_id": task_id,
+                "target_brands": target_brands,
+                "metrics_versions": versions,
+            }
+
+        except Exception as e:
+            await session.rollback()
+            logger.exception(f"Error re-analyzing experiment {experiment_id}: {e}")
+            raise
+
+
+def _reanalysis_metrics(
+    previous: dict[str, Any],
+    raw_metrics: dict[str, Any],
+) -> dict[str, Any]:
+    """
+    Combine re-analyzed metrics with the run-level facts of the batch run.
+
+    Cost accounting and runtime statistics (latency and token percentiles,
+    status counts, throughput) describe the provider calls, which a
+    re-analysis does not repeat, so they carry over unchanged.
+
+    Args:
+        previous: Current stored metrics of the batch run.
+        raw_metrics: Metrics computed by the re-analysis.
+
+    Returns:
+        dict: New metrics to store.
+    """
+    metrics = dict(raw_metrics)
+    for key in ("cost", "runtime"):
+        if key in previous:
+            metrics[key] = previous[key]
+    return metrics
+
+
+async def _attach_first_seen(
+    iter_repo: "IterationRepository",
+    metrics: dict[str, Any],
+    default: datetime,
+) -> None:
+    """
+    Add each reported host's first citation date to the citation metrics.
+
+    Args:
+        iter_repo: Iteration repository of the current session.
+        metrics: Stored metrics; updated in place.
+        default: Date for hosts with no stored citation (first cited now).
+    """
+    hosts = metrics.get("citations", {}).get("hosts", [])
+    first_seen = await iter_repo.get_citation_hosts_first_seen([h["host"] for h in hosts])
+    for host in hosts:
+        host["first_seen"] = first_seen.get(host["host"], default).date().isoformat()
+
+
+async def _apply_rollup(
+    rollup_repo: "VisibilityRollupRepository",
+    metrics: dict[str, Any],
+    provider: str,
+    model: str,
+) -> bool:
+    """
+    Add a completed batch run's contribution to its day's rollups.
+
+    The upsert runs in a savepoint: rollups are derived data, so a failure
+    is logged and rolled back without discarding the batch's iterations
+    and metrics, whose provider calls were already paid for.
+
+    Args:
+        rollup_repo: Rollup repository of the current session.
+        metrics: Stored metrics of the batch run, with the rollup key.
+        provider: LLM provider of the batch run.
+        model: Model identifier of the batch run.
+
+    Returns:
+        bool: True if the contribution was applied.
+    """
+    from sqlalchemy.exc import SQLAlchemyError
+
+    from backend.app.builders.rollups import rollup_contributions
+
+    try:
+        async with rollup_repo.session.begin_nested():
+            await rollup_repo.apply(
+                metrics["rollup"]["prompt_hash"],
+                provider=provider,
+                model=model,
+                day=date.fromisoformat(metrics["rollup"]["day"]),
+                contributions=rollup_contributions(metrics),
+            )
+    except SQLAlchemyError:
+        logger.exception(f"Failed to update rollups for {provider}/{model}")
+        return False
+    return True
+
+
 async def _mark_experiment_failed(experiment_id: str, error_message: str) -> None:
     """
     Mark an experiment as failed in the database.
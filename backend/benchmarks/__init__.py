@@ -0,0 +1,8 @@
+"""
+Benchmarks for the Probabilistic LLM Analytics Platform.
+
+This package contains runnable benchmark scripts that measure the runner
+and analysis pipeline offline. Each module can be executed directly, e.g.
+`python -m backend.benchmarks.cassette_replay cassettes/sonar.jsonl.gz`, and
+`python -m backend.benchmarks.analysis_suite` profiles every analysis stage.
+"""
@@ -0,0 +1,253 @@
+"""
+Analysis pipeline benchmark suite.
+
+Sweeps synthetic corpora over batch size and tracked brand count, and
+times every AnalysisBuilder stage (normalization, clustering, brand
+matching, ranking, visibility, share of voice, consistency, intervals,
+hallucination, citations) plus the end-to-end analyze_payload. Each
+stage reports wall time, CPU time (all threads) and peak traced memory.
+Corpus shape (response length, mention density, citations, duplication)
+is set from the command line. The report is printed as JSON and can be
+written to a file to compare before/after an optimization.
+
+Usage:
+    python -m backend.benchmarks.analysis_suite [--sizes 10,100,1000,5000]
+        [--brands 1,5,21] [--filler-sentences 0] [--mention-density D]
+        [--citations 5] [--duplicate-rate 0.0] [--repeat 3] [--seed S]
+        [--output report.json]
+"""
+
+import argparse
+import json
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from time import perf_counter, process_time
+from typing import Any
+
+from backend.app.builders.analysis import AnalysisBuilder, AnalysisPayload, EntityCounter
+from backend.app.builders.citations import analyze_citations
+from backend.app.builders.dedup import cluster_responses
+from backend.app.builders.domains import compile_whitelist
+from backend.app.builders.normalization import normalize_responses
+from backend.app.core.config import Settings
+from backend.app.schemas.llm import LLMProvider
+from backend.benchmarks.corpus import DEFAULT_BRANDS, synthetic_corpus
+
+# Trusted domains for the hallucination stage (the rest of the sources are flagged)
+WHITELIST = ["g2.com", "capterra.com", "forbes.com", "wikipedia.org"]
+
+
+def profile_stages(
+    builder: AnalysisBuilder,
+    payload: AnalysisPayload,
+    brands: list[str],
+    trace_memory: bool,
+) -> dict[str, dict[str, float]]:
+    """
+    Run the analysis pipeline stage by stage, measuring each stage.
+
+    Mirrors AnalysisBuilder.analyze_payload so every stage can be timed
+    on its own.
+
+    Args:
+        builder: Analysis builder with the settings under test.
+        payload: Batch to analyze (Perplexity, with citations).
+        brands: Tracked brands (first is the target).
+        trace_memory: Also measure peak traced memory (slower).
+
+    Returns:
+        Mapping of stage name to wall_ms, cpu_ms and, when traced, peak_kib.
+    """
+    settings = builder.settings
+    stages: dict[str, dict[str, float]] = {}
+
+    def measure(name: str, stage: Callable[[], Any]) -> Any:
+        if trace_memory:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        wall, cpu = perf_counter(), process_time()
+        result = stage()
+        stages[name] = {
+            "wall_ms": (perf_counter() - wall) * 1000,
+            "cpu_ms": (process_time() - cpu) * 1000,
+        }
+        if trace_memory:
+            stages[name]["peak_kib"] = (tracemalloc.get_traced_memory()[1] - baseline) / 1024
+        return result
+
+    responses = measure("normalize", lambda: normalize_responses(payload.responses))
+    clusters = measure(
+        "clustering",
+        lambda: (
+            cluster_responses(responses, max_distance=settings.near_duplicate_max_distance)
+            if settings.response_clustering
+            else None
+        ),
+    )
+    duplicates = clusters.exact if clusters is not None else None
+    representatives = (
+        [responses[i] for i in duplicates.representatives] if duplicates else responses
+    )
+
+    def match() -> Any:
+        dictionary = builder.build_brand_dictionary(brands)
+        discovery = EntityCounter(weights=duplicates.sizes.tolist() if duplicates else None)
+        matches = dictionary.scan(
+            representatives, workers=settings.analysis_workers, discovery=discovery
+        )
+        if duplicates is not None:
+            matches = matches.expand(duplicates.labels)
+        discovery.discover(
+            [form.text for form in dictionary.forms()],
+            top_n=settings.competitor_discovery_top_n,
+            min_responses=settings.competitor_discovery_min_responses,
+            threshold=settings.brand_fuzzy_threshold,
+        )
+        return matches
+
+    matches = measure("brand_matching", match)
+    ranks = measure("ranking", lambda: builder.rank_brands(matches))
+    measure("rankings", lambda: builder._compute_rankings(matches.brands, ranks))
+    visibility = measure("visibility", lambda: builder._compute_visibility(matches, ranks))
+    measure("share_of_voice", lambda: builder.compute_share_of_voice(visibility))
+
+    folded = [response.folded for response in responses]
+
+    def consistency() -> Any:
+        pair_scores = builder.score_pairs(folded, clusters) if len(folded) > 1 else None
+        builder.compute_consistency(folded, pair_scores)
+        return pair_scores
+
+    pair_scores = measure("consistency", consistency)
+    measure("intervals", lambda: builder._compute_intervals(matches, ranks, pair_scores))
+    flattened = [url for urls in payload.citations for url in urls]
+    measure("hallucination", lambda: builder._compute_hallucination(flattened, WHITELIST))
+    measure(
+        "citations",
+        lambda: analyze_citations(
+            payload.citations,
+            presence=matches.counts > 0,
+            brands=matches.brands,
+            whitelist=compile_whitelist(WHITELIST),
+            top_hosts=settings.citation_top_hosts,
+            exact_max_responses=settings.consistency_exact_max_responses,
+            sample_pairs=settings.consistency_sample_pairs,
+        ),
+    )
+    measure("total", lambda: builder.analyze_payload(payload, brands, WHITELIST))
+    return stages
+
+
+def run_benchmark(
+    sizes: list[int],
+    brand_counts: list[int],
+    corpus_options: dict[str, Any],
+    repeat: int,
+    seed: int,
+    settings: Settings | None = None,
+) -> dict[str, Any]:
+    """
+    Profile the analysis stages for every batch size and brand count.
+
+    Timings are the fastest of the repeats; peak memory comes from one
+    separate traced run, so tracing does not distort the timings.
+
+    Args:
+        sizes: Batch sizes (responses per batch).
+        brand_counts: Numbers of tracked brands (prefixes of DEFAULT_BRANDS).
+        corpus_options: Extra synthetic_corpus arguments (filler_sentences,
+            mention_density, citations, duplicate_rate).
+        repeat: Timed runs per configuration.
+        seed: Corpus RNG seed.
+        settings: Analysis settings (defaults from the environment).
+
+    Returns:
+        Dictionary report with per-configuration stage measurements.
+    """
+    builder = AnalysisBuilder(settings=settings)
+    results: list[dict[str, Any]] = []
+    for n in sizes:
+        corpus = synthetic_corpus(n, seed=seed, **corpus_options)
+        payload = AnalysisPayload(
+            batch_id="benchmark",
+            provider=LLMProvider.PERPLEXITY.value,
+            model="benchmark",
+            responses=corpus.responses,
+            citations=corpus.citations,
+        )
+        for brand_count in brand_counts:
+            brands = DEFAULT_BRANDS[:brand_count]
+            # Warm caches (compiled patterns, imports) outside the measurements
+            builder.analyze_payload(payload, brands, WHITELIST)
+
+            runs = [profile_stages(builder, payload, brands, False) for _ in range(repeat)]
+            stages = {
+                name: {
+                    metric: min(run[name][metric] for run in runs)
+                    for metric in ("wall_ms", "cpu_ms")
+                }
+                for name in runs[0]
+            }
+            tracemalloc.start()
+            try:
+                traced = profile_stages(builder, payload, brands, True)
+            finally:
+                tracemalloc.stop()
+            for name, entry in stages.items():
+                entry["peak_kib"] = traced[name]["peak_kib"]
+
+            results.append(
+                {
+                    "n": n,
+                    "brands": brand_count,
+                    "characters": sum(map(len, corpus.responses)),
+                    "citations": sum(map(len, corpus.citations)),
+                    "stages": stages,
+                }
+            )
+
+    return {
+        "workers": builder.settings.analysis_workers,
+        "consistency_metric": builder.consistency_metric,
+        "response_clustering": builder.settings.response_clustering,
+        "repeat": repeat,
+        "corpus": corpus_options,
+        "results": results,
+    }
+
+
+def main() -> None:
+    """Parse arguments and print the JSON benchmark report."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="10,100,1000,5000")
+    parser.add_argument("--brands", default="1,5,21")
+    parser.add_argument("--filler-sentences", type=int, default=0)
+    parser.add_argument("--mention-density", type=float, default=None)
+    parser.add_argument("--citations", type=int, default=5)
+    parser.add_argument("--duplicate-rate", type=float, default=0.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default=None, help="Also write the report to this file")
+    args = parser.parse_args()
+
+    report = run_benchmark(
+        sizes=[int(s) for s in args.sizes.split(",") if s.strip()],
+        brand_counts=[int(b) for b in args.brands.split(",") if b.strip()],
+        corpus_options={
+            "filler_sentences": args.filler_sentences,
+            "mention_density": args.mention_density,
+            "citations": args.citations,
+            "duplicate_rate": args.duplicate_rate,
+        },
+        repeat=max(args.repeat, 1),
+        seed=args.seed,
+    )
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
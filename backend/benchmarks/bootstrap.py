@@ -0,0 +1,94 @@
+"""
+Confidence interval benchmark.
+
+Times the vectorized bootstrap used by AnalysisBuilder for share of voice
+and mean rank (responses x brands matrices) and for mean pairwise
+similarity, on a synthetic corpus, and runs the full interval stage of
+the analysis once. Reports timings and example intervals as JSON.
+
+Usage:
+    python -m backend.benchmarks.bootstrap [--n 1000] [--resamples 10000] [--seed S]
+"""
+
+import argparse
+import json
+from time import perf_counter
+from typing import Any
+
+import numpy as np
+
+from backend.app.builders.analysis import AnalysisBuilder, BrandDictionary
+from backend.app.builders.statistics import (
+    bootstrap_brand_metrics,
+    bootstrap_pairwise_mean,
+    percentile_interval,
+)
+from backend.app.core.config import Settings
+from backend.benchmarks.corpus import synthetic_corpus
+
+
+def run_benchmark(n: int, resamples: int, seed: int) -> dict[str, Any]:
+    """
+    Time each bootstrap stage at the given corpus size.
+
+    Args:
+        n: Number of responses.
+        resamples: Bootstrap resamples.
+        seed: Corpus RNG seed.
+
+    Returns:
+        Dictionary report with timings and sample intervals.
+    """
+    corpus = synthetic_corpus(n, seed=seed)
+    builder = AnalysisBuilder(Settings(bootstrap_resamples=resamples))
+    matches = BrandDictionary.build(corpus.brands).scan(corpus.responses)
+    ranks = builder.rank_brands(matches)
+
+    start = perf_counter()
+    shares, _mean_ranks = bootstrap_brand_metrics(
+        matches.counts, ranks, resamples, np.random.default_rng(0)
+    )
+    share_low, share_high = percentile_interval(shares, builder.settings.confidence_level)
+    brand_ms = (perf_counter() - start) * 1000
+
+    pair_scores = builder.score_pairs(corpus.responses)
+    matrix = pair_scores[1]
+    pairwise_ms = None
+    if matrix is not None:
+        start = perf_counter()
+        bootstrap_pairwise_mean(matrix, resamples, np.random.default_rng(0))
+        pairwise_ms = (perf_counter() - start) * 1000
+
+    start = perf_counter()
+    intervals = builder._compute_intervals(matches, ranks, pair_scores)
+    intervals_ms = (perf_counter() - start) * 1000
+
+    return {
+        "n": n,
+        "brands": len(corpus.brands),
+        "resamples": resamples,
+        "brand_bootstrap_ms": brand_ms,
+        "pairwise_bootstrap_ms": pairwise_ms,
+        "all_intervals_ms": intervals_ms,
+        "example": {
+            "brand": corpus.brands[0],
+            "share_of_voice": [float(share_low[0]), float(share_high[0])],
+            "intervals": intervals["brands"][0],
+            "consistency": intervals.get("consistency"),
+        },
+    }
+
+
+def main() -> None:
+    """Parse arguments and print the JSON benchmark report."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=1000)
+    parser.add_argument("--resamples", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(json.dumps(run_benchmark(args.n, args.resamples, args.seed), indent=2))
+
+
+if __name__ == "__main__":
+    main()
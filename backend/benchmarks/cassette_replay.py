@@ -0,0 +1,136 @@
+"""
+Replay benchmark for recorded provider cassettes.
+
+Runs the RunnerBuilder and AnalysisBuilder against a recorded cassette with
+no network access, reporting cassette size, replay throughput and analysis
+time as JSON.
+
+Usage:
+    python -m backend.benchmarks.cassette_replay CASSETTE [--iterations N]
+        [--time-scale S] [--brands A,B,C] [--allow-unmatched]
+"""
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from backend.app.builders.analysis import AnalysisBuilder
+from backend.app.builders.cassette import cassette_files, load_cassette
+from backend.app.builders.runner import RunnerBuilder
+from backend.app.core.config import Settings
+from backend.app.schemas.llm import LLMProvider
+from backend.app.schemas.runner import BatchConfig
+
+
+async def run_benchmark(
+    cassette_path: Path,
+    iterations: int,
+    time_scale: float,
+    brands: list[str],
+    allow_unmatched: bool = False,
+) -> dict[str, Any]:
+    """
+    Replay a cassette through the runner and analysis pipeline.
+
+    Args:
+        cassette_path: Path to the gzip'd JSONL cassette.
+        iterations: Number of iterations to replay.
+        time_scale: Multiplier for recorded latencies.
+        brands: Brands to analyze (first is the target).
+        allow_unmatched: Answer unrecorded requests with other recordings.
+
+    Returns:
+        Dictionary report with size, throughput and timing figures.
+    """
+    entries = load_cassette(cassette_path)
+    first = entries[0]
+    messages = first.request.get("messages", [])
+    prompt = next((m["content"] for m in messages if m.get("role") == "user"), "")
+    system_prompt = next((m["content"] for m in messages if m.get("role") == "system"), None)
+
+    settings = Settings(
+        cassette_mode="replay",
+        cassette_path=str(cassette_path),
+        cassette_time_scale=time_scale,
+        cassette_allow_unmatched=allow_unmatched,
+        max_iterations=max(iterations, 1),
+    )
+    config = BatchConfig(
+        iterations=iterations,
+        max_concurrency=min(iterations, 100),
+        temperature=first.request.get("temperature", 0.7),
+        max_tokens=first.request.get("max_tokens"),
+        model=first.request.get("model"),
+        system_prompt=system_prompt,
+    )
+
+    runner = RunnerBuilder(settings=settings)
+    batch_result = await runner.run_batch(
+        prompt=prompt,
+        provider=LLMProvider(first.provider),
+        config=config,
+    )
+
+    analysis_start = perf_counter()
+    AnalysisBuilder().analyze_batch(batch_result, target_brands=brands)
+    analysis_ms = (perf_counter() - analysis_start) * 1000
+
+    raw_bytes = sum(len(e.to_json()) + 1 for e in entries)
+    duration_s = (batch_result.total_duration_ms or 0.0) / 1000
+
+    return {
+        "cassette": {
+            "path": str(cassette_path),
+            "entries": len(entries),
+            "raw_bytes": raw_bytes,
+        },
+        "replay": {
+            "iterations": batch_result.total_iterations,
+            "successful": batch_result.successful_iterations,
+            "time_scale": time_scale,
+            "duration_ms": batch_result.total_duration_ms,
+            "throughput_rps": batch_result.total_iterations / duration_s if duration_s else 0.0,
+        },
+        "analysis": {
+            "brands": len(brands),
+            "duration_ms": analysis_ms,
+        },
+    }
+
+
+def main() -> None:
+    """Parse arguments and print the JSON benchmark report."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("cassette", type=Path, help="Path to the cassette file")
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--time-scale", type=float, default=0.0)
+    parser.add_argument("--brands", default="Salesforce,HubSpot,Pipedrive")
+    parser.add_argument(
+        "--allow-unmatched",
+        action="store_true",
+        help="Answer requests missing from the cassette with other recorded responses",
+    )
+    args = parser.parse_args()
+
+    report = asyncio.run(
+        run_benchmark(
+            cassette_path=args.cassette,
+            iterations=args.iterations,
+            time_scale=args.time_scale,
+            brands=[b.strip() for b in args.brands.split(",") if b.strip()],
+            allow_unmatched=args.allow_unmatched,
+        )
+    )
+    size_bytes = sum(file.stat().st_size for file in cassette_files(args.cassette))
+    report["cassette"]["size_bytes"] = size_bytes
+    report["cassette"]["compression_ratio"] = (
+        report["cassette"]["raw_bytes"] / size_bytes if size_bytes else 0.0
+    )
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Consistency scoring benchmark.
+
+Compares the pairwise fuzz.ratio double loop against the vectorized
+rapidfuzz cdist matrix used by AnalysisBuilder, checking that both produce
+identical statistics. A second section compares exact scoring against
+sampled-pair scoring on larger batches, reporting the error against the
+stated margin. Timings are reported as JSON.
+
+Usage:
+    python -m backend.benchmarks.consistency [--sizes 100,500,1000]
+        [--sampled-sizes 1000,2000] [--seed S]
+"""
+
+import argparse
+import json
+from time import perf_counter
+from typing import Any
+
+from rapidfuzz import fuzz
+
+from backend.app.builders.analysis import AnalysisBuilder, ConsistencyMetrics
+from backend.app.core.config import Settings
+from backend.benchmarks.corpus import synthetic_responses
+
+
+def loop_consistency(responses: list[str]) -> ConsistencyMetrics:
+    """Reference implementation: pure-Python loop over all pairs."""
+    similarities = [
+        fuzz.ratio(responses[i], responses[j])
+        for i in range(len(responses))
+        for j in range(i + 1, len(responses))
+    ]
+    avg = sum(similarities) / len(similarities)
+    variance = sum((s - avg) ** 2 for s in similarities) / len(similarities)
+    return ConsistencyMetrics(
+        avg_similarity=avg,
+        min_similarity=min(similarities),
+        max_similarity=max(similarities),
+        std_deviation=variance**0.5,
+        consistency_score=avg / 100.0,
+    )
+
+
+def run_benchmark(sizes: list[int], sampled_sizes: list[int], seed: int) -> dict[str, Any]:
+    """
+    Time the consistency implementations at each batch size.
+
+    Args:
+        sizes: Batch sizes for the loop vs. vectorized comparison.
+        sampled_sizes: Batch sizes for the exact vs. sampled comparison.
+        seed: Corpus RNG seed.
+
+    Returns:
+        Dictionary report with per-size timings and agreement checks.
+    """
+    builder = AnalysisBuilder()
+    results: list[dict[str, Any]] = []
+    for n in sizes:
+        responses = synthetic_responses(n, seed=seed)
+
+        start = perf_counter()
+        reference = loop_consistency(responses)
+        loop_ms = (perf_counter() - start) * 1000
+
+        start = perf_counter()
+        vectorized = builder.compute_consistency(responses)
+        vectorized_ms = (perf_counter() - start) * 1000
+
+        fields = ("avg_similarity", "min_similarity", "max_similarity", "std_deviation")
+        max_abs_diff = max(abs(getattr(reference, f) - getattr(vectorized, f)) for f in fields)
+        results.append(
+            {
+                "n": n,
+                "pairs": n * (n - 1) // 2,
+                "loop_ms": loop_ms,
+                "vectorized_ms": vectorized_ms,
+                "speedup": loop_ms / vectorized_ms if vectorized_ms else 0.0,
+                "max_abs_diff": max_abs_diff,
+                "identical": max_abs_diff < 1e-9,
+            }
+        )
+
+    # Force exact and sampled modes explicitly via the thresholds
+    exact_builder = AnalysisBuilder(
+        Settings(consistency_exact_max_responses=10**9, consistency_exact_max_chars=10**12)
+    )
+    sampled_builder = AnalysisBuilder(
+        Settings(consistency_exact_max_responses=2, consistency_exact_max_chars=1)
+    )
+    sampled: list[dict[str, Any]] = []
+    for n in sampled_sizes:
+        responses = synthetic_responses(n, seed=seed)
+
+        start = perf_counter()
+        exact = exact_builder.compute_consistency(responses)
+        exact_ms = (perf_counter() - start) * 1000
+
+        start = perf_counter()
+        approx = sampled_builder.compute_consistency(responses)
+        sampled_ms = (perf_counter() - start) * 1000
+
+        error = abs(exact.avg_similarity - approx.avg_similarity)
+        sampled.append(
+            {
+                "n": n,
+                "exact_ms": exact_ms,
+                "sampled_ms": sampled_ms,
+                "sampled_pairs": approx.sampled_pairs,
+                "exact_avg_similarity": exact.avg_similarity,
+                "sampled_avg_similarity": approx.avg_similarity,
+                "abs_error": error,
+                "margin_of_error": approx.margin_of_error,
+                "within_margin": error <= approx.margin_of_error,
+            }
+        )
+
+    return {
+        "workers": builder.settings.analysis_workers,
+        "results": results,
+        "sampled": sampled,
+    }
+
+
+def main() -> None:
+    """Parse arguments and print the JSON benchmark report."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="100,500,1000")
+    parser.add_argument("--sampled-sizes", default="1000,2000")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    sampled_sizes = [int(s) for s in args.sampled_sizes.split(",") if s.strip()]
+    print(json.dumps(run_benchmark(sizes, sampled_sizes, args.seed), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""
+Synthetic response corpora for offline analysis benchmarks.
+
+Generates seeded, production-shaped LLM answers (intro, ranked brand list
+with short blurbs, closing paragraph) so analysis benchmarks are
+reproducible without provider access. Response length, mention density,
+citations and duplication can be dialed to shape scaling benchmarks.
+"""
+
+import random
+from dataclasses import dataclass, field
+
+DEFAULT_BRANDS = [
+    "Salesforce",
+    "HubSpot",
+    "Pipedrive",
+    "Zoho CRM",
+    "Microsoft Dynamics 365",
+    "Freshsales",
+    "Monday.com",
+    "Copper",
+    "Insightly",
+    "Nutshell",
+    "Keap",
+    "Close",
+    "Attio",
+    "Folk",
+    "Capsule",
+    "Agile CRM",
+    "Less Annoying CRM",
+    "SugarCRM",
+    "Creatio",
+    "Nimble",
+    "Streak",
+]
+
+_INTROS = [
+    "Here are some of the best CRM tools for small businesses in 2025:",
+    "Choosing a CRM depends on your team size, budget and workflow. Popular options include:",
+    "Several CRM platforms stand out for startups and growing teams:",
+    "Based on features, pricing and user reviews, the top CRM options are:",
+]
+
+_BLURBS = [
+    "offers a generous free tier and strong marketing automation.",
+    "is known for its visual sales pipeline and ease of use.",
+    "provides deep customization and an extensive app marketplace.",
+    "is an affordable choice with solid reporting features.",
+    "integrates tightly with email and calendar tools.",
+    "suits teams that need workflow automation without complexity.",
+    "has a clean interface and quick onboarding for small teams.",
+]
+
+_OUTROS = [
+    "Ultimately, the right choice depends on your specific needs and budget.",
+    "Most of these tools offer free trials, so test a few before committing.",
+    "Consider integrations with your existing stack when making a decision.",
+]
+
+_FILLERS = [
+    "Pricing usually scales with the number of seats and the features you enable.",
+    "Support quality varies, so check response times for your plan level.",
+    "Migration from spreadsheets is straightforward with the built-in import tools.",
+    "Mobile apps matter if your sales team works in the field.",
+    "Reporting depth ranges from basic dashboards to fully custom analytics.",
+    "Security certifications may be required for regulated industries.",
+]
+
+# Cited sources, most popular first (drawn with a Zipf-like skew)
+_SOURCES = [
+    "www.g2.com",
+    "www.capterra.com",
+    "www.forbes.com",
+    "www.techradar.com",
+    "www.pcmag.com",
+    "zapier.com",
+    "www.reddit.com",
+    "www.nerdwallet.com",
+    "www.trustradius.com",
+    "blog.hubspot.com",
+    "www.salesforce.com",
+    "en.wikipedia.org",
+]
+
+
+@dataclass
+class SyntheticCorpus:
+    """
+    Generated responses with ground truth.
+
+    Attributes:
+        responses: Response texts.
+        rankings: Per response, indices into brands in the order listed.
+        brands: The brand pool indices refer to.
+        citations: Per response, cited URLs (empty lists without citations).
+    """
+
+    responses: list[str]
+    rankings: list[list[int]]
+    brands: list[str]
+    citations: list[list[str]] = field(default_factory=list)
+
+
+def _surface_variant(brand: str, rng: random.Random) -> str:
+    """Render a brand the way LLM answers often do instead of its exact name."""
+    words = brand.split()
+    choices = [
+        f"{brand} CRM" if not brand.endswith("CRM") else brand,
+        f"{brand.replace(' ', '')}.com" if "." not in brand else brand,
+        brand.lower(),
+    ]
+    if len(words) > 1 and words[-1] == "CRM":
+        choices.append(" ".join(words[:-1]))
+    if len(brand) >= 6:
+        # Adjacent-character swap inside the word (a common typo)
+        i = rng.randrange(1, len(brand) - 2)
+        if brand[i].isalpha() and brand[i + 1].isalpha():
+            choices.append(brand[:i] + brand[i + 1] + brand[i] + brand[i + 2 :])
+    return rng.choice(choices)
+
+
+def synthetic_corpus(
+    n: int,
+    brands: list[str] | None = None,
+    seed: int = 42,
+    list_length: tuple[int, int] = (3, 7),
+    variant_rate: float = 0.0,
+    filler_sentences: int = 0,
+    mention_density: float | None = None,
+    citations: int = 0,
+    duplicate_rate: float = 0.0,
+) -> SyntheticCorpus:
+    """
+    Generate n synthetic LLM answers with their ground-truth brand rankings.
+
+    Args:
+        n: Number of responses.
+        brands: Brand pool to draw from (defaults to DEFAULT_BRANDS).
+        seed: RNG seed for reproducibility.
+        list_length: Inclusive (min, max) number of brands per answer.
+        variant_rate: Probability that a brand is written as an alias,
+            suffix variant, lowercase or typo instead of its exact name.
+        filler_sentences: Extra sentences in the closing paragraph, to
+            control response length.
+        mention_density: If set, each pool brand is listed with this
+            probability (at least one per answer) instead of list_length.
+        citations: Cited URLs per answer, with "[k]" markers in the list.
+        duplicate_rate: Probability that an answer repeats an earlier one
+            verbatim (as low-temperature runs do).
+
+    Returns:
+        SyntheticCorpus: Responses and the ranked brand indices of each.
+    """
+    rng = random.Random(seed)
+    pool = brands or DEFAULT_BRANDS
+    responses: list[str] = []
+    rankings: list[list[int]] = []
+    cited: list[list[str]] = []
+    for _ in range(n):
+        if duplicate_rate and responses and rng.random() < duplicate_rate:
+            source = rng.randrange(len(responses))
+            responses.append(responses[source])
+            rankings.append(rankings[source])
+            cited.append(cited[source])
+            continue
+
+        if mention_density is None:
+            k = min(rng.randint(*list_length), len(pool))
+            picked = rng.sample(range(len(pool)), k)
+        else:
+            picked = [i for i in range(len(pool)) if rng.random() < mention_density]
+            picked = picked or [rng.randrange(len(pool))]
+            rng.shuffle(picked)
+        urls = [
+            f"https://{_SOURCES[min(int(rng.paretovariate(1.0)) - 1, len(_SOURCES) - 1)]}"
+            f"/crm-guide-{rng.randint(1, 40)}"
+            for _ in range(citations)
+        ]
+
+        lines = [rng.choice(_INTROS), ""]
+        for rank, index in enumerate(picked, start=1):
+            name = pool[index]
+            if variant_rate and rng.random() < variant_rate:
+                name = _surface_variant(name, rng)
+            marker = f" [{rng.randint(1, citations)}]" if citations else ""
+            lines.append(f"{rank}. **{name}** {rng.choice(_BLURBS)}{marker}")
+        closing = [rng.choice(_FILLERS) for _ in range(filler_sentences)]
+        lines.extend(["", " ".join([*closing, rng.choice(_OUTROS)])])
+        responses.append("\n".join(lines))
+        rankings.append(picked)
+        cited.append(urls)
+    return SyntheticCorpus(
+        responses=responses,
+        rankings=rankings,
+        brands=list(pool),
+        citations=cited,
+    )
+
+
+def synthetic_responses(
+    n: int,
+    brands: list[str] | None = None,
+    seed: int = 42,
+    list_length: tuple[int, int] = (3, 7),
+) -> list[str]:
+    """
+    Generate n synthetic LLM answers mentioning a random subset of brands.
+
+    Args:
+        n: Number of responses.
+        brands: Brand pool to draw from (defaults to DEFAULT_BRANDS).
+        seed: RNG seed for reproducibility.
+        list_length: Inclusive (min, max) number of brands per answer.
+
+    Returns:
+        List of response texts.
+    """
+    return synthetic_corpus(n, brands=brands, seed=seed, list_length=list_length).responses
@@ -0,0 +1,107 @@
+"""
+Citation whitelist benchmark.
+
+Compares the legacy substring whitelist check against the compiled
+suffix-set whitelist on synthetic citations drawn (with heavy repetition,
+as across Monte Carlo iterations) from trusted hosts, their subdomains and
+look-alike hosts. Reports verdict accuracy and throughput as JSON.
+
+Usage:
+    python -m backend.benchmarks.domains [--whitelist 5000]
+        [--citations 50000] [--seed S]
+"""
+
+import argparse
+import json
+from time import perf_counter
+from typing import Any
+
+import numpy as np
+
+from backend.app.builders.domains import DomainWhitelist, extract_host
+
+
+def _legacy_contains(url: str, whitelist: list[str]) -> bool:
+    """The previous check: substring match of any entry in the host."""
+    host = url.lower().split("://", 1)[-1].split("/", 1)[0]
+    return any(w in host for w in whitelist)
+
+
+def _citations(
+    trusted: list[str],
+    n: int,
+    rng: np.random.Generator,
+) -> tuple[list[str], list[bool]]:
+    """Citations over a small host pool, with ground-truth trust labels."""
+    pool: list[tuple[str, bool]] = []
+    for domain in rng.choice(trusted, size=min(len(trusted), 200), replace=False):
+        pool.append((f"https://{domain}/article", True))
+        pool.append((f"https://news.{domain}:443/a?b=c", True))
+        pool.append((f"https://not{domain}/page", False))
+        pool.append((f"https://{domain}.evil.io/login", False))
+    picks = rng.integers(0, len(pool), size=n)
+    return [pool[i][0] for i in picks], [pool[i][1] for i in picks]
+
+
+def run_benchmark(whitelist_size: int, citations: int, seed: int) -> dict[str, Any]:
+    """
+    Score and time both whitelist checks on the same citations.
+
+    Args:
+        whitelist_size: Number of trusted domains.
+        citations: Number of citation URLs.
+        seed: RNG seed.
+
+    Returns:
+        Dictionary report with accuracy and throughput per method.
+    """
+    rng = np.random.default_rng(seed)
+    trusted = [f"site{i}.example{i % 7}.com" for i in range(whitelist_size)]
+    urls, truth = _citations(trusted, citations, rng)
+
+    start = perf_counter()
+    legacy = [_legacy_contains(url, trusted) for url in urls]
+    legacy_elapsed = perf_counter() - start
+
+    start = perf_counter()
+    whitelist = DomainWhitelist.build(trusted)
+    build_elapsed = perf_counter() - start
+    extract_host.cache_clear()
+    start = perf_counter()
+    compiled = [whitelist.contains_url(url) for url in urls]
+    compiled_elapsed = perf_counter() - start
+
+    def report(verdicts: list[bool], elapsed: float) -> dict[str, float]:
+        correct = sum(v == t for v, t in zip(verdicts, truth, strict=True))
+        return {
+            "accuracy": correct / citations,
+            "false_trusts": sum(v and not t for v, t in zip(verdicts, truth, strict=True)),
+            "duration_ms": elapsed * 1000,
+            "citations_per_second": citations / elapsed if elapsed else 0.0,
+        }
+
+    return {
+        "whitelist_size": whitelist_size,
+        "citations": citations,
+        "build_ms": build_elapsed * 1000,
+        "results": {
+            "substring": report(legacy, legacy_elapsed),
+            "suffix_set": report(compiled, compiled_elapsed),
+        },
+        "speedup": legacy_elapsed / compiled_elapsed if compiled_elapsed else None,
+    }
+
+
+def main() -> None:
+    """Parse arguments and print the JSON benchmark report."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--whitelist", type=int, default=5000)
+    parser.add_argument("--citations", type=int, default=50_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(json.dumps(run_benchmark(args.whitelist, args.citations, args.seed), indent=2))
+
+
+if __name__ == "__main__":
+    main()
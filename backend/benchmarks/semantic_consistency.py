@@ -0,0 +1,103 @@
+"""
+Consistency metric benchmark: fuzzy ratio vs. n-gram TF-IDF cosine.
+
+Times both consistency metrics on batches of short and long responses,
+and measures how well each tracks content: the Spearman correlation
+between pair similarity and the Jaccard overlap of the pair's brand sets
+(the ground truth of the synthetic corpus). Reports JSON.
+
+Usage:
+    python -m backend.benchmarks.semantic_consistency [--n 200]
+        [--long-factor 10] [--seed S]
+"""
+
+import argparse
+import json
+from time import perf_counter
+from typing import Any
+
+import numpy as np
+from scipy.stats import spearmanr
+
+from backend.app.builders.analysis import AnalysisBuilder
+from backend.app.core.config import ConsistencyMetric, Settings
+from backend.benchmarks.corpus import synthetic_corpus
+
+METRICS: tuple[ConsistencyMetric, ...] = ("fuzzy", "tfidf")
+
+
+def _brand_jaccard(rankings: list[list[int]]) -> np.ndarray:
+    """Upper-triangle Jaccard overlap of the brand sets of every pair."""
+    sets = [set(ranking) for ranking in rankings]
+    rows, cols = np.triu_indices(len(sets), k=1)
+    return np.array(
+        [len(sets[i] & sets[j]) / len(sets[i] | sets[j]) for i, j in zip(rows, cols, strict=True)]
+    )
+
+
+def run_benchmark(n: int, long_factor: int, seed: int) -> dict[str, Any]:
+    """
+    Time and score both metrics on short and long responses.
+
+    Args:
+        n: Number of responses per batch.
+        long_factor: Answers concatenated into each long response.
+        seed: Corpus RNG seed.
+
+    Returns:
+        Dictionary report per metric and response length.
+    """
+    corpus = synthetic_corpus(n, seed=seed)
+    jaccard = _brand_jaccard(corpus.rankings)
+    filler = synthetic_corpus(n * long_factor, seed=seed + 1).responses
+    long_responses = [
+        "\n\n".join([response, *filler[i * long_factor : (i + 1) * long_factor - 1]])
+        for i, response in enumerate(corpus.responses)
+    ]
+
+    # Exact scoring everywhere so both metrics see all pairs
+    settings = Settings(consistency_exact_max_responses=10**9, consistency_exact_max_chars=10**12)
+    results: dict[str, Any] = {}
+    for metric in METRICS:
+        builder = AnalysisBuilder(settings, consistency_metric=metric)
+        report: dict[str, Any] = {}
+        for label, responses in (("short", corpus.responses), ("long", long_responses)):
+            start = perf_counter()
+            scores, _ = builder.score_pairs(responses)
+            elapsed = perf_counter() - start
+            report[label] = {
+                "avg_chars": sum(map(len, responses)) / n,
+                "duration_ms": elapsed * 1000,
+                "avg_similarity": float(scores.mean()),
+                "std_similarity": float(scores.std()),
+            }
+            if label == "short":
+                report[label]["spearman_vs_brand_overlap"] = float(
+                    spearmanr(scores, jaccard).statistic
+                )
+        results[metric] = report
+
+    return {
+        "n": n,
+        "pairs": n * (n - 1) // 2,
+        "long_factor": long_factor,
+        "results": results,
+        "long_speedup": (
+            results["fuzzy"]["long"]["duration_ms"] / results["tfidf"]["long"]["duration_ms"]
+        ),
+    }
+
+
+def main() -> None:
+    """Parse arguments and print the JSON benchmark report."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=200)
+    parser.add_argument("--long-factor", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(json.dumps(run_benchmark(args.n, args.long_factor, args.seed), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ This module provides shared fixtures for database sessions,
 test clients, and mock LLM providers.
 """
 
+import asyncio
 from collections.abc import AsyncGenerator
 from typing import Any
 
@@ -12,7 +13,74 @@ import pytest
 from fastapi.testclient import TestClient
 from httpx import ASGITransport, AsyncClient
 
+from backend.app.builders.providers import BaseLLMProvider
 from backend.app.main import app
+from backend.app.schemas.llm import LLMProvider, LLMRequest, LLMResponse, UsageInfo
+
+
+class FakeProvider(BaseLLMProvider):
+    """
+    In-memory OpenAI-shaped provider that answers with canned responses.
+
+    Responses are handed out in order and cycled; every request is kept
+    for inspection. Each request yields to the event loop (after `delay`
+    seconds), like a network call would.
+    """
+
+    def __init__(
+        self,
+        responses: list[str] | None = None,
+        completion_tokens: int = 50,
+        delay: float = 0.0,
+    ) -> None:
+        """Initialize the provider with the responses to hand out."""
+        super().__init__(api_key="test-key", base_url="http://fake.test")
+        self.responses = responses or ["Salesforce is the leading CRM."]
+        self.completion_tokens = completion_tokens
+        self.delay = delay
+        self.requests: list[LLMRequest] = []
+
+    @property
+    def provider_name(self) -> LLMProvider:
+        """Return the provider enum value."""
+        return LLMProvider.OPENAI
+
+    @property
+    def default_model(self) -> str:
+        """Return the default model."""
+        return "gpt-4o-mini"
+
+    def _get_headers(self) -> dict[str, str]:
+        """Get the request headers."""
+        return {}
+
+    async def _make_request(self, request: LLMRequest) -> dict[str, Any]:
+        """Answer with the next canned response."""
+        await asyncio.sleep(self.delay)
+        content = self.responses[len(self.requests) % len(self.responses)]
+        self.requests.append(request)
+        return {
+            "id": f"fake-{len(self.requests)}",
+            "model": request.model or self.default_model,
+            "content": content,
+            "prompt_tokens": 20,
+            "completion_tokens": self.completion_tokens,
+        }
+
+    def _parse_response(self, raw_response: dict[str, Any], latency_ms: float) -> LLMResponse:
+        """Build the unified response."""
+        return LLMResponse(
+            id=raw_response["id"],
+            provider=self.provider_name,
+            model=raw_response["model"],
+            content=raw_response["content"],
+            usage=UsageInfo(
+                prompt_tokens=raw_response["prompt_tokens"],
+                completion_tokens=raw_response["completion_tokens"],
+                total_tokens=raw_response["prompt_tokens"] + raw_response["completion_tokens"],
+            ),
+            latency_ms=latency_ms,
+        )
 
 
 @pytest.fixture
@@ -59,3 +127,18 @@ def mock_settings() -> dict[str, Any]:
         "confidence_level": 0.95,
     }
 
+
+@pytest.fixture
+def fake_provider() -> FakeProvider:
+    """
+    Provide an in-memory LLM provider with canned responses.
+
+    Returns:
+        FakeProvider: A provider that never touches the network.
+    """
+    return FakeProvider(
+        responses=[
+            "Salesforce is the leading CRM, followed by HubSpot.",
+            "HubSpot is popular with startups; Pipedrive is simpler.",
+        ]
+    )
@@ -0,0 +1,51 @@
+"""
+Tests for offloading batch analysis to the process pool.
+"""
+
+from collections.abc import Callable
+from concurrent.futures import Executor, Future
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+import pytest
+
+from backend.app.builders import analysis_pool
+from backend.app.builders.analysis import AnalysisPayload
+from backend.app.core.config import Settings
+
+
+class BrokenPool(Executor):
+    """Executor whose processes have died."""
+
+    def __init__(self) -> None:
+        self.shutdown_calls: list[dict[str, bool]] = []
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future[Any]:  # noqa: ARG002
+        raise BrokenProcessPool("a child process terminated abruptly")
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self.shutdown_calls.append({"wait": wait, "cancel_futures": cancel_futures})
+
+
+async def test_broken_pool_is_shut_down_and_analysis_runs_in_a_thread(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    broken = BrokenPool()
+    monkeypatch.setattr(analysis_pool, "_pool", broken)
+    payload = AnalysisPayload(
+        batch_id="batch",
+        provider="openai",
+        model="gpt-4o",
+        responses=["Salesforce leads, then HubSpot.", "HubSpot is great."],
+        citations=[[], []],
+    )
+
+    result = await analysis_pool.analyze_offloaded(
+        payload,
+        target_brands=["Salesforce", "HubSpot"],
+        settings=Settings(analysis_pool_min_responses=1),
+    )
+
+    assert broken.shutdown_calls == [{"wait": False, "cancel_futures": True}]
+    assert analysis_pool._pool is None
+    assert result.raw_metrics["total_responses"] == 2
@@ -0,0 +1,124 @@
+"""
+Tests for batch statistics computed from columnar iteration data.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.app.schemas.llm import LLMProvider, LLMResponse, UsageInfo
+from backend.app.schemas.runner import BatchConfig, BatchResult, IterationResult, IterationStatus
+
+STARTED_AT = datetime(2026, 10, 19, 12, 0, 0)
+
+
+def _success(
+    index: int, content: str, completion_tokens: int, latency_ms: float
+) -> IterationResult:
+    return IterationResult(
+        iteration_index=index,
+        status=IterationStatus.SUCCESS,
+        response=LLMResponse(
+            id=f"r{index}",
+            provider=LLMProvider.OPENAI,
+            model="gpt-4o",
+            content=content,
+            usage=UsageInfo(
+                prompt_tokens=10,
+                completion_tokens=completion_tokens,
+                total_tokens=10 + completion_tokens,
+                cache_read_tokens=4,
+            ),
+            latency_ms=latency_ms,
+        ),
+        latency_ms=latency_ms + 5,
+        completed_at=STARTED_AT + timedelta(seconds=index * 0.6),
+    )
+
+
+def _batch(iterations: list[IterationResult]) -> BatchResult:
+    return BatchResult(
+        provider=LLMProvider.OPENAI,
+        model="gpt-4o",
+        prompt="Best CRM?",
+        config=BatchConfig(iterations=max(len(iterations), 1)),
+        started_at=STARTED_AT,
+        iterations=iterations,
+    )
+
+
+@pytest.fixture
+def batch() -> BatchResult:
+    return _batch(
+        [
+            _success(0, "Acme first", 20, 100.0),
+            _success(1, "Globex first", 40, 300.0),
+            IterationResult(
+                iteration_index=2,
+                status=IterationStatus.TIMEOUT,
+                error_message="timed out",
+                completed_at=STARTED_AT + timedelta(seconds=1.5),
+            ),
+            IterationResult(iteration_index=3, status=IterationStatus.BUDGET_EXCEEDED),
+        ]
+    )
+
+
+def test_compute_statistics(batch: BatchResult) -> None:
+    batch.compute_statistics()
+
+    assert batch.total_iterations == 4
+    assert batch.successful_iterations == 2
+    assert batch.failed_iterations == 2
+    assert batch.success_rate == 0.5
+    assert batch.raw_responses == ["Acme first", "Globex first"]
+    assert batch.total_prompt_tokens == 20
+    assert batch.total_completion_tokens == 60
+    assert batch.total_tokens == 80
+    assert batch.total_cache_read_tokens == 8
+    assert batch.avg_latency_ms == 200.0
+    assert batch.min_latency_ms == 100.0
+    assert batch.max_latency_ms == 300.0
+    assert batch.latency_percentiles_ms["p50"] == 200.0
+    assert batch.completion_token_percentiles["p50"] == 30.0
+    assert batch.status_counts["success"] == 2
+    assert batch.status_counts["timeout"] == 1
+    assert batch.status_counts["budget_exceeded"] == 1
+    assert batch.status_counts["failed"] == 0
+    assert [(p["completed"], p["successful"]) for p in batch.throughput] == [(2, 2), (1, 0)]
+
+
+def test_compute_statistics_is_idempotent(batch: BatchResult) -> None:
+    batch.compute_statistics()
+    first = batch.model_dump()
+    batch.compute_statistics()
+
+    assert batch.model_dump() == first
+
+
+def test_compute_statistics_reflects_edited_iterations(batch: BatchResult) -> None:
+    batch.compute_statistics()
+    batch.iterations[2] = _success(2, "Initech first", 10, 200.0)
+    batch.iterations.append(_success(4, "Acme again", 10, 200.0))
+    batch.compute_statistics()
+
+    assert batch.successful_iterations == 4
+    assert batch.total_completion_tokens == 80
+    assert batch.raw_responses[-2:] == ["Initech first", "Acme again"]
+    assert len(batch.columns()) == 5
+
+
+def test_columns_before_statistics_are_built_fresh(batch: BatchResult) -> None:
+    assert batch.columns().responses == ["Acme first", "Globex first"]
+    batch.iterations.pop(0)
+
+    assert batch.columns().responses == ["Globex first"]
+
+
+def test_empty_batch_has_no_statistics() -> None:
+    batch = _batch([])
+    batch.compute_statistics()
+
+    assert batch.total_iterations == 0
+    assert batch.throughput == []
+    assert len(batch.columns()) == 0
@@ -0,0 +1,58 @@
+"""
+Tests for the brand dictionary: aliases, generated variants and fuzzy forms.
+"""
+
+from backend.app.builders.analysis import BrandDictionary, brand_variants
+
+BRANDS = ["Salesforce", "Zoho CRM", "HubSpot", "Creatio"]
+
+
+def _dictionary(fuzzy_threshold: float | None = 85) -> BrandDictionary:
+    return BrandDictionary.build(
+        BRANDS, aliases={"Salesforce": ["SFDC"]}, fuzzy_threshold=fuzzy_threshold
+    )
+
+
+def test_brand_variants() -> None:
+    assert brand_variants("Zoho CRM") == (["ZohoCRM", "Zoho-CRM"], ["Zoho"])
+    assert brand_variants("HubSpot") == (["Hub Spot"], [])
+    assert brand_variants("Acme") == ([], [])
+
+
+def test_generated_forms_yield_to_tracked_brands() -> None:
+    dictionary = BrandDictionary.build(["Zoho", "Zoho CRM"])
+
+    assert dictionary.short_forms["Zoho CRM"] == []
+
+
+def test_scan_credits_aliases_variants_and_fuzzy_forms() -> None:
+    matches = _dictionary().scan(
+        [
+            "Top picks: Salesforse and Zoho, also SFDC.",
+            "For creation of pipelines, zoho works. Hub Spot too.",
+            "Creatio is low-code.",
+        ]
+    )
+
+    assert matches.counts.tolist() == [[2, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]
+
+
+def test_fuzzy_forms_are_name_like_spans_only() -> None:
+    dictionary = _dictionary()
+
+    forms = dictionary.find_fuzzy_forms(
+        [
+            "Teams pick Salesforse. For creation of pipelines, keep a streak.",
+            # Only ever seen starting a sentence: could be any capitalized word
+            "Hubspat is next.",
+        ]
+    )
+
+    assert [(form.brand_index, form.text) for form in forms] == [(0, "Salesforse")]
+    assert _dictionary(fuzzy_threshold=None).find_fuzzy_forms(["Salesforse"]) == []
+
+
+def test_json_round_trip() -> None:
+    dictionary = _dictionary()
+
+    assert BrandDictionary.from_json(dictionary.to_json()) == dictionary
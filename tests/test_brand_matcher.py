@@ -0,0 +1,41 @@
+"""
+Tests for single-pass brand matching.
+"""
+
+from backend.app.builders.analysis import BrandMatcher
+
+
+def test_scan_counts_positions_and_list_items() -> None:
+    matcher = BrandMatcher(["Zoho", "Zoho CRM", "HubSpot"])
+
+    matches = matcher.scan(["1. Zoho CRM is good\n2. HubSpot, hubspot and Zoho.", "", "None"])
+
+    assert matches.brands == ["Zoho", "Zoho CRM", "HubSpot"]
+    # "Zoho CRM" also credits the tracked "Zoho" it contains
+    assert matches.counts.tolist() == [[2, 1, 2], [0, 0, 0], [0, 0, 0]]
+    assert matches.first_positions[0].tolist() == [0, 0, 17]
+    assert matches.first_list_items[0].tolist() == [0, 0, 1]
+    assert matches.first_positions[1].tolist() == [-1, -1, -1]
+
+
+def test_matches_respect_word_boundaries() -> None:
+    matcher = BrandMatcher(["HubSpot", "Salesforce"])
+
+    matches = matcher.scan(["NotHubSpot and salesforces.com", "Salesforce's CRM"])
+
+    assert matches.counts.tolist() == [[0, 0], [0, 1]]
+
+
+def test_positions_are_in_normalized_text() -> None:
+    matcher = BrandMatcher(["HubSpot"])
+
+    matches = matcher.scan(["**Top** [pick](https://x.test): HubSpot"])
+
+    assert matches.first_positions.tolist() == [[10]]
+
+
+def test_search_and_empty_matcher() -> None:
+    assert BrandMatcher(["HubSpot"]).search("Try hubspot")
+    assert not BrandMatcher(["HubSpot"]).search("Try Pipedrive")
+    assert not BrandMatcher([]).search("HubSpot")
+    assert BrandMatcher([]).scan(["HubSpot"]).counts.shape == (1, 0)
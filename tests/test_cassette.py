@@ -0,0 +1,99 @@
+"""
+Tests for recording and replaying provider cassettes.
+"""
+
+import gzip
+import logging
+from pathlib import Path
+
+import pytest
+
+from backend.app.builders.cassette import (
+    CassetteMode,
+    CassetteProvider,
+    cassette_files,
+    load_cassette,
+)
+from backend.app.builders.providers import ProviderError
+from tests.conftest import FakeProvider
+
+
+async def _record(inner: FakeProvider, path: Path, prompts: list[str]) -> None:
+    recorder = CassetteProvider(inner, path, CassetteMode.RECORD)
+    async with recorder:
+        for prompt in prompts:
+            await recorder.generate_simple(prompt)
+
+
+async def test_replay_serves_recorded_responses_per_request(
+    fake_provider: FakeProvider, tmp_path: Path
+) -> None:
+    path = tmp_path / "crm.jsonl.gz"
+    await _record(fake_provider, path, ["Best CRM?", "Best CRM?", "Cheapest CRM?"])
+
+    player = CassetteProvider(FakeProvider(), path, CassetteMode.REPLAY, time_scale=0)
+    first = await player.generate_simple("Best CRM?")
+    second = await player.generate_simple("Best CRM?")
+    cycled = await player.generate_simple("Best CRM?")
+    other = await player.generate_simple("Cheapest CRM?")
+
+    assert [first.content, second.content] == fake_provider.responses
+    assert cycled.content == first.content
+    assert other.content == fake_provider.responses[0]
+    assert player.stats().replayed == 4
+
+
+async def test_replay_rejects_unrecorded_requests(
+    fake_provider: FakeProvider, tmp_path: Path
+) -> None:
+    path = tmp_path / "crm.jsonl.gz"
+    await _record(fake_provider, path, ["Best CRM?"])
+    player = CassetteProvider(FakeProvider(), path, CassetteMode.REPLAY, time_scale=0)
+
+    with pytest.raises(ProviderError, match="no recording"):
+        await player.generate_simple("Best ERP?")
+
+
+async def test_replay_of_unrecorded_requests_when_allowed(
+    fake_provider: FakeProvider, tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    path = tmp_path / "crm.jsonl.gz"
+    await _record(fake_provider, path, ["Best CRM?"])
+    player = CassetteProvider(
+        FakeProvider(), path, CassetteMode.REPLAY, time_scale=0, allow_unmatched=True
+    )
+
+    with caplog.at_level(logging.WARNING):
+        response = await player.generate_simple("Best ERP?")
+
+    assert response.content == fake_provider.responses[0]
+    assert "no recording" in caplog.text
+
+
+async def test_each_recorder_writes_its_own_segment(tmp_path: Path) -> None:
+    path = tmp_path / "crm.jsonl.gz"
+    await _record(FakeProvider(["one"]), path, ["Best CRM?"])
+    await _record(FakeProvider(["two"]), path, ["Best CRM?"])
+
+    segments = cassette_files(path)
+    entries = load_cassette(path)
+
+    assert len(segments) == 2
+    assert [e.response["content"] for e in entries if e.response] == ["one", "two"]
+
+
+async def test_load_tolerates_a_torn_segment_tail(tmp_path: Path) -> None:
+    path = tmp_path / "crm.jsonl.gz"
+    await _record(FakeProvider(["kept"]), path, ["Best CRM?"])
+    (segment,) = cassette_files(path)
+    with gzip.open(segment, "ab") as f:
+        f.write(b'{"request_key": "trunc')
+
+    entries = load_cassette(path)
+
+    assert [e.response["content"] for e in entries if e.response] == ["kept"]
+
+
+def test_replay_of_a_missing_cassette_fails(tmp_path: Path) -> None:
+    with pytest.raises(ProviderError, match="empty"):
+        CassetteProvider(FakeProvider(), tmp_path / "missing.jsonl.gz", CassetteMode.REPLAY)
@@ -0,0 +1,65 @@
+"""
+Tests for SimHash fingerprints and near-duplicate response clustering.
+"""
+
+import numpy as np
+
+from backend.app.builders.dedup import cluster_responses, simhash
+from backend.app.builders.normalization import normalize_responses
+
+LONG = " ".join(
+    f"Salesforce point {i} covers pipeline forecasting reporting and integrations for sales teams."
+    for i in range(12)
+)
+OTHER = "HubSpot is popular with startups because it has a free tier."
+
+
+def test_simhash_is_stable_and_locality_sensitive() -> None:
+    fingerprint = simhash(LONG.casefold())
+
+    assert simhash(LONG.casefold()) == fingerprint
+    assert bin(fingerprint ^ simhash((LONG + " Thanks.").casefold())).count("1") <= 3
+    assert bin(fingerprint ^ simhash(OTHER.casefold())).count("1") > 3
+    assert simhash("") == 0
+
+
+def test_exact_duplicates_ignore_case_and_markdown() -> None:
+    responses = normalize_responses([OTHER, f"**{OTHER.upper()}**", "Pipedrive is simple."])
+
+    clusters = cluster_responses(responses)
+
+    assert clusters.labels.tolist() == [0, 0, 1]
+    assert clusters.representatives.tolist() == [0, 2]
+    assert clusters.sizes.tolist() == [2, 1]
+    assert clusters.exact_clusters == 2
+    assert clusters.exact is clusters
+
+
+def test_near_duplicates_merge_but_stay_apart_for_brand_matching() -> None:
+    responses = normalize_responses([LONG, LONG + " Thanks.", LONG, OTHER])
+
+    clusters = cluster_responses(responses)
+
+    assert clusters.labels.tolist() == [0, 0, 0, 1]
+    assert clusters.sizes.tolist() == [3, 1]
+    assert clusters.exact_clusters == 3
+    assert clusters.exact.labels.tolist() == [0, 1, 0, 2]
+    assert clusters.exact.sizes.tolist() == [2, 1, 1]
+    assert clusters.diversity == 0.5
+
+
+def test_max_distance_zero_only_groups_exact_duplicates() -> None:
+    responses = normalize_responses([LONG, LONG + " Thanks.", LONG])
+
+    clusters = cluster_responses(responses, max_distance=0)
+
+    assert clusters.labels.tolist() == [0, 1, 0]
+    assert clusters.duplicates is None
+
+
+def test_empty_batch() -> None:
+    clusters = cluster_responses([])
+
+    assert clusters.count == 0
+    assert clusters.diversity == 0.0
+    assert clusters.labels.dtype == np.int64
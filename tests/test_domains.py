@@ -0,0 +1,89 @@
+"""
+Tests for citation host parsing and the trusted-domain whitelist.
+"""
+
+import pytest
+
+from backend.app.builders.domains import (
+    DomainWhitelist,
+    compile_whitelist,
+    extract_host,
+    registrable_domain,
+)
+
+
+@pytest.mark.parametrize(
+    ("url", "host"),
+    [
+        ("https://www.Salesforce.com/products?x=1", "www.salesforce.com"),
+        ("salesforce.com/page", "salesforce.com"),
+        ("https://user:pw@help.salesforce.com:8443/a", "help.salesforce.com"),
+        ("http://[2001:db8::1]/path", "2001:db8::1"),
+        ("https://example.com./", "example.com"),
+        ("https://bücher.de/", "xn--bcher-kva.de"),
+        ("", ""),
+    ],
+)
+def test_extract_host(url: str, host: str) -> None:
+    assert extract_host(url) == host
+
+
+@pytest.mark.parametrize(
+    ("host", "domain"),
+    [
+        ("help.salesforce.com", "salesforce.com"),
+        ("news.bbc.co.uk", "bbc.co.uk"),
+        ("salesforce.com", "salesforce.com"),
+        ("localhost", "localhost"),
+        ("10.0.0.1", "10.0.0.1"),
+    ],
+)
+def test_registrable_domain(host: str, domain: str) -> None:
+    assert registrable_domain(host) == domain
+
+
+def test_domain_entry_trusts_itself_and_subdomains_only() -> None:
+    whitelist = DomainWhitelist.build(["https://www.salesforce.com/"])
+
+    assert whitelist.contains_url("https://salesforce.com/crm")
+    assert whitelist.contains_url("https://help.salesforce.com/")
+    assert not whitelist.contains_url("https://notsalesforce.com/")
+    assert not whitelist.contains_url("https://salesforce.com.evil.io/")
+    assert not whitelist.contains_url("https://salesforce.co.uk/")
+
+
+def test_suffix_entries_trust_whole_zones() -> None:
+    whitelist = DomainWhitelist.build([".edu", "*.gov.uk"])
+
+    assert whitelist.domains == frozenset({"edu", "gov.uk"})
+    assert whitelist.labels == frozenset()
+    assert whitelist.contains_host("mit.edu")
+    assert whitelist.contains_host("www.ons.gov.uk")
+    assert not whitelist.contains_host("gov.uk.example.com")
+
+
+def test_bare_label_trusts_registrable_domains_with_that_name() -> None:
+    whitelist = DomainWhitelist.build(["Salesforce"])
+
+    assert whitelist.labels == frozenset({"salesforce"})
+    assert whitelist.contains_host("salesforce.com")
+    assert whitelist.contains_host("help.salesforce.com")
+    assert whitelist.contains_host("salesforce.co.uk")
+    assert not whitelist.contains_host("notsalesforce.com")
+    assert not whitelist.contains_host("salesforce.com.evil.io")
+    assert not whitelist.contains_host("salesforce-login.com")
+
+
+def test_ip_entries_match_exactly() -> None:
+    whitelist = DomainWhitelist.build(["10.0.0.1"])
+
+    assert whitelist.contains_host("10.0.0.1")
+    assert not whitelist.contains_host("10.0.0.2")
+    assert not whitelist.contains_host("")
+
+
+def test_compile_whitelist_is_shared_per_entry_set() -> None:
+    first = compile_whitelist(["b.com", "a.com"])
+
+    assert compile_whitelist(["a.com", "b.com", "a.com"]) is first
+    assert first.contains_host("www.a.com")
@@ -0,0 +1,61 @@
+"""
+Tests for the shared, loop-bound HTTP client pools.
+"""
+
+import asyncio
+import logging
+import threading
+
+import httpx
+import pytest
+
+from backend.app.core.http import close_http_clients, get_http_client
+
+
+async def test_clients_are_shared_per_endpoint_and_credentials() -> None:
+    first = get_http_client("https://api.test", 30.0, {"Authorization": "a"})
+    try:
+        assert get_http_client("https://api.test", 30.0, {"Authorization": "a"}) is first
+        assert get_http_client("https://api.test", 30.0, {"Authorization": "b"}) is not first
+    finally:
+        await close_http_clients()
+
+    assert first.is_closed
+
+
+def test_clients_of_a_finished_loop_are_reported(caplog: pytest.LogCaptureFixture) -> None:
+    async def client() -> httpx.AsyncClient:
+        return get_http_client("https://api.test", 30.0, {})
+
+    stale = asyncio.run(client())
+    with caplog.at_level(logging.WARNING):
+        fresh = asyncio.run(client())
+
+    assert fresh is not stale
+    assert "unclosed HTTP client" in caplog.text
+    assert "https://api.test" in caplog.text
+    asyncio.run(close_http_clients())
+
+
+def test_clients_of_a_running_loop_are_closed_on_it() -> None:
+    other = asyncio.new_event_loop()
+    thread = threading.Thread(target=other.run_forever, daemon=True)
+    thread.start()
+
+    async def client() -> httpx.AsyncClient:
+        return get_http_client("https://api.test", 30.0, {})
+
+    try:
+        stale = asyncio.run_coroutine_threadsafe(client(), other).result(timeout=5)
+        fresh = asyncio.run(client())
+        # The close was scheduled on the other loop; let it run
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0.05), other).result(timeout=5)
+
+        assert fresh is not stale
+        assert stale.is_closed
+        assert not fresh.is_closed
+    finally:
+        asyncio.run(close_http_clients())
+        other.call_soon_threadsafe(other.stop)
+        thread.join(timeout=5)
+        other.close()
@@ -0,0 +1,70 @@
+"""
+Tests for markdown normalization, segmentation and the offset map.
+"""
+
+from backend.app.builders.normalization import normalize_response, normalize_responses
+
+RAW = (
+    "# Top CRMs\n\n"
+    "1. **Salesforce** is the [leader](https://sf.com) [1]\n"
+    "2. *HubSpot*  is great.\n\n"
+    "---\n"
+    "Pipedrive (e.g. monday.com) works."
+)
+
+
+def test_markdown_and_citation_markers_are_removed() -> None:
+    response = normalize_response(RAW)
+
+    assert response.text == (
+        "Top CRMs\n\nSalesforce is the leader\nHubSpot is great.\n\n"
+        "Pipedrive (e.g. monday.com) works."
+    )
+    assert response.folded == response.text.casefold()
+
+
+def test_offset_map_leads_back_to_the_original() -> None:
+    response = normalize_response(RAW)
+
+    for brand in ("Salesforce", "HubSpot", "leader", "Pipedrive", "monday.com"):
+        position = response.text.index(brand)
+        start = response.original_offset(position)
+        assert RAW[start : start + len(brand)] == brand
+    assert response.original_offset(len(response.text)) == len(RAW)
+    assert len(response.offsets) == len(response.text) + 1
+
+
+def test_list_items_sentences_and_emphasis() -> None:
+    response = normalize_response(RAW)
+    text = response.text
+
+    items = [text[s:e] for s, e in zip(response.item_starts, response.item_ends, strict=True)]
+    sentences = [text[s:e] for s, e in response.sentences]
+    emphasis = [text[s:e] for s, e in response.emphasis]
+
+    assert items == ["Salesforce is the leader\n", "HubSpot is great."]
+    assert sentences == [
+        "Top CRMs",
+        "Salesforce is the leader",
+        "HubSpot is great.",
+        "Pipedrive (e.g.",
+        "monday.com) works.",
+    ]
+    assert emphasis == ["Salesforce"]
+
+
+def test_plain_text_passes_through() -> None:
+    response = normalize_response("Salesforce leads. HubSpot follows!")
+
+    assert response.text == response.original
+    assert response.sentences == [(0, 17), (18, 34)]
+    assert response.item_starts == []
+
+
+def test_normalized_responses_are_not_normalized_again() -> None:
+    normalized = normalize_response(RAW)
+
+    (same, fresh) = normalize_responses([normalized, "Plain"])
+
+    assert same is normalized
+    assert fresh.text == "Plain"
@@ -0,0 +1,34 @@
+"""
+Tests for carrying run-level metrics over a re-analysis.
+"""
+
+from backend.app.worker import _reanalysis_metrics
+
+
+def test_reanalysis_keeps_cost_and_runtime() -> None:
+    previous = {
+        "total_responses": 10,
+        "cost": {"total_cost_usd": 0.12},
+        "runtime": {
+            "latency_percentiles_ms": {"p50": 800.0, "p95": 1900.0},
+            "status_counts": {"success": 9, "timeout": 1},
+            "throughput": 2.5,
+        },
+        "rollup": {"prompt_hash": "abc", "day": "2026-10-19"},
+    }
+    raw_metrics = {"total_responses": 9, "target_visibility": {"brand": "Acme"}}
+
+    metrics = _reanalysis_metrics(previous, raw_metrics)
+
+    assert metrics["total_responses"] == 9
+    assert metrics["target_visibility"] == {"brand": "Acme"}
+    assert metrics["cost"] == previous["cost"]
+    assert metrics["runtime"] == previous["runtime"]
+    assert "rollup" not in metrics
+    assert "cost" not in raw_metrics
+
+
+def test_reanalysis_of_runs_without_run_level_metrics() -> None:
+    metrics = _reanalysis_metrics({}, {"total_responses": 3})
+
+    assert metrics == {"total_responses": 3}
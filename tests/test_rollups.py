@@ -0,0 +1,164 @@
+"""
+Tests for daily visibility rollup contributions and upserts.
+"""
+
+from contextlib import asynccontextmanager
+from datetime import date
+from typing import Any
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+
+from backend.app.builders.rollups import prompt_hash, rollup_contributions
+from backend.app.repositories.rollup_repo import VisibilityRollupRepository
+from backend.app.worker import _apply_rollup
+
+
+class RecordingSession:
+    """Async session stub that records executed statements."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.statements: list[Any] = []
+        self.error = error
+        self.savepoints = 0
+
+    async def execute(self, stmt: Any) -> None:
+        if self.error is not None:
+            raise self.error
+        self.statements.append(stmt)
+
+    @asynccontextmanager
+    async def begin_nested(self) -> Any:
+        self.savepoints += 1
+        yield
+
+
+def _metrics(brands: list[str]) -> dict[str, Any]:
+    visibility = [{"brand": brand, "mention_count": 3, "visibility_rate": 0.5} for brand in brands]
+    return {
+        "total_responses": 4,
+        "target_visibility": visibility[0],
+        "competitor_visibility": visibility[1:],
+        "rankings": [{"brand": brand, "rank_distribution": [1, 1]} for brand in brands],
+        "consistency": {"consistency_score": 0.8},
+        "rollup": {"prompt_hash": prompt_hash("Best CRM?"), "day": "2026-10-19"},
+    }
+
+
+def _rows(session: RecordingSession) -> list[dict[str, Any]]:
+    """Rows inserted by the session's single upsert."""
+    (stmt,) = session.statements
+    params = stmt.compile(dialect=postgresql.dialect()).params
+    count = sum(1 for key in params if key.startswith("brand_m"))
+    return [
+        {key.rsplit("_m", 1)[0]: value for key, value in params.items() if key.endswith(f"_m{i}")}
+        for i in range(count)
+    ]
+
+
+def test_prompt_hash_ignores_whitespace_and_case() -> None:
+    assert prompt_hash("Best  CRM\nfor startups") == prompt_hash("best crm for Startups")
+    assert prompt_hash("Best CRM") != prompt_hash("Best ERP")
+
+
+def test_contributions_count_each_brand_once() -> None:
+    contributions = rollup_contributions(_metrics(["Acme", "Globex", "Acme"]))
+
+    assert [c.brand for c in contributions] == ["Acme", "Globex"]
+    acme = contributions[0]
+    assert acme.runs == 1
+    assert acme.responses == 4
+    assert acme.mentioned_responses == 2
+    assert acme.rank_sum == 3
+    assert acme.top1_responses == 1
+    assert acme.total_brand_mentions == 6
+    assert acme.consistency_sum == 0.8
+
+
+def test_contributions_empty_without_responses() -> None:
+    assert rollup_contributions(None) == []
+    assert rollup_contributions({"total_responses": 0}) == []
+
+
+async def test_apply_upserts_one_row_per_brand() -> None:
+    session = RecordingSession()
+    contributions = rollup_contributions(_metrics(["Acme", "Globex"]))
+
+    await VisibilityRollupRepository(session).apply(  # type: ignore[arg-type]
+        "hash",
+        provider="openai",
+        model="gpt-4o",
+        day=date(2026, 10, 19),
+        contributions=contributions,
+    )
+
+    rows = _rows(session)
+    assert [row["brand"] for row in rows] == ["Acme", "Globex"]
+    assert all(row["runs"] == 1 for row in rows)
+
+
+async def test_apply_merges_retraction_and_contribution_of_a_brand() -> None:
+    session = RecordingSession()
+    previous = rollup_contributions(_metrics(["Acme"]))
+    revised = rollup_contributions(_metrics(["Acme"]))
+    revised[0].mention_count = 5
+
+    await VisibilityRollupRepository(session).apply(  # type: ignore[arg-type]
+        "hash",
+        provider="openai",
+        model="gpt-4o",
+        day=date(2026, 10, 19),
+        contributions=[*(c.negated() for c in previous), *revised],
+    )
+
+    (row,) = _rows(session)
+    assert row["runs"] == 0
+    assert row["responses"] == 0
+    assert row["mention_count"] == 2
+
+
+async def test_apply_skips_empty_contributions() -> None:
+    session = RecordingSession()
+
+    await VisibilityRollupRepository(session).apply(  # type: ignore[arg-type]
+        "hash", provider="openai", model="gpt-4o", day=date(2026, 10, 19), contributions=[]
+    )
+
+    assert session.statements == []
+
+
+def test_negated_contribution_cancels_out() -> None:
+    (contribution,) = rollup_contributions(_metrics(["Acme"]))
+    negated = contribution.negated()
+
+    assert negated.brand == "Acme"
+    assert negated.runs == -1
+    assert negated.consistency_sum == -contribution.consistency_sum
+
+
+async def test_apply_rollup_failure_keeps_batch() -> None:
+    session = RecordingSession(error=IntegrityError("INSERT", {}, Exception("conflict")))
+
+    applied = await _apply_rollup(
+        VisibilityRollupRepository(session),  # type: ignore[arg-type]
+        _metrics(["Acme"]),
+        provider="openai",
+        model="gpt-4o",
+    )
+
+    assert applied is False
+    assert session.savepoints == 1
+
+
+async def test_apply_rollup_success() -> None:
+    session = RecordingSession()
+
+    applied = await _apply_rollup(
+        VisibilityRollupRepository(session),  # type: ignore[arg-type]
+        _metrics(["Acme", "Globex", "Acme"]),
+        provider="openai",
+        model="gpt-4o",
+    )
+
+    assert applied is True
+    assert [row["brand"] for row in _rows(session)] == ["Acme", "Globex"]
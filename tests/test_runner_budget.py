@@ -0,0 +1,184 @@
+"""
+Tests for batch cost ceilings and shared token-rate limiting.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from time import monotonic
+from typing import Any
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from backend.app.builders import runner as runner_module
+from backend.app.builders.estimator import PreflightEstimate
+from backend.app.builders.rate_limiter import (
+    RedisTokenRateLimiter,
+    TokenRateLimiter,
+    get_rate_limiter,
+    rate_limit_key,
+)
+from backend.app.builders.runner import RunnerBuilder
+from backend.app.core.config import Settings
+from backend.app.schemas.llm import LLMProvider
+from backend.app.schemas.runner import BatchConfig
+from tests.conftest import FakeProvider
+
+
+def _preflight(cost_per_iteration_usd: float, iterations: int) -> PreflightEstimate:
+    return PreflightEstimate(
+        provider=LLMProvider.OPENAI,
+        model="gpt-4o-mini",
+        iterations=iterations,
+        prompt_tokens=20,
+        completion_tokens=50,
+        completion_source="test",
+        cost_per_iteration_usd=cost_per_iteration_usd,
+        estimated_cost_usd=cost_per_iteration_usd * iterations,
+        tokens_per_minute=1_000_000,
+        recommended_concurrency=iterations,
+    )
+
+
+@pytest.fixture
+def runner(monkeypatch: pytest.MonkeyPatch, fake_provider: FakeProvider) -> RunnerBuilder:
+    monkeypatch.setattr(runner_module, "get_provider", lambda **_: fake_provider)
+    return RunnerBuilder(settings=Settings())
+
+
+async def test_iterations_beyond_the_ceiling_are_budget_exceeded(
+    runner: RunnerBuilder, fake_provider: FakeProvider
+) -> None:
+    batch = await runner.run_batch(
+        prompt="Best CRM for startups?",
+        provider=LLMProvider.OPENAI,
+        config=BatchConfig(iterations=5, max_concurrency=5, max_cost_usd=2.5),
+        preflight=_preflight(cost_per_iteration_usd=1.0, iterations=5),
+    )
+
+    # Two reservations fit under the ceiling while all five start at once
+    assert batch.status_counts["success"] == 2
+    assert batch.status_counts["budget_exceeded"] == 3
+    assert len(fake_provider.requests) == 2
+    assert 0 < batch.total_cost_usd < 2.5
+
+
+async def test_ceiling_below_one_iteration_makes_no_calls(
+    runner: RunnerBuilder, fake_provider: FakeProvider
+) -> None:
+    batch = await runner.run_batch(
+        prompt="Best CRM for startups?",
+        provider=LLMProvider.OPENAI,
+        config=BatchConfig(iterations=3, max_cost_usd=0.5),
+        preflight=_preflight(cost_per_iteration_usd=1.0, iterations=3),
+    )
+
+    assert batch.status_counts["budget_exceeded"] == 3
+    assert batch.successful_iterations == 0
+    assert batch.total_cost_usd == 0.0
+    assert fake_provider.requests == []
+
+
+async def test_released_reservations_admit_later_iterations(
+    runner: RunnerBuilder, fake_provider: FakeProvider
+) -> None:
+    # One at a time: each reservation is released before the next starts
+    batch = await runner.run_batch(
+        prompt="Best CRM for startups?",
+        provider=LLMProvider.OPENAI,
+        config=BatchConfig(iterations=4, max_concurrency=1, max_cost_usd=1.5),
+        preflight=_preflight(cost_per_iteration_usd=1.0, iterations=4),
+    )
+
+    assert batch.successful_iterations == 4
+    assert len(fake_provider.requests) == 4
+
+
+async def test_batches_on_one_builder_keep_separate_budgets(
+    runner: RunnerBuilder,
+) -> None:
+    batches = await asyncio.gather(
+        *(
+            runner.run_batch(
+                prompt="Best CRM for startups?",
+                provider=LLMProvider.OPENAI,
+                config=BatchConfig(iterations=3, max_concurrency=3, max_cost_usd=1.5),
+                preflight=_preflight(cost_per_iteration_usd=1.0, iterations=3),
+            )
+            for _ in range(2)
+        )
+    )
+
+    assert [b.successful_iterations for b in batches] == [1, 1]
+
+
+async def test_token_bucket_waits_for_refill() -> None:
+    limiter = TokenRateLimiter(tokens_per_minute=6000)
+
+    start = monotonic()
+    await limiter.acquire(6000)
+    await limiter.acquire(10)
+
+    assert 0.05 < monotonic() - start < 1.0
+
+
+async def test_oversized_requests_are_clamped_to_the_bucket() -> None:
+    limiter = TokenRateLimiter(tokens_per_minute=6000)
+
+    start = monotonic()
+    await limiter.acquire(60_000)
+
+    assert monotonic() - start < 0.05
+
+
+async def test_limiters_are_shared_per_provider_key() -> None:
+    key = rate_limit_key("openai", "sk-one")
+
+    shared = get_rate_limiter(key, 1000)
+
+    assert get_rate_limiter(key, 1000) is shared
+    assert get_rate_limiter(rate_limit_key("openai", "sk-two"), 1000) is not shared
+    assert get_rate_limiter(key, 2000) is not shared
+    assert "sk-one" not in key
+
+
+class FakeRedis:
+    """Redis stub whose registered script returns or raises a fixed outcome."""
+
+    def __init__(self, outcome: str | Exception) -> None:
+        self.outcome = outcome
+        self.calls: list[dict[str, Any]] = []
+
+    def register_script(self, script: str) -> Callable[..., Awaitable[str]]:  # noqa: ARG002
+        async def run(keys: list[str], args: list[Any]) -> str:
+            self.calls.append({"keys": keys, "args": args})
+            if isinstance(self.outcome, Exception):
+                raise self.outcome
+            return self.outcome
+
+        return run
+
+
+async def test_redis_limiter_waits_for_the_reported_debt() -> None:
+    redis = FakeRedis("0.1")
+    limiter = RedisTokenRateLimiter(redis, "openai:abc", 6000)  # type: ignore[arg-type]
+
+    start = monotonic()
+    await limiter.acquire(60_000)
+
+    assert monotonic() - start >= 0.1
+    assert redis.calls == [{"keys": ["rate_limit:openai:abc"], "args": [6000, 100.0, 6000]}]
+
+
+async def test_redis_limiter_falls_back_to_the_local_bucket() -> None:
+    fallback = TokenRateLimiter(6000)
+    limiter = RedisTokenRateLimiter(
+        FakeRedis(RedisConnectionError("down")),  # type: ignore[arg-type]
+        "openai:abc",
+        6000,
+        fallback=fallback,
+    )
+
+    await limiter.acquire(1000)
+
+    assert fallback._available == pytest.approx(5000, abs=5)
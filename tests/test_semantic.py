@@ -0,0 +1,59 @@
+"""
+Tests for hashed n-gram TF-IDF vectors and cosine similarity.
+"""
+
+import numpy as np
+import pytest
+
+from backend.app.builders.semantic import cosine_matrix, paired_cosine, tfidf_vectors
+
+RESPONSES = [
+    "Salesforce is the best CRM",
+    "salesforce IS the best crm!",
+    "Pipedrive for small teams",
+    "",
+]
+
+
+def test_vectors_are_unit_norm_except_for_empty_responses() -> None:
+    vectors = tfidf_vectors(RESPONSES)
+
+    norms = np.sqrt(np.asarray(vectors.multiply(vectors).sum(axis=1)).ravel())
+    assert norms.tolist() == pytest.approx([1.0, 1.0, 1.0, 0.0])
+
+
+def test_cosine_ignores_case_and_punctuation() -> None:
+    similarity = cosine_matrix(tfidf_vectors(RESPONSES))
+
+    assert similarity.shape == (4, 4)
+    assert similarity[0, 1] == pytest.approx(100.0)
+    assert similarity[0, 2] == pytest.approx(0.0)
+    assert similarity[3].tolist() == [0.0, 0.0, 0.0, 0.0]
+    assert np.allclose(similarity, similarity.T)
+
+
+def test_reordering_keeps_unigrams_but_not_bigrams() -> None:
+    similarity = cosine_matrix(
+        tfidf_vectors(["Salesforce then HubSpot", "HubSpot then Salesforce", "Pipedrive"])
+    )
+
+    assert 0.0 < similarity[0, 1] < 100.0
+
+
+def test_paired_cosine_matches_the_full_matrix() -> None:
+    vectors = tfidf_vectors(RESPONSES)
+    first = np.array([0, 0, 1, 2], dtype=np.int64)
+    second = np.array([1, 2, 3, 2], dtype=np.int64)
+
+    paired = paired_cosine(vectors, first, second)
+
+    assert paired.tolist() == pytest.approx(cosine_matrix(vectors)[first, second].tolist())
+
+
+def test_cluster_weights_count_as_repeated_documents() -> None:
+    texts = ["Salesforce leads the market", "HubSpot leads the market"]
+
+    weighted = tfidf_vectors(texts, weights=np.array([3, 1], dtype=np.int64))
+    repeated = tfidf_vectors([texts[0]] * 3 + [texts[1]])
+
+    assert cosine_matrix(weighted)[0, 1] == pytest.approx(cosine_matrix(repeated)[0, 3])
@@ -0,0 +1,107 @@
+"""
+Tests for binomial confidence intervals and the vectorized bootstrap.
+"""
+
+import numpy as np
+import pytest
+
+from backend.app.builders.statistics import (
+    bootstrap_brand_metrics,
+    bootstrap_mean,
+    bootstrap_pairwise_mean,
+    bootstrap_weights,
+    clopper_pearson_interval,
+    percentile_interval,
+    wilson_interval,
+)
+
+
+def _draws(n: int, resamples: int, seed: int) -> np.ndarray:
+    """The response indices drawn by bootstrap_weights for one block."""
+    return np.random.default_rng(seed).integers(0, n, size=(resamples, n), dtype=np.int64)
+
+
+def test_wilson_interval() -> None:
+    lower, upper = wilson_interval(5, 10, 0.95)
+    assert (float(lower), float(upper)) == pytest.approx((0.2366, 0.7634), abs=1e-4)
+
+    lower, upper = wilson_interval([0, 10], 10, 0.95)
+    assert lower.tolist() == pytest.approx([0.0, 0.7225], abs=1e-4)
+    assert upper.tolist() == pytest.approx([0.2775, 1.0], abs=1e-4)
+
+
+def test_clopper_pearson_interval() -> None:
+    lower, upper = clopper_pearson_interval([0, 5, 10], 10, 0.95)
+
+    assert lower.tolist() == pytest.approx([0.0, 0.1871, 0.6915], abs=1e-4)
+    assert upper.tolist() == pytest.approx([0.3085, 0.8129, 1.0], abs=1e-4)
+
+
+def test_intervals_without_trials_are_uninformative() -> None:
+    for interval in (wilson_interval, clopper_pearson_interval):
+        lower, upper = interval([0, 0], 0, 0.95)
+        assert lower.tolist() == [0.0, 0.0]
+        assert upper.tolist() == [1.0, 1.0]
+
+
+def test_bootstrap_weights_count_draws_per_resample() -> None:
+    blocks = list(bootstrap_weights(7, 2500, np.random.default_rng(3), block_size=1000))
+
+    assert [block.shape for block in blocks] == [(1000, 7), (1000, 7), (500, 7)]
+    assert all((block.sum(axis=1) == 7).all() for block in blocks)
+
+    (weights,) = bootstrap_weights(7, 20, np.random.default_rng(3))
+    expected = np.stack([np.bincount(row, minlength=7) for row in _draws(7, 20, 3)])
+    assert weights.tolist() == expected.tolist()
+
+
+def test_bootstrap_brand_metrics_match_explicit_resamples() -> None:
+    counts = np.array([[2, 0], [1, 1], [0, 3], [1, 0]], dtype=np.int64)
+    ranks = np.array([[1, 0], [1, 2], [0, 1], [1, 0]], dtype=np.int64)
+
+    shares, mean_ranks = bootstrap_brand_metrics(counts, ranks, 50, np.random.default_rng(5))
+
+    for row, draw in enumerate(_draws(4, 50, 5)):
+        mentions = counts[draw].sum(axis=0)
+        assert shares[row] == pytest.approx(mentions / mentions.sum(), rel=1e-5)
+        for brand in range(2):
+            brand_ranks = ranks[draw, brand]
+            brand_ranks = brand_ranks[brand_ranks > 0]
+            if brand_ranks.size:
+                assert mean_ranks[row, brand] == pytest.approx(brand_ranks.mean(), rel=1e-5)
+            else:
+                assert np.isnan(mean_ranks[row, brand])
+
+
+def test_bootstrap_pairwise_mean_matches_explicit_resamples() -> None:
+    similarity = np.array([[100.0, 80.0, 20.0], [80.0, 100.0, 50.0], [20.0, 50.0, 100.0]])
+
+    estimates = bootstrap_pairwise_mean(similarity, 30, np.random.default_rng(7))
+
+    for row, draw in enumerate(_draws(3, 30, 7)):
+        # Pairs of draws of the same response carry no comparison
+        distinct = draw[:, None] != draw[None, :]
+        if distinct.any():
+            expected = similarity[np.ix_(draw, draw)][distinct].mean()
+            assert estimates[row] == pytest.approx(expected, rel=1e-5)
+        else:
+            assert np.isnan(estimates[row])
+
+
+def test_bootstrap_mean_matches_explicit_resamples() -> None:
+    values = np.array([0.2, 0.9, 0.4, 0.7])
+
+    estimates = bootstrap_mean(values, 25, np.random.default_rng(11))
+
+    expected = [values[draw].mean() for draw in _draws(4, 25, 11)]
+    assert estimates.tolist() == pytest.approx(expected, rel=1e-5)
+
+
+def test_percentile_interval_ignores_undefined_resamples() -> None:
+    estimates = np.array([[1.0, np.nan], [2.0, np.nan], [3.0, np.nan], [np.nan, np.nan]])
+
+    lower, upper = percentile_interval(estimates, 0.5)
+
+    assert lower[0] == pytest.approx(1.5)
+    assert upper[0] == pytest.approx(2.5)
+    assert np.isnan(lower[1]) and np.isnan(upper[1])